@@ -321,6 +321,11 @@ async function executeOperation(operation: string, node: OutlineNode): Promise<v
         throw new Error(`Unknown operation: ${operation}`);
     }
 
+    if (result.success && result.unchanged) {
+      // No-op (e.g. promoting a top-level heading): nothing to apply
+      return;
+    }
+
     if (result.success) {
       // Apply changes to document
       const edit = new vscode.WorkspaceEdit();
@@ -591,6 +591,11 @@ export class DocumentOutlineProvider
         result = await this.pythonBridge.nest(documentText, source.id, target.id);
       }
 
+      if (result.success && result.unchanged) {
+        // No-op (e.g. unnesting a top-level heading): nothing to apply
+        return;
+      }
+
       if (result.success) {
         // Apply changes to document
         const edit = new vscode.WorkspaceEdit();
@@ -80,9 +80,9 @@ export interface ModifiedRange {
   start_line: number;
   /** Starting column number (0-indexed) */
   start_column: number;
-  /** Ending line number (0-indexed) */
+  /** Ending line number (0-indexed, exclusive: whole-line ranges end at the next line) */
   end_line: number;
-  /** Ending column number (0-indexed) */
+  /** Ending column number (0-indexed; 0 for whole-line ranges) */
   end_column: number;
   /** The new text to replace the range with */
   new_text: string;
@@ -100,6 +100,8 @@ export interface OperationResult {
   modifiedRanges?: ModifiedRange[];
   /** Error message (if failed) */
   error?: string;
+  /** True if the operation succeeded without changing the document (no edit needed) */
+  unchanged?: boolean;
 }
 
 /**
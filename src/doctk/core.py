@@ -4,13 +4,17 @@ Core abstractions for doctk.
 Implements the fundamental Document and Node classes following category theory principles.
 """
 
+import copy
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
+# identity only imports core lazily, so importing NodeId here creates no cycle
+from doctk.identity import NodeId
+
 if TYPE_CHECKING:
-    from doctk.identity import NodeId, Provenance, SourceSpan, ViewSourceMapping
+    from doctk.identity import Provenance, SourceSpan, ViewSourceMapping
 
 T = TypeVar("T")
 U = TypeVar("U")
@@ -68,10 +72,6 @@ class Heading(Node):
         regenerate_id: bool = False,
     ) -> "Heading":
         """Create a new Heading with updated attributes."""
-        import copy
-
-        from doctk.identity import NodeId
-
         new_heading = Heading(
             level=level if level is not None else self.level,
             text=text if text is not None else self.text,
@@ -153,10 +153,6 @@ class Paragraph(Node):
         regenerate_id: bool = False,
     ) -> "Paragraph":
         """Create a new Paragraph with updated attributes."""
-        import copy
-
-        from doctk.identity import NodeId
-
         new_paragraph = Paragraph(
             content=content if content is not None else self.content,
             metadata=copy.deepcopy(metadata)
@@ -227,10 +223,6 @@ class List(Node):
         regenerate_id: bool = False,
     ) -> "List":
         """Create a new List with updated attributes."""
-        import copy
-
-        from doctk.identity import NodeId
-
         new_list = List(
             ordered=ordered if ordered is not None else self.ordered,
             items=items if items is not None else self.items,
@@ -301,10 +293,6 @@ class ListItem(Node):
         regenerate_id: bool = False,
     ) -> "ListItem":
         """Create a new ListItem with updated attributes."""
-        import copy
-
-        from doctk.identity import NodeId
-
         new_list_item = ListItem(
             content=content if content is not None else self.content,
             metadata=copy.deepcopy(metadata)
@@ -375,10 +363,6 @@ class CodeBlock(Node):
         regenerate_id: bool = False,
     ) -> "CodeBlock":
         """Create a new CodeBlock with updated attributes."""
-        import copy
-
-        from doctk.identity import NodeId
-
         new_code_block = CodeBlock(
             code=code if code is not None else self.code,
             language=language if language is not None else self.language,
@@ -461,10 +445,6 @@ class BlockQuote(Node):
         regenerate_id: bool = False,
     ) -> "BlockQuote":
         """Create a new BlockQuote with updated attributes."""
-        import copy
-
-        from doctk.identity import NodeId
-
         new_blockquote = BlockQuote(
             content=content if content is not None else self.content,
             metadata=copy.deepcopy(metadata)
@@ -547,30 +527,99 @@ class Document(Generic[T]):
         for node in self.nodes:
             self._index_node_recursive(node)
 
-    def _index_node_recursive(self, node: Any) -> None:
+    def _index_node_recursive(self, node: Any, remove: bool = False) -> None:
         """
         Recursively index a node and all its children.
 
         Args:
             node: Node to index (along with all descendants)
+            remove: If True, drop the node and its descendants from the index instead
         """
         # Index this node if it has an ID
         if hasattr(node, "id") and node.id is not None:
-            self._id_index[node.id] = node
+            if not remove:
+                self._id_index[node.id] = node
+            elif self._id_index.get(node.id) is node:
+                del self._id_index[node.id]
 
         # Recursively index children based on node type
         if hasattr(node, "children") and node.children:
             # Heading nodes have children
             for child in node.children:
-                self._index_node_recursive(child)
+                self._index_node_recursive(child, remove)
         elif hasattr(node, "items") and node.items:
             # List nodes have items
             for item in node.items:
-                self._index_node_recursive(item)
+                self._index_node_recursive(item, remove)
         elif hasattr(node, "content") and isinstance(node.content, list):
             # ListItem and BlockQuote nodes have content lists
             for child in node.content:
-                self._index_node_recursive(child)
+                self._index_node_recursive(child, remove)
+
+    def set(self, index: int, node: T) -> "Document[T]":
+        """
+        Return a new Document with the top-level node at index replaced.
+
+        Args:
+            index: Index of the node to replace
+            node: Replacement node
+
+        Returns:
+            New Document; this document is unchanged
+
+        Examples:
+            >>> promoted = doc.set(2, doc.nodes[2].promote())
+        """
+        # One list copy and an item store; slicing around index would build two
+        # temporary lists first
+        nodes = self.nodes.copy()
+        old = nodes[index]
+        nodes[index] = node
+
+        result = self._derive(nodes)
+        result._index_node_recursive(old, remove=True)
+        result._index_node_recursive(node)
+        return result
+
+    def splice(self, start: int, stop: int, items: list[T]) -> "Document[T]":
+        """
+        Return a new Document with nodes[start:stop] replaced by items.
+
+        Only the removed and inserted subtrees are (un)indexed; the rest of the ID
+        index is copied from this document rather than rebuilt by walking the
+        whole tree.
+
+        Args:
+            start: Index of the first node to replace
+            stop: Index after the last node to replace
+            items: Nodes to insert in their place
+
+        Returns:
+            New Document; this document is unchanged
+
+        Examples:
+            >>> swapped = doc.splice(0, 2, [doc.nodes[1], doc.nodes[0]])
+        """
+        # One list copy plus an in-place slice store (a C-level memmove); unpacking
+        # the slices around the span would build two temporary lists first
+        nodes = self.nodes.copy()
+        nodes[start:stop] = items
+
+        result = self._derive(nodes)
+        for node in self.nodes[start:stop]:
+            result._index_node_recursive(node, remove=True)
+        for node in items:
+            result._index_node_recursive(node)
+
+        return result
+
+    def _derive(self, nodes: list[T]) -> "Document[T]":
+        """Return a Document over nodes that starts from a copy of this ID index."""
+        result: Document[T] = Document.__new__(type(self))
+        result.nodes = nodes
+        result._id_index = self._id_index.copy()
+        result._view_mappings = []
+        return result
 
     def find_node(self, node_id: "NodeId") -> T | None:
         """
@@ -169,6 +169,9 @@ class Executor:
         result = self.operations.promote(doc, node_id_str)
         if not result.success:
             raise ExecutionError(f"promote failed: {result.error}")
+        # A no-op keeps the input document instead of re-parsing its serialization
+        if result.unchanged:
+            return doc
         if result.document is None:
             raise ExecutionError("promote returned no document")
         # Parse once and return - this is the only place we parse
@@ -180,6 +183,8 @@ class Executor:
         result = self.operations.demote(doc, node_id_str)
         if not result.success:
             raise ExecutionError(f"demote failed: {result.error}")
+        if result.unchanged:
+            return doc
         if result.document is None:
             raise ExecutionError("demote returned no document")
         return Document.from_string(result.document)
@@ -190,6 +195,8 @@ class Executor:
         result = self.operations.move_up(doc, node_id_str)
         if not result.success:
             raise ExecutionError(f"move_up failed: {result.error}")
+        if result.unchanged:
+            return doc
         if result.document is None:
             raise ExecutionError("move_up returned no document")
         return Document.from_string(result.document)
@@ -200,6 +207,8 @@ class Executor:
         result = self.operations.move_down(doc, node_id_str)
         if not result.success:
             raise ExecutionError(f"move_down failed: {result.error}")
+        if result.unchanged:
+            return doc
         if result.document is None:
             raise ExecutionError("move_down returned no document")
         return Document.from_string(result.document)
@@ -211,6 +220,8 @@ class Executor:
         result = self.operations.nest(doc, node_id_str, parent_id_str)
         if not result.success:
             raise ExecutionError(f"nest failed: {result.error}")
+        if result.unchanged:
+            return doc
         if result.document is None:
             raise ExecutionError("nest returned no document")
         return Document.from_string(result.document)
@@ -221,6 +232,8 @@ class Executor:
         result = self.operations.unnest(doc, node_id_str)
         if not result.success:
             raise ExecutionError(f"unnest failed: {result.error}")
+        if result.unchanged:
+            return doc
         if result.document is None:
             raise ExecutionError("unnest returned no document")
         return Document.from_string(result.document)
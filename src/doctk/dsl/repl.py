@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING, Any
 from rich.console import Console
 from rich.table import Table
 
-from doctk.core import Document, Heading
+from doctk.core import Document
 from doctk.integration.operations import DocumentTreeBuilder, StructureOperations
 
 if TYPE_CHECKING:
@@ -110,7 +110,7 @@ class REPL:
         try:
             self.document = Document.from_file(str(path))
             self.document_path = path
-            self.tree_builder = DocumentTreeBuilder(self.document)
+            self.tree_builder = DocumentTreeBuilder.for_document(self.document)
 
             console.print(f"[green]✓ Loaded {path.name}[/green]")
             console.print(f"  {len(self.document.nodes)} nodes")
@@ -178,9 +178,8 @@ class REPL:
         table.add_column("Content", style="white")
 
         for node_id, node in self.tree_builder.node_map.items():
-            if isinstance(node, Heading):
-                content = f"{'#' * node.level} {node.text}"
-                table.add_row(node_id, "Heading", content)
+            content = f"{'#' * node.level} {node.text}"
+            table.add_row(node_id, "Heading", content)
 
         console.print(table)
 
@@ -253,7 +252,7 @@ class REPL:
             # The performance impact is acceptable for interactive REPL use.
             if result.document:
                 self.document = Document.from_string(result.document)
-                self.tree_builder = DocumentTreeBuilder(self.document)
+                self.tree_builder = DocumentTreeBuilder.for_document(self.document)
 
                 console.print(f"[green]✓ {operation} completed[/green]")
 
@@ -8,10 +8,16 @@ import time
 import traceback
 from typing import Any
 
-from doctk.core import Document
+from doctk.core import Document, Node
 from doctk.integration.operations import DocumentTreeBuilder, StructureOperations
 from doctk.integration.protocols import OperationResult, TreeNode
 
+# Responses go over a line-delimited pipe and are never read by humans, so
+# skip the padding json.dumps puts after separators. Responses carrying a whole
+# document are mostly string content, but operation results with many modified
+# ranges shrink noticeably.
+_encode_response = json.JSONEncoder(separators=(",", ":")).encode
+
 
 class ExtensionBridge:
     """
@@ -24,6 +30,10 @@ class ExtensionBridge:
     def __init__(self) -> None:
         """Initialize the extension bridge."""
         self.operations = StructureOperations()
+        # Most recently parsed document text and its Document. The extension
+        # validates on every cursor move and then runs the operation on the same
+        # text, so reusing the parse also reuses its memoized tree builder.
+        self._last_parsed: tuple[str, Document[Node]] | None = None
 
     def handle_request(self, request: dict[str, Any]) -> dict[str, Any]:
         """
@@ -83,6 +93,26 @@ class ExtensionBridge:
 
         return document_text, node_id
 
+    def _parse_document(self, document_text: str) -> Document[Node]:
+        """
+        Parse document text, reusing the previous parse when the text is unchanged.
+
+        Operations never mutate a Document in place, so sharing one between
+        requests is safe.
+
+        Args:
+            document_text: Markdown source of the document
+
+        Returns:
+            The parsed Document
+        """
+        last = self._last_parsed
+        if last is not None and last[0] == document_text:
+            return last[1]
+        doc = Document.from_string(document_text)
+        self._last_parsed = (document_text, doc)
+        return doc
+
     def _execute_method(self, method: str, params: dict[str, Any]) -> Any:
         """
         Execute a method with the given parameters.
@@ -126,7 +156,7 @@ class ExtensionBridge:
         """Handle promote operation."""
         document_text, node_id = self._extract_document_and_node_id(params)
 
-        doc = Document.from_string(document_text)
+        doc = self._parse_document(document_text)
         result = self.operations.promote(doc, node_id)
 
         return self._operation_result_to_dict(result)
@@ -135,7 +165,7 @@ class ExtensionBridge:
         """Handle demote operation."""
         document_text, node_id = self._extract_document_and_node_id(params)
 
-        doc = Document.from_string(document_text)
+        doc = self._parse_document(document_text)
         result = self.operations.demote(doc, node_id)
 
         return self._operation_result_to_dict(result)
@@ -144,7 +174,7 @@ class ExtensionBridge:
         """Handle move_up operation."""
         document_text, node_id = self._extract_document_and_node_id(params)
 
-        doc = Document.from_string(document_text)
+        doc = self._parse_document(document_text)
         result = self.operations.move_up(doc, node_id)
 
         return self._operation_result_to_dict(result)
@@ -153,7 +183,7 @@ class ExtensionBridge:
         """Handle move_down operation."""
         document_text, node_id = self._extract_document_and_node_id(params)
 
-        doc = Document.from_string(document_text)
+        doc = self._parse_document(document_text)
         result = self.operations.move_down(doc, node_id)
 
         return self._operation_result_to_dict(result)
@@ -167,7 +197,7 @@ class ExtensionBridge:
         if not document_text or not node_id or not parent_id:
             raise ValueError("Missing required parameters: document, node_id, parent_id")
 
-        doc = Document.from_string(document_text)
+        doc = self._parse_document(document_text)
         result = self.operations.nest(doc, node_id, parent_id)
 
         return self._operation_result_to_dict(result)
@@ -176,7 +206,7 @@ class ExtensionBridge:
         """Handle unnest operation."""
         document_text, node_id = self._extract_document_and_node_id(params)
 
-        doc = Document.from_string(document_text)
+        doc = self._parse_document(document_text)
         result = self.operations.unnest(doc, node_id)
 
         return self._operation_result_to_dict(result)
@@ -185,7 +215,7 @@ class ExtensionBridge:
         """Handle validate_promote operation."""
         document_text, node_id = self._extract_document_and_node_id(params)
 
-        doc = Document.from_string(document_text)
+        doc = self._parse_document(document_text)
         result = self.operations.validate_promote(doc, node_id)
 
         return {"valid": result.valid, "error": result.error}
@@ -194,7 +224,7 @@ class ExtensionBridge:
         """Handle validate_demote operation."""
         document_text, node_id = self._extract_document_and_node_id(params)
 
-        doc = Document.from_string(document_text)
+        doc = self._parse_document(document_text)
         result = self.operations.validate_demote(doc, node_id)
 
         return {"valid": result.valid, "error": result.error}
@@ -203,7 +233,7 @@ class ExtensionBridge:
         """Handle validate_move_up operation."""
         document_text, node_id = self._extract_document_and_node_id(params)
 
-        doc = Document.from_string(document_text)
+        doc = self._parse_document(document_text)
         result = self.operations.validate_move_up(doc, node_id)
 
         return {"valid": result.valid, "error": result.error}
@@ -212,7 +242,7 @@ class ExtensionBridge:
         """Handle validate_move_down operation."""
         document_text, node_id = self._extract_document_and_node_id(params)
 
-        doc = Document.from_string(document_text)
+        doc = self._parse_document(document_text)
         result = self.operations.validate_move_down(doc, node_id)
 
         return {"valid": result.valid, "error": result.error}
@@ -226,7 +256,7 @@ class ExtensionBridge:
         if not document_text or not node_id or not parent_id:
             raise ValueError("Missing required parameters: document, node_id, parent_id")
 
-        doc = Document.from_string(document_text)
+        doc = self._parse_document(document_text)
         result = self.operations.validate_nest(doc, node_id, parent_id)
 
         return {"valid": result.valid, "error": result.error}
@@ -235,7 +265,7 @@ class ExtensionBridge:
         """Handle validate_unnest operation."""
         document_text, node_id = self._extract_document_and_node_id(params)
 
-        doc = Document.from_string(document_text)
+        doc = self._parse_document(document_text)
         result = self.operations.validate_unnest(doc, node_id)
 
         return {"valid": result.valid, "error": result.error}
@@ -244,7 +274,7 @@ class ExtensionBridge:
         """Handle delete operation."""
         document_text, node_id = self._extract_document_and_node_id(params)
 
-        doc = Document.from_string(document_text)
+        doc = self._parse_document(document_text)
         result = self.operations.delete(doc, node_id)
 
         return self._operation_result_to_dict(result)
@@ -253,7 +283,7 @@ class ExtensionBridge:
         """Handle validate_delete operation."""
         document_text, node_id = self._extract_document_and_node_id(params)
 
-        doc = Document.from_string(document_text)
+        doc = self._parse_document(document_text)
         result = self.operations.validate_delete(doc, node_id)
 
         return {"valid": result.valid, "error": result.error}
@@ -269,7 +299,7 @@ class ExtensionBridge:
 
         document_text = params["document"]
 
-        doc = Document.from_string(document_text)
+        doc = self._parse_document(document_text)
         # Pass the original source text to ensure accurate line positioning
         tree_builder = DocumentTreeBuilder(doc, source_text=document_text)
         tree = tree_builder.build_tree_with_ids()
@@ -327,6 +357,8 @@ class ExtensionBridge:
             "document": result.document,
             "modified_ranges": modified_ranges,
             "error": result.error,
+            # Lets the extension skip applying an edit for no-op operations
+            "unchanged": result.unchanged,
         }
 
     def _success_response(self, request_id: Any, result: Any) -> dict[str, Any]:
@@ -373,15 +405,26 @@ class ExtensionBridge:
             try:
                 request = json.loads(line.strip())
                 response = self.handle_request(request)
-                print(json.dumps(response), flush=True)
+                self._write_response(response)
             except json.JSONDecodeError as e:
                 # Send parse error response
                 error_response = self._error_response(None, -32700, f"Parse error: {str(e)}")
-                print(json.dumps(error_response), flush=True)
+                self._write_response(error_response)
             except Exception as e:
                 # Send internal error response
                 error_response = self._error_response(None, -32603, f"Internal error: {str(e)}")
-                print(json.dumps(error_response), flush=True)
+                self._write_response(error_response)
+
+    @staticmethod
+    def _write_response(response: dict[str, Any]) -> None:
+        """
+        Write a JSON-RPC response to stdout as a single line.
+
+        Args:
+            response: JSON-RPC response dictionary
+        """
+        sys.stdout.write(_encode_response(response) + "\n")
+        sys.stdout.flush()
 
 
 def main() -> None:
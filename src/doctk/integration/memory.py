@@ -5,15 +5,31 @@ for document states, memory monitoring, and eviction strategies to ensure
 the system stays within memory limits.
 """
 
+import logging
 import sys
 from collections import OrderedDict
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any, Generic, TypeVar
 
 from doctk.core import Document, Node
 
+logger = logging.getLogger(__name__)
+
 T = TypeVar("T")
 
+# Documents estimated above this fraction of the memory limit are admitted
+# without memory enforcement, since evicting other documents cannot make room
+_OVERSIZED_DOCUMENT_RATIO = 0.5
+
+# Largest fraction of the cache evicted between two memory measurements
+_MAX_EVICTION_BATCH_RATIO = 0.25
+
+# Instance attributes that hold caches derived from the object itself, such as
+# the tree builder memoized on a Document by doctk.integration.operations.
+# They are not counted towards a document's estimated size.
+_DERIVED_CACHE_ATTRS = frozenset({"_doctk_tree_builder"})
+
 
 @dataclass
 class DocumentState:
@@ -33,16 +49,19 @@ class LRUCache(Generic[T]):
     when the cache reaches capacity.
     """
 
-    def __init__(self, maxsize: int = 100):
+    def __init__(self, maxsize: int = 100, on_evict: Callable[[str, T], None] | None = None):
         """
         Initialize LRU cache.
 
         Args:
             maxsize: Maximum number of items to cache (default: 100)
+            on_evict: Optional callback invoked with (key, value) for each
+                size-based eviction
         """
         self.maxsize = maxsize
         self.cache: OrderedDict[str, T] = OrderedDict()
         self.size_evictions = 0  # Track size-based evictions
+        self.on_evict = on_evict
 
     def get(self, key: str) -> T | None:
         """
@@ -54,12 +73,14 @@ class LRUCache(Generic[T]):
         Returns:
             Cached value if found, None otherwise
         """
-        if key not in self.cache:
+        try:
+            value = self.cache[key]
+        except KeyError:
             return None
 
         # Move to end (mark as recently used)
         self.cache.move_to_end(key)
-        return self.cache[key]
+        return value
 
     def put(self, key: str, value: T) -> None:
         """
@@ -69,15 +90,16 @@ class LRUCache(Generic[T]):
             key: Cache key
             value: Value to cache
         """
-        if key in self.cache:
-            # Update existing item and mark as recently used
-            self.cache.move_to_end(key)
-        elif len(self.cache) >= self.maxsize:
+        # Insert or update, then mark as recently used
+        self.cache[key] = value
+        self.cache.move_to_end(key)
+
+        if len(self.cache) > self.maxsize:
             # Evict least recently used item due to size limit
-            self.cache.popitem(last=False)
+            evicted_key, evicted_value = self.cache.popitem(last=False)
             self.size_evictions += 1
-
-        self.cache[key] = value
+            if self.on_evict is not None:
+                self.on_evict(evicted_key, evicted_value)
 
     def remove(self, key: str) -> None:
         """
@@ -101,6 +123,15 @@ class LRUCache(Generic[T]):
         """Check if a key is in the cache."""
         return key in self.cache
 
+    def items(self) -> list[tuple[str, T]]:
+        """
+        Get a snapshot of the cached items without marking them as used.
+
+        Returns:
+            List of (key, value) pairs, least recently used first
+        """
+        return list(self.cache.items())
+
     def popitem(self, last: bool = True) -> tuple[str, T]:
         """
         Remove and return an item from the cache.
@@ -139,11 +170,25 @@ class DocumentStateManager:
             max_memory_mb: Maximum memory usage in MB (default: 500)
             enable_memory_monitoring: Enable memory usage monitoring (default: True)
         """
-        self.cache = LRUCache[DocumentState](maxsize=max_cache_size)
+        self.cache = LRUCache[DocumentState](maxsize=max_cache_size, on_evict=self._forget_size)
         self.max_memory_mb = max_memory_mb
         self.max_memory_bytes = max_memory_mb * 1024 * 1024
         self.enable_memory_monitoring = enable_memory_monitoring
         self._memory_evictions = 0  # Track memory-based evictions
+        # Estimated size of cached entries, maintained incrementally so the
+        # fallback memory estimate is O(1) instead of a walk over the cache.
+        # With psutil, sizes are only computed when an entry is checked or
+        # evicted under memory pressure.
+        self._entry_sizes: dict[str, int] = {}
+        self._total_bytes = 0
+        # Reuse one psutil handle for RSS reads; None means use the estimate
+        self._process: Any = None
+        try:
+            import psutil
+
+            self._process = psutil.Process()
+        except ImportError:
+            pass
 
     def get_document(self, uri: str) -> DocumentState | None:
         """
@@ -172,11 +217,36 @@ class DocumentStateManager:
             metadata: Optional metadata about the document
         """
         state = DocumentState(uri=uri, document=document, metadata=metadata or {}, access_count=0)
+
+        # Account for the new entry (replacing any previous size for this URI)
+        # before insertion, so a size-based eviction subtracts the right entry.
+        # Without psutil the running total is the only memory reading, so it
+        # needs the size now; with psutil it is only computed if memory is over
+        # the limit.
+        self._forget_size(uri)
+        if self._process is None:
+            self._entry_size(uri, state)
+
         self.cache.put(uri, state)
 
+        if not self.enable_memory_monitoring:
+            return
+
+        if self.get_memory_usage_mb() <= self.max_memory_mb:
+            return
+
+        size = self._entry_size(uri, state)
+        if size > self.max_memory_bytes * _OVERSIZED_DOCUMENT_RATIO:
+            # Purging the cache would not bring a document this large under the
+            # limit, so admit it and leave bounding to the LRU size cap
+            logger.warning(
+                f"Document {uri} is estimated at {size / (1024 * 1024):.1f}MB, over half "
+                f"of the {self.max_memory_mb}MB limit; skipping memory enforcement"
+            )
+            return
+
         # Enforce memory limit after insertion to ensure we don't exceed threshold
-        if self.enable_memory_monitoring:
-            self._enforce_memory_limit()
+        self._enforce_memory_limit()
 
     def remove_document(self, uri: str) -> None:
         """
@@ -186,10 +256,13 @@ class DocumentStateManager:
             uri: Document URI
         """
         self.cache.remove(uri)
+        self._forget_size(uri)
 
     def clear(self) -> None:
         """Clear all cached documents."""
         self.cache.clear()
+        self._entry_sizes.clear()
+        self._total_bytes = 0
 
     def get_cache_size(self) -> int:
         """Get the number of cached documents."""
@@ -202,27 +275,64 @@ class DocumentStateManager:
         Returns:
             Current process memory usage in megabytes
         """
-        try:
-            import psutil
+        if self._process is not None:
+            return float(self._process.memory_info().rss / (1024 * 1024))
 
-            process = psutil.Process()
-            return float(process.memory_info().rss / (1024 * 1024))
-        except ImportError:
-            # psutil not available, estimate based on sys.getsizeof
-            return self._estimate_memory_usage()
+        # psutil not available, estimate based on sys.getsizeof
+        return self._estimate_memory_usage()
 
     def _estimate_memory_usage(self) -> float:
         """
-        Estimate memory usage based on cached objects using recursive size calculation.
+        Estimate memory usage of cached documents.
+
+        Uses the running total of per-entry sizes recorded on insertion.
 
         Returns:
             Estimated memory usage in MB
         """
-        total_bytes = 0
-        for key, state in self.cache.cache.items():
-            total_bytes += self._get_recursive_size(key)
-            total_bytes += self._get_recursive_size(state)
-        return total_bytes / (1024 * 1024)
+        return self._total_bytes / (1024 * 1024)
+
+    def _estimate_state_size(self, uri: str, state: DocumentState) -> int:
+        """
+        Estimate the size of a cache entry using recursive size calculation.
+
+        Args:
+            uri: Document URI (cache key)
+            state: Document state (cache value)
+
+        Returns:
+            Estimated size in bytes
+        """
+        return self._get_recursive_size(uri) + self._get_recursive_size(state)
+
+    def _entry_size(self, uri: str, state: DocumentState) -> int:
+        """
+        Get the estimated size of a cache entry, computing and recording it on first use.
+
+        Args:
+            uri: Document URI (cache key)
+            state: Document state (cache value)
+
+        Returns:
+            Estimated size in bytes
+        """
+        size = self._entry_sizes.get(uri)
+        if size is None:
+            size = self._estimate_state_size(uri, state)
+            self._entry_sizes[uri] = size
+            self._total_bytes += size
+        return size
+
+    def _forget_size(self, uri: str, state: DocumentState | None = None) -> None:
+        """
+        Drop the tracked size of a cache entry that is being removed.
+
+        Args:
+            uri: Document URI (cache key)
+            state: Removed document state (unused; accepted for use as an
+                eviction callback)
+        """
+        self._total_bytes -= self._entry_sizes.pop(uri, 0)
 
     def _get_recursive_size(self, obj: Any) -> int:
         """
@@ -250,7 +360,12 @@ class DocumentStateManager:
             elif isinstance(item, (list, tuple, set)):
                 item_size += sum(_recurse(elem) for elem in item)
             elif hasattr(item, "__dict__"):
-                item_size += _recurse(item.__dict__)
+                attrs = item.__dict__
+                item_size += sys.getsizeof(attrs) + sum(
+                    _recurse(name) + _recurse(value)
+                    for name, value in attrs.items()
+                    if name not in _DERIVED_CACHE_ATTRS
+                )
 
             return item_size
 
@@ -261,7 +376,9 @@ class DocumentStateManager:
         Enforce memory limit by evicting least recently used documents.
 
         This is called automatically after adding new documents to the cache.
-        Uses batch eviction strategy to avoid O(N*M) complexity.
+        Uses batch eviction strategy to avoid O(N*M) complexity: within a batch,
+        the tracked size of each evicted entry is subtracted from the last
+        reading, and memory is only re-measured once per batch.
         """
         if not self.enable_memory_monitoring:
             return
@@ -270,18 +387,27 @@ class DocumentStateManager:
         if memory_mb <= self.max_memory_mb:
             return
 
-        # Batch eviction: remove 10% of cache or until under limit
-        # This reduces the number of expensive memory checks
+        # Batch eviction sized to the overshoot (up to 25% of the cache per
+        # batch), which reduces the number of expensive memory checks
         evictions_this_round = 0
-        batch_size = max(1, len(self.cache) // 10)
+        if self.max_memory_mb > 0:
+            overshoot = memory_mb / self.max_memory_mb - 1.0
+        else:
+            overshoot = _MAX_EVICTION_BATCH_RATIO
+        batch_ratio = min(_MAX_EVICTION_BATCH_RATIO, overshoot)
+        batch_size = max(1, int(len(self.cache) * batch_ratio))
 
         while memory_mb > self.max_memory_mb and len(self.cache) > 0:
             # Evict a batch of least recently used documents
             for _ in range(min(batch_size, len(self.cache))):
                 if len(self.cache) == 0:
                     break
-                self.cache.popitem(last=False)
+                uri, state = self.cache.popitem(last=False)
+                memory_mb -= self._entry_size(uri, state) / (1024 * 1024)
+                self._forget_size(uri)
                 evictions_this_round += 1
+                if memory_mb <= self.max_memory_mb:
+                    break
 
             # Check memory only after batch eviction
             memory_mb = self.get_memory_usage_mb()
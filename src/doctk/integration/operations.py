@@ -2,14 +2,145 @@
 
 from __future__ import annotations
 
-from doctk.core import Document, Heading, Node
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Callable
+from difflib import SequenceMatcher
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from doctk.core import Document, Heading, ListItem, Node, Paragraph
 from doctk.integration.protocols import ModifiedRange, OperationResult, TreeNode, ValidationResult
+from doctk.writers.markdown import MarkdownWriter
+
+# Attribute under which a Document's memoized tree builder is stored. The builder
+# lives on the Document itself (rather than in a module-level weak mapping, whose
+# values would pin their keys through builder.document) so it is released together
+# with the Document.
+_TREE_BUILDER_ATTR = "_doctk_tree_builder"
+
+# Shared successful validation (ValidationResult is frozen)
+_VALID = ValidationResult(valid=True)
+
+# Heading ID strings by level, then ordinal. IDs are positional, so the same
+# strings recur in every document; builders share them instead of formatting new
+# ones. Entries are only ever added with their one possible value, so concurrent
+# builders cannot disagree.
+_heading_ids: dict[int, dict[int, str]] = {}
+
+# Content index of a modified document used by DiffComputer._find_matching_node:
+# (headings by text, paragraphs by content, other nodes by type, id(node) -> str(node))
+_MatchIndex = tuple[dict[str, Node], dict[str, Node], defaultdict[type, list[Node]], dict[int, str]]
+
+# Outcome of a successful StructureOperations edit before serialization: the new
+# Document (the input Document itself for a no-op) and a callable computing the
+# granular ranges against the input Document
+_Edit = tuple[Document[Node], Callable[[], list[ModifiedRange]]]
+
+# Serialized text (and its line split) per Document. A single operation may
+# serialize the same Document several times; the cached values hold no reference
+# back to their Document, so entries disappear with it.
+_text_cache: WeakKeyDictionary[Document[Node], str] = WeakKeyDictionary()
+_lines_cache: WeakKeyDictionary[Document[Node], list[str]] = WeakKeyDictionary()
+
+
+def _doc_text(document: Document[Node], derived_from: Document[Node] | None = None) -> str:
+    """
+    Return document.to_string(), computed once per Document.
+
+    Args:
+        document: The document to serialize
+        derived_from: Optional document this one was built from. Nodes already
+                      rendered by its tree builder (or by document's own) are reused,
+                      so only new nodes are rendered.
+
+    Returns:
+        The serialized document
+    """
+    text = _text_cache.get(document)
+    if text is None:
+        builder = (derived_from or document).__dict__.get(_TREE_BUILDER_ATTR)
+        if builder is None:
+            text = document.to_string()
+        else:
+            text = builder.render_document(document)
+        _text_cache[document] = text
+    return text
+
+
+def _doc_lines(document: Document[Node]) -> list[str]:
+    """Return the document text split with keepends=True (shared; do not mutate)."""
+    lines = _lines_cache.get(document)
+    if lines is None:
+        lines = _doc_text(document).splitlines(keepends=True)
+        _lines_cache[document] = lines
+    return lines
+
+
+def _find_heading(document: Document[Node], node_id: str) -> Heading | None:
+    """
+    Find a heading by its DocumentTreeBuilder ID without building a node map.
+
+    Uses the document's tree builder if one was already built. Otherwise headings
+    of the ID's level are counted from the start of the document (the numbering
+    DocumentTreeBuilder assigns) and the scan stops at the match, so a single
+    lookup such as a validation costs O(position) rather than O(document).
+
+    Args:
+        document: The document to search
+        node_id: A heading ID such as "h2-0"
+
+    Returns:
+        The heading if found, None otherwise
+    """
+    builder = document.__dict__.get(_TREE_BUILDER_ATTR)
+    if builder is not None:
+        return builder.find_node(node_id)
+
+    level_text, _, ordinal_text = node_id[1:].partition("-")
+    if not (node_id[:1] == "h" and level_text.isdecimal() and ordinal_text.isdecimal()):
+        return None
+    level, remaining = int(level_text), int(ordinal_text)
+    if node_id != f"h{level}-{remaining}":
+        return None  # Non-canonical spelling (e.g. "h2-00") that the builder never assigns
+
+    for node in document.nodes:
+        if isinstance(node, Heading) and node.level == level:
+            if remaining == 0:
+                return node
+            remaining -= 1
+    return None
+
+
+def _with_level(heading: Heading, level: int) -> Heading:
+    """
+    Return a shallow copy of a heading at another level.
+
+    Level is not part of the canonical form, so the NodeId, provenance and source
+    span carry over unchanged. Equivalent to dataclasses.replace(heading, level=level)
+    without its per-call field introspection.
+    """
+    return heading.__class__(
+        level=level,
+        text=heading.text,
+        children=heading.children,
+        metadata=heading.metadata,
+        id=heading.id,
+        provenance=heading.provenance,
+        source_span=heading.source_span,
+    )
 
 
 class DocumentTreeBuilder:
     """Builds a tree representation of a document with node IDs."""
 
-    def __init__(self, document: Document[Node], source_text: str | None = None):
+    def __init__(
+        self,
+        document: Document[Node],
+        source_text: str | None = None,
+        *,
+        base: DocumentTreeBuilder | None = None,
+    ):
         """
         Initialize the tree builder.
 
@@ -19,26 +150,101 @@ class DocumentTreeBuilder:
                         for line positioning instead of reconstructing from the document.
                         This is important because document reconstruction may add extra
                         blank lines that don't exist in the original source.
+            base: Optional builder of a document this one was derived from (e.g. the
+                  original document of an operation). Nodes shared with it are not
+                  rendered again; their line metrics are reused.
+
+        Line positions are computed on first use unless a base is given, so a
+        builder used only to look up nodes and sections never renders the document.
         """
         self.document = document
         self.source_text = source_text
-        self.node_map: dict[str, Node] = {}
+        self._base = base
+        self.node_map: dict[str, Heading] = {}  # Only headings get IDs
         self.parent_map: dict[str, str] = {}
+        self.index_map: dict[str, int] = {}  # node_id -> node_index
+        self.id_by_index: dict[int, str] = {}  # node_index -> node_id (headings only)
         self._line_position_cache: dict[int, int] = {}  # Cache: node_index -> line_number
         self._line_count_cache: dict[int, int] = {}  # Cache: node_index -> line_count
+        # Lazy: id(node) -> node_index, only needed for node-object lookups
+        self._index_by_identity: dict[int, int] | None = None
+        # Lazy: node_id -> (section start, section end), inclusive
+        self._section_ranges: dict[str, tuple[int, int]] | None = None
+        # Lazy, built with _section_ranges: node_id -> index of the nearest earlier
+        # heading at the same or a higher level (absent if there is none)
+        self._previous_peers: dict[str, int] = {}
+        self._heading_indices: list[int] = []  # Node indices of headings, ascending
+        self._heading_levels: list[int] = []  # Levels parallel to _heading_indices
+        self._tree: TreeNode | None = None  # Lazy: result of build_tree_with_ids()
+        # Cache: id(node) -> (leading blank lines, line count, rendered line count, text)
+        self._render_metrics: dict[int, tuple[int, int, int, str]] = {}
+        self._line_table_built = False
         self._build_node_map()
-        self._build_line_position_cache()
+        if base is not None:
+            # Build now so the base need not be kept alive until first use
+            self._ensure_line_table()
+        self._base = None  # Only needed while building; don't keep the base alive
+
+    @classmethod
+    def for_document(
+        cls, document: Document[Node], base: DocumentTreeBuilder | None = None
+    ) -> DocumentTreeBuilder:
+        """
+        Get a tree builder for a document, reusing the one built earlier if any.
+
+        Operations never mutate a Document in place (they build new ones), so a
+        builder stays valid for the lifetime of the Document it was built from.
+
+        Args:
+            document: The document to build a tree from
+            base: Optional builder of the document this one was derived from, used
+                  to skip re-rendering shared nodes when a new builder is created
+
+        Returns:
+            The memoized DocumentTreeBuilder for this document
+        """
+        builder = document.__dict__.get(_TREE_BUILDER_ATTR)
+        if builder is None:
+            builder = cls(document, base=base)
+            setattr(document, _TREE_BUILDER_ATTR, builder)
+        return builder
 
     def _build_node_map(self) -> None:
         """Build a map of node IDs to nodes."""
+        # Number of headings seen so far at each level
         heading_counter: dict[int, int] = {}
 
-        for node in self.document.nodes:
+        # Bind the containers and methods used per heading to locals once. Non-heading
+        # nodes cost only the isinstance check; the identity index is built on demand
+        node_map = self.node_map
+        index_map = self.index_map
+        id_by_index = self.id_by_index
+        add_heading_index = self._heading_indices.append
+        add_heading_level = self._heading_levels.append
+        heading_ids = _heading_ids
+
+        for node_index, node in enumerate(self.document.nodes):
             if isinstance(node, Heading):
                 level = node.level
-                heading_counter[level] = heading_counter.get(level, 0) + 1
-                node_id = f"h{level}-{heading_counter[level] - 1}"
-                self.node_map[node_id] = node
+                ordinal = heading_counter.get(level, 0)
+                heading_counter[level] = ordinal + 1
+                level_ids = heading_ids.get(level)
+                if level_ids is None:
+                    level_ids = heading_ids.setdefault(level, {})
+                node_id = level_ids.get(ordinal)
+                if node_id is None:
+                    node_id = level_ids.setdefault(ordinal, f"h{level}-{ordinal}")
+                node_map[node_id] = node
+                index_map[node_id] = node_index
+                id_by_index[node_index] = node_id
+                add_heading_index(node_index)
+                add_heading_level(level)
+
+    def _ensure_line_table(self) -> None:
+        """Build the line position cache if it has not been built yet."""
+        if not self._line_table_built:
+            self._build_line_position_cache()
+            self._line_table_built = True
 
     def _build_line_position_cache(self) -> None:
         """
@@ -47,18 +253,21 @@ class DocumentTreeBuilder:
         This eliminates the O(n²) complexity from repeated line calculations.
         Includes fallback handling for nodes that cannot be matched.
         """
-        # Get document text and split into lines
-        # Use source_text if provided, otherwise reconstruct from document
-        # Using source_text is critical for accurate line positioning because
-        # document reconstruction may add extra blank lines
-        doc_text = self.source_text if self.source_text is not None else self.document.to_string()
-        lines = doc_text.split("\n")
+        if self.source_text is None:
+            self._build_rendered_line_table()
+            return
 
+        # Locate nodes in the original source text. Using source_text is critical
+        # for accurate line positioning because document reconstruction may add
+        # extra blank lines
+        lines = self.source_text.split("\n")
+
+        # Render nodes directly; wrapping each in a Document would also index its tree
+        writer = MarkdownWriter()
         current_line = 0
         for node_index, node in enumerate(self.document.nodes):
             # Get the text for this node
-            temp_doc = Document([node])
-            search_text = temp_doc.to_string().strip()
+            search_text = writer.write_node(node).strip()
             num_node_lines = search_text.count("\n") + 1
 
             # Cache line count to avoid repeated Document creation
@@ -90,6 +299,77 @@ class DocumentTreeBuilder:
                 self._line_position_cache[node_index] = current_line
                 current_line += num_node_lines
 
+    def _build_rendered_line_table(self) -> None:
+        """
+        Compute line positions and counts by rendering each node once.
+
+        The document text is the newline-joined output of rendering each node in
+        turn, so a node starts where the previous node's output ended and no
+        searching of the full text is needed.
+        """
+        base_metrics: dict[int, tuple[int, int, int, str]] = {}
+        if self._base is not None:
+            self._base._ensure_line_table()
+            base_metrics = self._base._render_metrics
+        render_metrics = self._render_metrics
+        line_positions = self._line_position_cache
+        line_counts = self._line_count_cache
+        write_node = MarkdownWriter().write_node
+
+        current_line = 0
+        for node_index, node in enumerate(self.document.nodes):
+            metrics = base_metrics.get(id(node))
+            if metrics is None:
+                rendered = write_node(node)
+                metrics = (
+                    rendered[: len(rendered) - len(rendered.lstrip())].count("\n"),
+                    rendered.strip().count("\n") + 1,
+                    rendered.count("\n") + 1,
+                    rendered,
+                )
+            render_metrics[id(node)] = metrics
+            leading_lines, line_count, rendered_lines, _ = metrics
+
+            line_positions[node_index] = current_line + leading_lines
+            line_counts[node_index] = line_count
+
+            # Skip past this node, including the blank line the writer appends
+            current_line += rendered_lines
+
+    def render_document(self, document: Document[Node]) -> str:
+        """
+        Serialize a document, reusing the text of nodes this builder has rendered.
+
+        Joining the per-node renderings with newlines gives the same text as
+        document.to_string(), so a document derived from this builder's document
+        only pays for rendering its new nodes.
+
+        Args:
+            document: The document to serialize (typically derived from this one)
+
+        Returns:
+            The serialized document
+        """
+        self._ensure_line_table()
+        # Bound once: this loop runs over every node of every operation's result
+        get_metrics = self._render_metrics.get
+        writer: MarkdownWriter | None = None
+        parts: list[str] = []
+        add_part = parts.append
+        for node in document.nodes:
+            if isinstance(node, ListItem):
+                # A top-level ListItem renders differently on its own than after
+                # its predecessor, so such documents are serialized in one pass
+                return document.to_string()
+            metrics = get_metrics(id(node))
+            if metrics is not None:
+                add_part(metrics[3])
+            else:
+                if writer is None:
+                    writer = MarkdownWriter()
+                add_part(writer.write_node(node))
+        return "\n".join(parts)
+
     def build_tree_with_ids(self) -> TreeNode:
         """
         Build complete tree structure with IDs assigned.
@@ -97,9 +377,16 @@ class DocumentTreeBuilder:
         This creates a hierarchical tree structure where each heading node
         has an ID assigned by the backend (single source of truth).
 
+        The tree is built on first call and reused afterwards, since the document
+        does not change; callers must not mutate the returned nodes. Operations
+        and validators never need it and only use the node map.
+
         Returns:
             TreeNode representing the document root with all children
         """
+        if self._tree is not None:
+            return self._tree
+
         # Create a virtual root node
         root = TreeNode(
             id="root",
@@ -114,41 +401,41 @@ class DocumentTreeBuilder:
         # level 0 is the root, level 1-6 are heading levels
         level_stack: list[TreeNode] = [root]
 
-        # Counter for generating node IDs
-        heading_counter: dict[int, int] = {}
-
-        # Build the tree by iterating through all nodes
-        for node_index, node in enumerate(self.document.nodes):
-            if isinstance(node, Heading):
-                level = node.level
-                heading_counter[level] = heading_counter.get(level, 0) + 1
-                node_id = f"h{level}-{heading_counter[level] - 1}"
-
-                # Get line number from cache (O(1) lookup instead of O(n) calculation)
-                node_line = self._line_position_cache.get(node_index, 0)
-
-                # Create TreeNode for this heading
-                tree_node = TreeNode(
-                    id=node_id,
-                    label=node.text,
-                    level=level,
-                    line=node_line,
-                    column=0,
-                    children=[],
-                )
+        self._ensure_line_table()
+
+        # Visit headings in document order using the IDs assigned by the node map,
+        # so non-heading nodes are skipped and no ID is computed twice
+        nodes = self.document.nodes
+        for node_index, node_id in self.id_by_index.items():
+            node = nodes[node_index]
+            level = node.level
+
+            # Get line number from cache (O(1) lookup instead of O(n) calculation)
+            node_line = self._line_position_cache.get(node_index, 0)
+
+            # Create TreeNode for this heading
+            tree_node = TreeNode(
+                id=node_id,
+                label=node.text,
+                level=level,
+                line=node_line,
+                column=0,
+                children=[],
+            )
 
-                # Find the appropriate parent
-                # The parent is the last node in the stack with level < current level
-                while len(level_stack) > 1 and level_stack[-1].level >= level:
-                    level_stack.pop()
+            # Find the appropriate parent
+            # The parent is the last node in the stack with level < current level
+            while len(level_stack) > 1 and level_stack[-1].level >= level:
+                level_stack.pop()
 
-                # Add this node to the parent's children
-                parent = level_stack[-1]
-                parent.children.append(tree_node)
+            # Add this node to the parent's children
+            parent = level_stack[-1]
+            parent.children.append(tree_node)
 
-                # Push this node onto the stack
-                level_stack.append(tree_node)
+            # Push this node onto the stack
+            level_stack.append(tree_node)
 
+        self._tree = root
         return root
 
     def get_node_line_position(self, node_index: int) -> int | None:
@@ -161,6 +448,7 @@ class DocumentTreeBuilder:
         Returns:
             Line number (0-indexed) or None if not found
         """
+        self._ensure_line_table()
         return self._line_position_cache.get(node_index)
 
     def get_node_line_count(self, node_index: int) -> int | None:
@@ -173,12 +461,36 @@ class DocumentTreeBuilder:
         Returns:
             Number of lines the node occupies, or None if not found
         """
+        self._ensure_line_table()
         return self._line_count_cache.get(node_index)
 
-    def find_node(self, node_id: str) -> Node | None:
+    def get_node_block_start(self, node_index: int) -> int | None:
+        """
+        Get the line where a node's rendered block starts, including leading blank lines.
+
+        Unlike get_node_line_position (the node's first non-blank line), this is
+        where the previous node's block ends, so it can bound a span of nodes.
+
+        Args:
+            node_index: Index of the node in the document
+
+        Returns:
+            Line number (0-indexed), or None if unknown (e.g. positions from source text)
+        """
+        self._ensure_line_table()
+        line = self._line_position_cache.get(node_index)
+        metrics = self._render_metrics.get(id(self.document.nodes[node_index]))
+        if line is None or metrics is None:
+            return None
+        return line - metrics[0]
+
+    def find_node(self, node_id: str) -> Heading | None:
         """
         Find a node by its ID.
 
+        Only headings are assigned IDs, so a found node is always a Heading and
+        callers need no type check.
+
         Args:
             node_id: The ID of the node to find
 
@@ -187,6 +499,31 @@ class DocumentTreeBuilder:
         """
         return self.node_map.get(node_id)
 
+    def get_node_id(self, node: Node) -> str | None:
+        """
+        Get the ID assigned to a node (reverse of find_node).
+
+        Args:
+            node: A node of this builder's document
+
+        Returns:
+            The node ID, or None if the node has no ID in this document
+        """
+        node_index = self._identity_index().get(id(node))
+        return self.id_by_index.get(node_index) if node_index is not None else None
+
+    def _identity_index(self) -> dict[int, int]:
+        """Map id(node) to node index for every top-level node, built on first use."""
+        index = self._index_by_identity
+        if index is None:
+            index = {}
+            remember_index = index.setdefault
+            for node_index, node in enumerate(self.document.nodes):
+                # Keep the first position if the same node object appears twice
+                remember_index(id(node), node_index)
+            self._index_by_identity = index
+        return index
+
     def get_node_index(self, node_id: str) -> int | None:
         """
         Get the index of a node in the document.
@@ -197,15 +534,76 @@ class DocumentTreeBuilder:
         Returns:
             The index of the node, or None if not found
         """
-        node = self.find_node(node_id)
+        return self.index_map.get(node_id)
+
+    def resolve(self, node_id: str) -> tuple[Heading, int] | None:
+        """
+        Find a node and its index in the document with a single lookup.
+
+        Args:
+            node_id: The ID of the node to find
+
+        Returns:
+            Tuple of (node, index), or None if not found
+        """
+        node = self.node_map.get(node_id)
         if node is None:
             return None
+        return node, self.index_map[node_id]
+
+    def line_range(self, node: Node) -> tuple[int, int] | None:
+        """
+        Get the line range a node occupies in the document (O(1) lookup).
 
-        try:
-            return self.document.nodes.index(node)
-        except ValueError:
+        Args:
+            node: A node of this builder's document
+
+        Returns:
+            Tuple of (start_line, end_line) inclusive, or None if not found
+        """
+        node_index = self._identity_index().get(id(node))
+        if node_index is None:
+            return None
+
+        self._ensure_line_table()
+        start_line = self._line_position_cache.get(node_index)
+        if start_line is None:
             return None
 
+        return (start_line, start_line + self._line_count_cache[node_index] - 1)
+
+    def find_previous_heading(self, before_index: int, max_level: int) -> int | None:
+        """
+        Find the nearest heading before a node index at or above a level.
+
+        Args:
+            before_index: Node index to search backwards from (exclusive)
+            max_level: Highest heading level number to accept
+
+        Returns:
+            Node index of the heading, or None if there is none
+        """
+        pos = bisect_left(self._heading_indices, before_index) - 1
+        while pos >= 0 and self._heading_levels[pos] > max_level:
+            pos -= 1
+        return self._heading_indices[pos] if pos >= 0 else None
+
+    def find_next_heading(self, from_index: int, max_level: int) -> int | None:
+        """
+        Find the nearest heading at or after a node index at or above a level.
+
+        Args:
+            from_index: Node index to search forwards from (inclusive)
+            max_level: Highest heading level number to accept
+
+        Returns:
+            Node index of the heading, or None if there is none
+        """
+        pos = bisect_left(self._heading_indices, from_index)
+        while pos < len(self._heading_indices) and self._heading_levels[pos] > max_level:
+            pos += 1
+        return self._heading_indices[pos] if pos < len(self._heading_indices) else None
+
     def get_section_range(self, node_id: str) -> tuple[int, int] | None:
         """
         Get the range of indices for a complete section.
@@ -219,24 +617,74 @@ class DocumentTreeBuilder:
         Returns:
             Tuple of (start_index, end_index) inclusive, or None if not found
         """
-        node = self.find_node(node_id)
-        if node is None or not isinstance(node, Heading):
-            return None
+        # All sections are computed on first use; later calls (including
+        # repeated ones for the same ID) are a single dict lookup. Only headings
+        # have IDs, so unknown and non-heading IDs are simply absent
+        if self._section_ranges is None:
+            self._section_ranges = self._build_section_ranges()
 
-        start_index = self.get_node_index(node_id)
-        if start_index is None:
-            return None
+        return self._section_ranges.get(node_id)
 
-        # Find the end of this section (next heading of same or lower level)
-        end_index = start_index
-        for i in range(start_index + 1, len(self.document.nodes)):
-            next_node = self.document.nodes[i]
-            if isinstance(next_node, Heading) and next_node.level <= node.level:
-                # Found the start of the next section at the same or higher level
-                break
-            end_index = i
+    def find_previous_peer(self, node_id: str) -> int | None:
+        """
+        Find the nearest heading before a heading at the same or a higher level.
 
-        return (start_index, end_index)
+        Equivalent to find_previous_heading(index, level) for the heading's own
+        index and level, but answered from a table built with the section ranges
+        instead of stepping over the deeper headings in between.
+
+        Args:
+            node_id: The ID of the heading node
+
+        Returns:
+            Node index of that heading, or None if there is none
+        """
+        if self._section_ranges is None:
+            self._section_ranges = self._build_section_ranges()
+
+        return self._previous_peers.get(node_id)
+
+    def _build_section_ranges(self) -> dict[str, tuple[int, int]]:
+        """
+        Compute every heading's section range in a single pass over the headings.
+
+        Open sections are kept on a stack of strictly increasing levels. Each
+        heading closes the open sections at its level or deeper (they end just
+        before it) and opens its own, so every heading is pushed and popped once:
+        O(headings) regardless of how many other nodes sit between them.
+
+        Every earlier heading at a level no deeper than the current one that is
+        not on the stack was closed by a nearer such heading, so the nearest one
+        is the deepest open section at or above the current level. It is recorded
+        in _previous_peers in the same pass.
+
+        Returns:
+            Dict mapping each heading's node ID to (start_index, end_index) inclusive
+        """
+        id_by_index = self.id_by_index
+        section_ranges: dict[str, tuple[int, int]] = {}
+        previous_peers = self._previous_peers
+        # (level, node index) of the sections still open at the current heading
+        open_sections: list[tuple[int, int]] = []
+
+        for index, level in zip(self._heading_indices, self._heading_levels, strict=True):
+            while open_sections and open_sections[-1][0] > level:
+                _, start = open_sections.pop()
+                section_ranges[id_by_index[start]] = (start, index - 1)
+            if open_sections:
+                peer_level, peer = open_sections[-1]
+                previous_peers[id_by_index[index]] = peer
+                if peer_level == level:
+                    open_sections.pop()
+                    section_ranges[id_by_index[peer]] = (peer, index - 1)
+            open_sections.append((level, index))
+
+        # Sections still open run to the end of the document
+        last_index = len(self.document.nodes) - 1
+        for _, start in open_sections:
+            section_ranges[id_by_index[start]] = (start, last_index)
+
+        return section_ranges
 
 
 class DiffComputer:
@@ -257,19 +705,32 @@ class DiffComputer:
             affected_node_ids: List of node IDs that were affected by the operation
 
         Returns:
-            List of ModifiedRange objects representing the changes
+            List of ModifiedRange objects representing the changes. If no affected
+            node can be matched in the modified document, the ranges come from a
+            line-level diff of the two documents instead.
         """
+        # Nothing changed in the text (e.g. a no-op operation); equal cached strings
+        # usually compare by identity or fail fast on length
+        if _doc_text(original_doc) == _doc_text(modified_doc, derived_from=original_doc):
+            return []
+
         # Convert documents to text and split into lines
-        original_text = original_doc.to_string()
-        modified_text = modified_doc.to_string()
-        original_lines = original_text.splitlines(keepends=True)
-        modified_lines = modified_text.splitlines(keepends=True)
+        original_lines = _doc_lines(original_doc)
+        modified_lines = _doc_lines(modified_doc)
+
+        if not affected_node_ids:
+            return DiffComputer._line_diff_ranges(original_lines, modified_lines)
 
         # Build node maps for both documents (created once for performance)
-        original_builder = DocumentTreeBuilder(original_doc)
-        modified_builder = DocumentTreeBuilder(modified_doc)
+        original_builder = DocumentTreeBuilder.for_document(original_doc)
+        modified_builder = DocumentTreeBuilder.for_document(modified_doc, base=original_builder)
+
+        # Index the modified document by content once, so matching each affected
+        # node is a dict lookup instead of a scan of modified_doc.nodes
+        match_index = DiffComputer._build_match_index(modified_doc.nodes)
 
         ranges: list[ModifiedRange] = []
+        matched_any = False
 
         # For each affected node, compute the text range that changed
         for node_id in affected_node_ids:
@@ -281,10 +742,10 @@ class DiffComputer:
             # Find the corresponding node in the modified document
             # Use content-based matching instead of index because operations
             # like move_up, move_down, and nest change node positions
-            modified_node = DiffComputer._find_matching_node(original_node, modified_doc.nodes)
+            modified_node = DiffComputer._find_matching_node(original_node, match_index)
 
             if modified_node is None:
-                # Node was deleted or cannot be matched
+                # Node was deleted or cannot be matched (content changed)
                 original_range = DiffComputer._get_node_line_range(
                     original_doc, original_node, original_builder
                 )
@@ -294,15 +755,15 @@ class DiffComputer:
                         ModifiedRange(
                             start_line=start_line,
                             start_column=0,
-                            end_line=end_line,
-                            end_column=len(original_lines[end_line])
-                            if end_line < len(original_lines)
-                            else 0,
+                            end_line=end_line + 1,
+                            end_column=0,
                             new_text="",
                         )
                     )
                 continue
 
+            matched_any = True
+
             # Get line ranges for the node in both documents
             original_range = DiffComputer._get_node_line_range(
                 original_doc, original_node, original_builder
@@ -324,18 +785,208 @@ class DiffComputer:
                     ModifiedRange(
                         start_line=start_line,
                         start_column=0,
-                        end_line=end_line,
-                        end_column=len(original_lines[end_line])
-                        if end_line < len(original_lines)
-                        else 0,
+                        end_line=end_line + 1,
+                        end_column=0,
                         new_text=new_text,
                     )
                 )
 
+        if not matched_any:
+            # Content matching found nothing to anchor on; fall back to a line diff
+            return DiffComputer._line_diff_ranges(original_lines, modified_lines)
+
         return ranges
 
     @staticmethod
-    def _find_matching_node(original_node: Node, modified_nodes: list[Node]) -> Node | None:
+    def _line_diff_ranges(
+        original_lines: list[str], modified_lines: list[str]
+    ) -> list[ModifiedRange]:
+        """
+        Compute ranges from a line-level diff of two documents.
+
+        Args:
+            original_lines: Lines of the original document (with line endings)
+            modified_lines: Lines of the modified document (with line endings)
+
+        Returns:
+            One ModifiedRange per changed block, in original-document coordinates
+        """
+        # Blank separator lines are common; autojunk would ignore them in long documents
+        matcher = SequenceMatcher(a=original_lines, b=modified_lines, autojunk=False)
+
+        return [
+            ModifiedRange(
+                start_line=i1,
+                start_column=0,
+                end_line=i2,
+                end_column=0,
+                new_text="".join(modified_lines[j1:j2]),
+            )
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+            if tag != "equal"
+        ]
+
+    @staticmethod
+    def compute_ranges_for_heading_level_change(
+        original_doc: Document[Node],
+        node_index: int,
+        new_level: int,
+        builder: DocumentTreeBuilder,
+    ) -> list[ModifiedRange] | None:
+        """
+        Compute the range changed by promoting or demoting a single heading.
+
+        Only the heading's own line changes, so the range is built directly from
+        the builder's line table without serializing or matching either document.
+
+        Args:
+            original_doc: The original document before the operation
+            node_index: Index of the heading in the original document
+            new_level: Heading level after the operation
+            builder: The DocumentTreeBuilder for the original document
+
+        Returns:
+            List with the single ModifiedRange, or None if the heading does not
+            occupy exactly one line (callers should fall back to compute_ranges)
+        """
+        heading = original_doc.nodes[node_index]
+        start_line = builder.get_node_line_position(node_index)
+        if (
+            not isinstance(heading, Heading)
+            or start_line is None
+            or builder.get_node_line_count(node_index) != 1
+        ):
+            return None
+
+        # The writer always follows a heading with a blank line, so its line ends
+        # in "\n"; the range replaces that whole line, up to the next line's start
+        new_line = f"{'#' * new_level} {heading.text}\n"
+
+        return [
+            ModifiedRange(
+                start_line=start_line,
+                start_column=0,
+                end_line=start_line + 1,
+                end_column=0,
+                new_text=new_line,
+            )
+        ]
+
+    @staticmethod
+    def compute_ranges_for_section_swap(
+        original_doc: Document[Node],
+        modified_doc: Document[Node],
+        first_start: int,
+        second_end: int,
+        builder: DocumentTreeBuilder,
+    ) -> list[ModifiedRange] | None:
+        """
+        Compute the range changed by swapping two adjacent sections.
+
+        move_up and move_down exchange the sections spanning nodes
+        first_start..second_end. Every node renders to the same lines wherever it
+        sits, so text before and after that span is unchanged and the edit is a
+        single replacement of the span with its text in the modified document.
+
+        Args:
+            original_doc: The original document before the operation
+            modified_doc: The modified document after the operation
+            first_start: Index of the first node of the earlier section
+            second_end: Index of the last node of the later section (inclusive)
+            builder: The DocumentTreeBuilder for the original document
+
+        Returns:
+            List with the single ModifiedRange, or None if the span's lines are unknown
+        """
+        return DiffComputer.compute_ranges_for_node_span(
+            original_doc, modified_doc, first_start, second_end + 1, builder
+        )
+
+    @staticmethod
+    def compute_ranges_for_node_span(
+        original_doc: Document[Node],
+        modified_doc: Document[Node],
+        start: int,
+        stop: int,
+        builder: DocumentTreeBuilder,
+    ) -> list[ModifiedRange] | None:
+        """
+        Compute the range changed by replacing a contiguous span of top-level nodes.
+
+        Nodes before start and from stop onwards are shared by both documents and
+        render to the same text, so the edit replaces the span's lines in the
+        original with everything between the same prefix and suffix in the
+        modified document. The replacement may have a different number of nodes
+        and lines.
+
+        Args:
+            original_doc: The original document before the operation
+            modified_doc: The modified document after the operation
+            start: Index of the first replaced node in the original document
+            stop: Index after the last replaced node in the original document
+            builder: The DocumentTreeBuilder for the original document
+
+        Returns:
+            List with the single ModifiedRange, or None if the span's lines are unknown
+        """
+        original_line_count = len(_doc_lines(original_doc))
+        start_line = builder.get_node_block_start(start)
+        if stop < len(original_doc.nodes):
+            end_line = builder.get_node_block_start(stop)
+        else:
+            end_line = original_line_count
+        if start_line is None or end_line is None:
+            return None
+
+        modified_lines = _doc_lines(modified_doc)
+        # The unchanged suffix has the same number of lines in both documents
+        modified_end_line = len(modified_lines) - (original_line_count - end_line)
+        # Removing the trailing nodes also removes the blank separator line before
+        # them, which the prefix's lines would otherwise keep
+        start_line = min(start_line, modified_end_line)
+
+        return [
+            ModifiedRange(
+                start_line=start_line,
+                start_column=0,
+                end_line=end_line,
+                end_column=0,
+                new_text="".join(modified_lines[start_line:modified_end_line]),
+            )
+        ]
+
+    @staticmethod
+    def _build_match_index(modified_nodes: list[Node]) -> _MatchIndex:
+        """
+        Index nodes by the content used to match them across documents.
+
+        Only the first node with a given key is kept, matching a front-to-back scan.
+        Other node types are only bucketed by type; their string form is computed
+        on demand by _find_matching_node.
+
+        Args:
+            modified_nodes: List of nodes in the modified document
+
+        Returns:
+            Tuple of (headings by text, paragraphs by content, other nodes by type,
+            cache of id(node) -> str(node))
+        """
+        heading_by_text: dict[str, Node] = {}
+        paragraph_by_content: dict[str, Node] = {}
+        nodes_by_type: defaultdict[type, list[Node]] = defaultdict(list)
+
+        for node in modified_nodes:
+            if isinstance(node, Heading):
+                heading_by_text.setdefault(node.text, node)
+            elif isinstance(node, Paragraph):
+                paragraph_by_content.setdefault(node.content, node)
+            else:
+                nodes_by_type[type(node)].append(node)
+
+        return heading_by_text, paragraph_by_content, nodes_by_type, {}
+
+    @staticmethod
+    def _find_matching_node(original_node: Node, match_index: _MatchIndex) -> Node | None:
         """
         Find a node in the modified document that matches the original node by content.
 
@@ -344,34 +995,30 @@ class DiffComputer:
 
         Args:
             original_node: The node to find a match for
-            modified_nodes: List of nodes in the modified document
+            match_index: Content index of the modified document (see _build_match_index)
 
         Returns:
             The matching node, or None if no match found
         """
+        heading_by_text, paragraph_by_content, nodes_by_type, str_cache = match_index
+
         # Match headings by text (level may change in promote/demote)
         if isinstance(original_node, Heading):
-            for node in modified_nodes:
-                if isinstance(node, Heading) and node.text == original_node.text:
-                    return node
+            return heading_by_text.get(original_node.text)
 
         # Match paragraphs by content
-        from doctk.core import Paragraph
-
         if isinstance(original_node, Paragraph):
-            for node in modified_nodes:
-                if isinstance(node, Paragraph) and node.content == original_node.content:
-                    return node
+            return paragraph_by_content.get(original_node.content)
 
         # Match other node types by their content
-        # For now, just check if it's the same type and content
-        for node in modified_nodes:
-            if type(node) == type(original_node):  # noqa: E721
-                # Use string representation as a fallback
-                orig_str = str(original_node)
-                node_str = str(node)
-                if orig_str == node_str:
-                    return node
+        # Use string representation as a fallback, rendering each candidate once
+        orig_str = str(original_node)
+        for node in nodes_by_type.get(type(original_node), ()):
+            node_str = str_cache.get(id(node))
+            if node_str is None:
+                node_str = str_cache[id(node)] = str(node)
+            if node_str == orig_str:
+                return node
 
         return None
 
@@ -393,32 +1040,38 @@ class DiffComputer:
         if node is None:
             return None
 
-        # Find the node index
-        try:
-            node_index = doc.nodes.index(node)
-        except ValueError:
-            return None
+        return builder.line_range(node)
 
-        # Use cached line position from builder via public accessor (O(1) lookup)
-        start_line = builder.get_node_line_position(node_index)
-        if start_line is None:
-            return None
 
-        # Use cached line count to avoid repeated Document creation
-        num_node_lines = builder.get_node_line_count(node_index)
-        if num_node_lines is None:
-            # Fallback: calculate line count if not cached
-            temp_doc = Document([node])
-            search_text = temp_doc.to_string().strip()
-            num_node_lines = search_text.count("\n") + 1
+class StructureOperations:
+    """High-level operations for document structure manipulation."""
 
-        end_line = start_line + num_node_lines - 1
+    @staticmethod
+    def _finish(document: Document[Node], edit: OperationResult | _Edit) -> OperationResult:
+        """
+        Turn the outcome of an edit into the OperationResult returned to callers.
+
+        Args:
+            document: The document the edit was applied to
+            edit: A failed OperationResult, or the new document and its range callable
 
-        return (start_line, end_line)
+        Returns:
+            Operation result
+        """
+        if isinstance(edit, OperationResult):
+            return edit
 
+        new_document, compute_modified_ranges = edit
+        if new_document is document:
+            return OperationResult(
+                success=True, document=_doc_text(document), error=None, unchanged=True
+            )
 
-class StructureOperations:
-    """High-level operations for document structure manipulation."""
+        return OperationResult(
+            success=True,
+            document=_doc_text(new_document, derived_from=document),
+            modified_ranges=compute_modified_ranges(),
+        )
 
     @staticmethod
     def promote(document: Document[Node], node_id: str) -> OperationResult:
@@ -432,48 +1085,69 @@ class StructureOperations:
         Returns:
             Operation result
         """
-        tree_builder = DocumentTreeBuilder(document)
-        node = tree_builder.find_node(node_id)
+        return StructureOperations._finish(
+            document, StructureOperations._promote_edit(document, node_id)
+        )
 
-        if node is None:
-            return OperationResult(success=False, error=f"Node not found: {node_id}")
+    @staticmethod
+    def _promote_edit(document: Document[Node], node_id: str) -> OperationResult | _Edit:
+        """Apply promote without serializing; see StructureOperations.promote."""
+        return StructureOperations._relevel_edit(document, node_id, promote=True)
 
-        if not isinstance(node, Heading):
-            return OperationResult(success=False, error=f"Node {node_id} is not a heading")
+    @staticmethod
+    def _relevel_edit(
+        document: Document[Node], node_id: str, promote: bool
+    ) -> OperationResult | _Edit:
+        """
+        Move a heading one level up or down without serializing.
 
-        # Validate: already at minimum level?
-        if node.level <= 1:
-            return OperationResult(
-                success=True,
-                document=document.to_string(),
-                error=None,
-            )
+        Shared by promote, unnest (both promote) and demote. A heading already at
+        level 1 (promote) or 6 (demote) is left unchanged.
 
-        # Get the index of the node
-        node_index = tree_builder.get_node_index(node_id)
-        if node_index is None:
-            return OperationResult(success=False, error=f"Could not find index for node: {node_id}")
+        Args:
+            document: The document to operate on
+            node_id: The ID of the heading to change
+            promote: True to decrease the level by one, False to increase it
 
-        # Create new promoted node
-        promoted_node = node.promote()
+        Returns:
+            A failed OperationResult, or the new document and its range callable
+        """
+        tree_builder = DocumentTreeBuilder.for_document(document)
+        resolved = tree_builder.resolve(node_id)
 
-        # Create new document with updated node
-        new_nodes = list(document.nodes)
-        new_nodes[node_index] = promoted_node
-        new_document = Document(new_nodes)
+        if resolved is None:
+            return OperationResult(success=False, error=f"Node not found: {node_id}")
 
-        # Compute modified ranges
-        modified_ranges = DiffComputer.compute_ranges(
-            original_doc=document,
-            modified_doc=new_document,
-            affected_node_ids=[node_id],
-        )
+        node, node_index = resolved
+
+        # Clamp to 1..6 exactly as Heading.promote/demote do; an unmoved level
+        # (already h1 or h6) is a no-op, so no new heading is built for it
+        level = node.level
+        new_level = max(1, level - 1) if promote else min(6, level + 1)
+        if new_level == level:
+            return document, list
+
+        # Create the node at its new level and a document with it swapped in
+        changed_node = node.promote() if promote else node.demote()
+        new_document = document.set(node_index, changed_node)
+
+        def compute_modified_ranges() -> list[ModifiedRange]:
+            # Compute modified ranges (only the heading line changes)
+            modified_ranges = DiffComputer.compute_ranges_for_heading_level_change(
+                original_doc=document,
+                node_index=node_index,
+                new_level=changed_node.level,
+                builder=tree_builder,
+            )
+            if modified_ranges is None:
+                modified_ranges = DiffComputer.compute_ranges(
+                    original_doc=document,
+                    modified_doc=new_document,
+                    affected_node_ids=[node_id],
+                )
+            return modified_ranges
 
-        return OperationResult(
-            success=True,
-            document=new_document.to_string(),
-            modified_ranges=modified_ranges,
-        )
+        return new_document, compute_modified_ranges
 
     @staticmethod
     def demote(document: Document[Node], node_id: str) -> OperationResult:
@@ -487,48 +1161,14 @@ class StructureOperations:
         Returns:
             Operation result
         """
-        tree_builder = DocumentTreeBuilder(document)
-        node = tree_builder.find_node(node_id)
-
-        if node is None:
-            return OperationResult(success=False, error=f"Node not found: {node_id}")
-
-        if not isinstance(node, Heading):
-            return OperationResult(success=False, error=f"Node {node_id} is not a heading")
-
-        # Validate: already at maximum level?
-        if node.level >= 6:
-            return OperationResult(
-                success=True,
-                document=document.to_string(),
-                error=None,
-            )
-
-        # Get the index of the node
-        node_index = tree_builder.get_node_index(node_id)
-        if node_index is None:
-            return OperationResult(success=False, error=f"Could not find index for node: {node_id}")
-
-        # Create new demoted node
-        demoted_node = node.demote()
-
-        # Create new document with updated node
-        new_nodes = list(document.nodes)
-        new_nodes[node_index] = demoted_node
-        new_document = Document(new_nodes)
-
-        # Compute modified ranges
-        modified_ranges = DiffComputer.compute_ranges(
-            original_doc=document,
-            modified_doc=new_document,
-            affected_node_ids=[node_id],
+        return StructureOperations._finish(
+            document, StructureOperations._demote_edit(document, node_id)
         )
 
-        return OperationResult(
-            success=True,
-            document=new_document.to_string(),
-            modified_ranges=modified_ranges,
-        )
+    @staticmethod
+    def _demote_edit(document: Document[Node], node_id: str) -> OperationResult | _Edit:
+        """Apply demote without serializing; see StructureOperations.demote."""
+        return StructureOperations._relevel_edit(document, node_id, promote=False)
 
     @staticmethod
     def validate_promote(document: Document[Node], node_id: str) -> ValidationResult:
@@ -542,17 +1182,13 @@ class StructureOperations:
         Returns:
             ValidationResult indicating whether the operation is valid
         """
-        tree_builder = DocumentTreeBuilder(document)
-        node = tree_builder.find_node(node_id)
+        node = _find_heading(document, node_id)
 
         if node is None:
             return ValidationResult(valid=False, error=f"Node not found: {node_id}")
 
-        if not isinstance(node, Heading):
-            return ValidationResult(valid=False, error=f"Node {node_id} is not a heading")
-
         # Promote is always valid (at level 1 it's identity)
-        return ValidationResult(valid=True)
+        return _VALID
 
     @staticmethod
     def validate_demote(document: Document[Node], node_id: str) -> ValidationResult:
@@ -566,17 +1202,13 @@ class StructureOperations:
         Returns:
             ValidationResult indicating whether the operation is valid
         """
-        tree_builder = DocumentTreeBuilder(document)
-        node = tree_builder.find_node(node_id)
+        node = _find_heading(document, node_id)
 
         if node is None:
             return ValidationResult(valid=False, error=f"Node not found: {node_id}")
 
-        if not isinstance(node, Heading):
-            return ValidationResult(valid=False, error=f"Node {node_id} is not a heading")
-
         # Demote is always valid (at level 6 it's identity)
-        return ValidationResult(valid=True)
+        return _VALID
 
     @staticmethod
     def move_up(document: Document[Node], node_id: str) -> OperationResult:
@@ -590,58 +1222,36 @@ class StructureOperations:
         Returns:
             Operation result
         """
-        tree_builder = DocumentTreeBuilder(document)
-        node = tree_builder.find_node(node_id)
-
-        if node is None:
-            return OperationResult(success=False, error=f"Node not found: {node_id}")
+        return StructureOperations._finish(
+            document, StructureOperations._move_up_edit(document, node_id)
+        )
 
-        if not isinstance(node, Heading):
-            return OperationResult(success=False, error=f"Node {node_id} is not a heading")
+    @staticmethod
+    def _move_up_edit(document: Document[Node], node_id: str) -> OperationResult | _Edit:
+        """Apply move_up without serializing; see StructureOperations.move_up."""
+        tree_builder = DocumentTreeBuilder.for_document(document)
 
-        # Get the section range for the current node
+        # Get the section range for the current node; every heading has one, so a
+        # missing range means the node does not exist
         section_range = tree_builder.get_section_range(node_id)
         if section_range is None:
-            return OperationResult(
-                success=False, error=f"Could not find section for node: {node_id}"
-            )
+            return OperationResult(success=False, error=f"Node not found: {node_id}")
 
         section_start, section_end = section_range
 
         # Check if already at the top
         if section_start == 0:
-            return OperationResult(
-                success=True,
-                document=document.to_string(),
-                error=None,
-            )
+            return document, list
 
         # Find the previous sibling heading (same level or higher)
-        prev_heading_index = section_start - 1
-        while prev_heading_index >= 0:
-            prev_node = document.nodes[prev_heading_index]
-            if isinstance(prev_node, Heading) and prev_node.level <= node.level:
-                break
-            prev_heading_index -= 1
+        prev_heading_index = tree_builder.find_previous_peer(node_id)
 
         # If we can't find a valid previous sibling, stay in place
-        if prev_heading_index < 0:
-            return OperationResult(
-                success=True,
-                document=document.to_string(),
-                error=None,
-            )
-
-        # Get the section range for the previous sibling
-        prev_node_id = None
-        for nid, n in tree_builder.node_map.items():
-            if n is document.nodes[prev_heading_index]:
-                prev_node_id = nid
-                break
-
-        if prev_node_id is None:
-            return OperationResult(success=False, error="Could not find previous section ID")
+        if prev_heading_index is None:
+            return document, list
 
+        # Get the section range for the previous sibling (heading positions always have IDs)
+        prev_node_id = tree_builder.id_by_index[prev_heading_index]
         prev_section_range = tree_builder.get_section_range(prev_node_id)
         if prev_section_range is None:
             return OperationResult(success=False, error="Could not find previous section range")
@@ -649,29 +1259,30 @@ class StructureOperations:
         prev_section_start, prev_section_end = prev_section_range
 
         # Move the entire current section to before the previous section
-        new_nodes = list(document.nodes)
-        current_section = new_nodes[section_start : section_end + 1]
-        # Remove current section
-        del new_nodes[section_start : section_end + 1]
-        # Insert current section before previous section
-        new_nodes[prev_section_start:prev_section_start] = current_section
-        new_document = Document(new_nodes)
-
-        # Collect all affected node IDs from the moved section
-        affected_node_ids = [node_id]  # At minimum, the heading itself
-
-        # Compute modified ranges
-        modified_ranges = DiffComputer.compute_ranges(
-            original_doc=document,
-            modified_doc=new_document,
-            affected_node_ids=affected_node_ids,
+        current_section = document.nodes[section_start : section_end + 1]
+        skipped_nodes = document.nodes[prev_section_start:section_start]
+        new_document = document.splice(
+            prev_section_start, section_end + 1, current_section + skipped_nodes
         )
 
-        return OperationResult(
-            success=True,
-            document=new_document.to_string(),
-            modified_ranges=modified_ranges,
-        )
+        def compute_modified_ranges() -> list[ModifiedRange]:
+            # Only the span covering both sections changes
+            modified_ranges = DiffComputer.compute_ranges_for_section_swap(
+                original_doc=document,
+                modified_doc=new_document,
+                first_start=prev_section_start,
+                second_end=section_end,
+                builder=tree_builder,
+            )
+            if modified_ranges is None:
+                modified_ranges = DiffComputer.compute_ranges(
+                    original_doc=document,
+                    modified_doc=new_document,
+                    affected_node_ids=[node_id],
+                )
+            return modified_ranges
+
+        return new_document, compute_modified_ranges
 
     @staticmethod
     def move_down(document: Document[Node], node_id: str) -> OperationResult:
@@ -685,58 +1296,37 @@ class StructureOperations:
         Returns:
             Operation result
         """
-        tree_builder = DocumentTreeBuilder(document)
-        node = tree_builder.find_node(node_id)
-
-        if node is None:
-            return OperationResult(success=False, error=f"Node not found: {node_id}")
+        return StructureOperations._finish(
+            document, StructureOperations._move_down_edit(document, node_id)
+        )
 
-        if not isinstance(node, Heading):
-            return OperationResult(success=False, error=f"Node {node_id} is not a heading")
+    @staticmethod
+    def _move_down_edit(document: Document[Node], node_id: str) -> OperationResult | _Edit:
+        """Apply move_down without serializing; see StructureOperations.move_down."""
+        tree_builder = DocumentTreeBuilder.for_document(document)
 
-        # Get the section range for the current node
+        # Get the section range for the current node; every heading has one, so a
+        # missing range means the node does not exist
         section_range = tree_builder.get_section_range(node_id)
         if section_range is None:
-            return OperationResult(
-                success=False, error=f"Could not find section for node: {node_id}"
-            )
+            return OperationResult(success=False, error=f"Node not found: {node_id}")
 
         section_start, section_end = section_range
 
         # Check if already at the bottom
         if section_end >= len(document.nodes) - 1:
-            return OperationResult(
-                success=True,
-                document=document.to_string(),
-                error=None,
-            )
+            return document, list
 
         # Find the next sibling heading (same level or higher)
-        next_heading_index = section_end + 1
-        while next_heading_index < len(document.nodes):
-            next_node = document.nodes[next_heading_index]
-            if isinstance(next_node, Heading) and next_node.level <= node.level:
-                break
-            next_heading_index += 1
+        level = document.nodes[section_start].level
+        next_heading_index = tree_builder.find_next_heading(section_end + 1, level)
 
         # If we can't find a valid next sibling, stay in place
-        if next_heading_index >= len(document.nodes):
-            return OperationResult(
-                success=True,
-                document=document.to_string(),
-                error=None,
-            )
-
-        # Get the section range for the next sibling
-        next_node_id = None
-        for nid, n in tree_builder.node_map.items():
-            if n is document.nodes[next_heading_index]:
-                next_node_id = nid
-                break
-
-        if next_node_id is None:
-            return OperationResult(success=False, error="Could not find next section ID")
+        if next_heading_index is None:
+            return document, list
 
+        # Get the section range for the next sibling (heading positions always have IDs)
+        next_node_id = tree_builder.id_by_index[next_heading_index]
         next_section_range = tree_builder.get_section_range(next_node_id)
         if next_section_range is None:
             return OperationResult(success=False, error="Could not find next section range")
@@ -744,31 +1334,30 @@ class StructureOperations:
         next_section_start, next_section_end = next_section_range
 
         # Move the entire current section to after the next section
-        new_nodes = list(document.nodes)
-        current_section = new_nodes[section_start : section_end + 1]
-        # Remove current section
-        del new_nodes[section_start : section_end + 1]
-        # Calculate new insertion position (after removing current section)
-        insert_pos = next_section_end - (section_end - section_start)
-        # Insert current section after next section
-        new_nodes[insert_pos:insert_pos] = current_section
-        new_document = Document(new_nodes)
-
-        # Collect all affected node IDs from the moved section
-        affected_node_ids = [node_id]  # At minimum, the heading itself
-
-        # Compute modified ranges
-        modified_ranges = DiffComputer.compute_ranges(
-            original_doc=document,
-            modified_doc=new_document,
-            affected_node_ids=affected_node_ids,
+        current_section = document.nodes[section_start : section_end + 1]
+        skipped_nodes = document.nodes[section_end + 1 : next_section_end + 1]
+        new_document = document.splice(
+            section_start, next_section_end + 1, skipped_nodes + current_section
         )
 
-        return OperationResult(
-            success=True,
-            document=new_document.to_string(),
-            modified_ranges=modified_ranges,
-        )
+        def compute_modified_ranges() -> list[ModifiedRange]:
+            # Only the span covering both sections changes
+            modified_ranges = DiffComputer.compute_ranges_for_section_swap(
+                original_doc=document,
+                modified_doc=new_document,
+                first_start=section_start,
+                second_end=next_section_end,
+                builder=tree_builder,
+            )
+            if modified_ranges is None:
+                modified_ranges = DiffComputer.compute_ranges(
+                    original_doc=document,
+                    modified_doc=new_document,
+                    affected_node_ids=[node_id],
+                )
+            return modified_ranges
+
+        return new_document, compute_modified_ranges
 
     @staticmethod
     def validate_move_up(document: Document[Node], node_id: str) -> ValidationResult:
@@ -782,17 +1371,13 @@ class StructureOperations:
         Returns:
             ValidationResult indicating whether the operation is valid
         """
-        tree_builder = DocumentTreeBuilder(document)
-        node = tree_builder.find_node(node_id)
+        node = _find_heading(document, node_id)
 
         if node is None:
             return ValidationResult(valid=False, error=f"Node not found: {node_id}")
 
-        if not isinstance(node, Heading):
-            return ValidationResult(valid=False, error=f"Node {node_id} is not a heading")
-
         # Move up is always valid (stays in place if already at top)
-        return ValidationResult(valid=True)
+        return _VALID
 
     @staticmethod
     def validate_move_down(document: Document[Node], node_id: str) -> ValidationResult:
@@ -806,17 +1391,13 @@ class StructureOperations:
         Returns:
             ValidationResult indicating whether the operation is valid
         """
-        tree_builder = DocumentTreeBuilder(document)
-        node = tree_builder.find_node(node_id)
+        node = _find_heading(document, node_id)
 
         if node is None:
             return ValidationResult(valid=False, error=f"Node not found: {node_id}")
 
-        if not isinstance(node, Heading):
-            return ValidationResult(valid=False, error=f"Node {node_id} is not a heading")
-
         # Move down is always valid (stays in place if already at bottom)
-        return ValidationResult(valid=True)
+        return _VALID
 
     @staticmethod
     def nest(document: Document[Node], node_id: str, parent_id: str) -> OperationResult:
@@ -834,89 +1415,86 @@ class StructureOperations:
         Returns:
             Operation result
         """
-        tree_builder = DocumentTreeBuilder(document)
-        node = tree_builder.find_node(node_id)
-        parent = tree_builder.find_node(parent_id)
-
-        if node is None:
-            return OperationResult(success=False, error=f"Node not found: {node_id}")
-
-        if parent is None:
-            return OperationResult(success=False, error=f"Parent node not found: {parent_id}")
-
-        if not isinstance(node, Heading):
-            return OperationResult(success=False, error=f"Node {node_id} is not a heading")
-
-        if not isinstance(parent, Heading):
-            return OperationResult(success=False, error=f"Parent node {parent_id} is not a heading")
+        return StructureOperations._finish(
+            document, StructureOperations._nest_edit(document, node_id, parent_id)
+        )
 
-        # Get section ranges
+    @staticmethod
+    def _nest_edit(
+        document: Document[Node], node_id: str, parent_id: str
+    ) -> OperationResult | _Edit:
+        """Apply nest without serializing; see StructureOperations.nest."""
+        tree_builder = DocumentTreeBuilder.for_document(document)
+
+        # Each ID is looked up once: every heading has a section range, and the
+        # heading itself is the first node of its section
         section_range = tree_builder.get_section_range(node_id)
         parent_section_range = tree_builder.get_section_range(parent_id)
 
         if section_range is None:
-            return OperationResult(
-                success=False, error=f"Could not find section for node: {node_id}"
-            )
+            return OperationResult(success=False, error=f"Node not found: {node_id}")
 
         if parent_section_range is None:
-            return OperationResult(
-                success=False, error=f"Could not find section for parent: {parent_id}"
-            )
+            return OperationResult(success=False, error=f"Parent node not found: {parent_id}")
 
         section_start, section_end = section_range
         parent_section_start, parent_section_end = parent_section_range
+        nodes = document.nodes
 
         # Calculate level adjustment (difference between parent+1 and current level)
-        level_adjustment = (parent.level + 1) - node.level
-
-        # Extract the section and adjust all heading levels
-        new_nodes = list(document.nodes)
-        section_nodes = new_nodes[section_start : section_end + 1]
-        adjusted_section: list[Node] = []
-
-        for section_node in section_nodes:
-            if isinstance(section_node, Heading):
-                # Adjust level, capping at 6
-                adjusted_level = min(6, section_node.level + level_adjustment)
-                adjusted_node = Heading(
-                    level=adjusted_level,
-                    text=section_node.text,
-                    children=section_node.children,
-                    metadata=section_node.metadata,
-                )
-                adjusted_section.append(adjusted_node)
-            else:
-                # Non-heading nodes are kept as-is
-                adjusted_section.append(section_node)
+        level_adjustment = (nodes[parent_section_start].level + 1) - nodes[section_start].level
 
-        # Remove section from current position
-        del new_nodes[section_start : section_end + 1]
+        # Extract the section and adjust all heading levels (capped at 6);
+        # non-heading nodes are kept as-is
+        adjusted_section: list[Node] = [
+            _with_level(section_node, min(6, section_node.level + level_adjustment))
+            if isinstance(section_node, Heading)
+            else section_node
+            for section_node in nodes[section_start : section_end + 1]
+        ]
 
         # Adjust parent section end if section was before parent
         if section_start < parent_section_start:
             parent_section_end -= section_end - section_start + 1
 
-        # Insert adjusted section after parent section
-        new_nodes[parent_section_end + 1 : parent_section_end + 1] = adjusted_section
-
-        new_document = Document(new_nodes)
+        # Move the adjusted section after the parent section. insert_pos is the
+        # insertion point once the section is removed; the new document is built
+        # with a single splice over the span between the old and new positions
+        insert_pos = parent_section_end + 1
+        if insert_pos < 0:
+            # Only possible when the parent lies inside the moved section: the
+            # position then counts from the end of the remaining nodes (list
+            # insertion semantics), so convert it to the equivalent absolute one
+            remaining_count = len(nodes) - (section_end - section_start + 1)
+            insert_pos = max(0, remaining_count + insert_pos)
+
+        # Span of original nodes [span_start, span_end) that the splice replaces
+        if insert_pos <= section_start:
+            span_start, span_end = insert_pos, section_end + 1
+            new_document = document.splice(
+                span_start, span_end, adjusted_section + nodes[insert_pos:section_start]
+            )
+        else:
+            span_start = section_start
+            span_end = min(section_end + 1 + (insert_pos - section_start), len(nodes))
+            new_document = document.splice(
+                span_start, span_end, nodes[section_end + 1 : span_end] + adjusted_section
+            )
 
-        # Collect all affected node IDs from the nested section
-        affected_node_ids = [node_id]  # At minimum, the heading itself
+        def compute_modified_ranges() -> list[ModifiedRange]:
+            # Only the span the splice replaced changes
+            modified_ranges = DiffComputer.compute_ranges_for_node_span(
+                document, new_document, span_start, span_end, builder=tree_builder
+            )
+            if modified_ranges is None:
+                modified_ranges = DiffComputer.compute_ranges(
+                    original_doc=document,
+                    modified_doc=new_document,
+                    affected_node_ids=[node_id],
+                )
+            return modified_ranges
 
-        # Compute modified ranges
-        modified_ranges = DiffComputer.compute_ranges(
-            original_doc=document,
-            modified_doc=new_document,
-            affected_node_ids=affected_node_ids,
-        )
-
-        return OperationResult(
-            success=True,
-            document=new_document.to_string(),
-            modified_ranges=modified_ranges,
-        )
+        return new_document, compute_modified_ranges
 
     @staticmethod
     def unnest(document: Document[Node], node_id: str) -> OperationResult:
@@ -933,48 +1511,15 @@ class StructureOperations:
         Returns:
             Operation result
         """
-        tree_builder = DocumentTreeBuilder(document)
-        node = tree_builder.find_node(node_id)
-
-        if node is None:
-            return OperationResult(success=False, error=f"Node not found: {node_id}")
-
-        if not isinstance(node, Heading):
-            return OperationResult(success=False, error=f"Node {node_id} is not a heading")
-
-        # Validate: already at minimum level?
-        if node.level <= 1:
-            return OperationResult(
-                success=True,
-                document=document.to_string(),
-                error=None,
-            )
-
-        # Get the index of the node
-        node_index = tree_builder.get_node_index(node_id)
-        if node_index is None:
-            return OperationResult(success=False, error=f"Could not find index for node: {node_id}")
-
-        # Create new unnested node (promote by one level)
-        unnested_node = node.promote()
-
-        # Create new document with updated node
-        new_nodes = list(document.nodes)
-        new_nodes[node_index] = unnested_node
-        new_document = Document(new_nodes)
-
-        # Compute modified ranges
-        modified_ranges = DiffComputer.compute_ranges(
-            original_doc=document,
-            modified_doc=new_document,
-            affected_node_ids=[node_id],
+        return StructureOperations._finish(
+            document, StructureOperations._unnest_edit(document, node_id)
         )
 
-        return OperationResult(
-            success=True,
-            document=new_document.to_string(),
-            modified_ranges=modified_ranges,
-        )
+    @staticmethod
+    def _unnest_edit(document: Document[Node], node_id: str) -> OperationResult | _Edit:
+        """Apply unnest without serializing; see StructureOperations.unnest."""
+        # Unnesting moves the heading out of its parent section: promote by one level
+        return StructureOperations._relevel_edit(document, node_id, promote=True)
 
     @staticmethod
     def validate_nest(document: Document[Node], node_id: str, parent_id: str) -> ValidationResult:
@@ -989,9 +1534,8 @@ class StructureOperations:
         Returns:
             ValidationResult indicating whether the operation is valid
         """
-        tree_builder = DocumentTreeBuilder(document)
-        node = tree_builder.find_node(node_id)
-        parent = tree_builder.find_node(parent_id)
+        node = _find_heading(document, node_id)
+        parent = _find_heading(document, parent_id)
 
         if node is None:
             return ValidationResult(valid=False, error=f"Node not found: {node_id}")
@@ -999,12 +1543,6 @@ class StructureOperations:
         if parent is None:
             return ValidationResult(valid=False, error=f"Parent node not found: {parent_id}")
 
-        if not isinstance(node, Heading):
-            return ValidationResult(valid=False, error=f"Node {node_id} is not a heading")
-
-        if not isinstance(parent, Heading):
-            return ValidationResult(valid=False, error=f"Parent node {parent_id} is not a heading")
-
         # Can't nest a node under itself
         if node_id == parent_id:
             return ValidationResult(valid=False, error="Cannot nest a node under itself")
@@ -1016,7 +1554,7 @@ class StructureOperations:
                 valid=False, error="Cannot nest: would exceed maximum heading level (6)"
             )
 
-        return ValidationResult(valid=True)
+        return _VALID
 
     @staticmethod
     def validate_unnest(document: Document[Node], node_id: str) -> ValidationResult:
@@ -1030,17 +1568,13 @@ class StructureOperations:
         Returns:
             ValidationResult indicating whether the operation is valid
         """
-        tree_builder = DocumentTreeBuilder(document)
-        node = tree_builder.find_node(node_id)
+        node = _find_heading(document, node_id)
 
         if node is None:
             return ValidationResult(valid=False, error=f"Node not found: {node_id}")
 
-        if not isinstance(node, Heading):
-            return ValidationResult(valid=False, error=f"Node {node_id} is not a heading")
-
         # Unnest is always valid (at level 1 it's identity)
-        return ValidationResult(valid=True)
+        return _VALID
 
     @staticmethod
     def delete(document: Document[Node], node_id: str) -> OperationResult:
@@ -1054,72 +1588,35 @@ class StructureOperations:
         Returns:
             Operation result
         """
-        tree_builder = DocumentTreeBuilder(document)
-        node = tree_builder.find_node(node_id)
-
-        if node is None:
-            return OperationResult(success=False, error=f"Node not found: {node_id}")
+        return StructureOperations._finish(
+            document, StructureOperations._delete_edit(document, node_id)
+        )
 
-        if not isinstance(node, Heading):
-            return OperationResult(success=False, error=f"Node {node_id} is not a heading")
+    @staticmethod
+    def _delete_edit(document: Document[Node], node_id: str) -> OperationResult | _Edit:
+        """Apply delete without serializing; see StructureOperations.delete."""
+        tree_builder = DocumentTreeBuilder.for_document(document)
 
-        # Get the section range (start and end indices in document.nodes)
+        # Get the section range (start and end indices in document.nodes); every
+        # heading has one, so a missing range means the node does not exist
         section_range = tree_builder.get_section_range(node_id)
         if section_range is None:
-            return OperationResult(
-                success=False, error=f"Could not determine section range for {node_id}"
-            )
+            return OperationResult(success=False, error=f"Node not found: {node_id}")
 
         start_idx, end_idx = section_range
 
         # Create new document with the section removed
         # Note: end_idx is inclusive, so we use end_idx + 1 for the slice
-        new_nodes = document.nodes[:start_idx] + document.nodes[end_idx + 1 :]
-        modified_doc = Document(nodes=new_nodes)
-
-        # Compute modified ranges for granular edits
-        # For delete operations, we need to manually compute the range because
-        # DiffComputer only processes individual nodes, not entire sections
-        modified_ranges: list[ModifiedRange] = []
-
-        # Get the line range for the entire section being deleted
-        first_node = document.nodes[start_idx]
-        last_node = document.nodes[end_idx]
-
-        first_node_range = DiffComputer._get_node_line_range(document, first_node, tree_builder)
-        last_node_range = DiffComputer._get_node_line_range(document, last_node, tree_builder)
-
-        if first_node_range is not None and last_node_range is not None:
-            # Get the full document text for column calculation
-            original_text = document.to_string()
-            original_lines = original_text.splitlines(keepends=True)
-
-            start_line = first_node_range[0]
-            end_line = last_node_range[1]
-
-            # Extend to include trailing blank line that markdown writer adds
-            # The markdown writer appends a blank line after each node (markdown.py:41-50)
-            # We need to delete this separator to avoid doubled blank lines
-            if end_line + 1 < len(original_lines):
-                end_line = end_line + 1
-                end_column = 0  # Start of next line
-            else:
-                end_column = len(original_lines[end_line]) if end_line < len(original_lines) else 0
-
-            # Create a deletion range (empty new_text)
-            modified_ranges.append(
-                ModifiedRange(
-                    start_line=start_line,
-                    start_column=0,
-                    end_line=end_line,
-                    end_column=end_column,
-                    new_text="",
-                )
+        modified_doc = document.splice(start_idx, end_idx + 1, [])
+
+        def compute_modified_ranges() -> list[ModifiedRange]:
+            # Only the lines of the removed section (and one separator) change
+            modified_ranges = DiffComputer.compute_ranges_for_node_span(
+                document, modified_doc, start_idx, end_idx + 1, builder=tree_builder
             )
+            return modified_ranges if modified_ranges is not None else []
 
-        return OperationResult(
-            success=True, document=modified_doc.to_string(), modified_ranges=modified_ranges
-        )
+        return modified_doc, compute_modified_ranges
 
     @staticmethod
     def validate_delete(document: Document[Node], node_id: str) -> ValidationResult:
@@ -1133,14 +1630,81 @@ class StructureOperations:
         Returns:
             ValidationResult indicating whether the operation is valid
         """
-        tree_builder = DocumentTreeBuilder(document)
-        node = tree_builder.find_node(node_id)
+        node = _find_heading(document, node_id)
 
         if node is None:
             return ValidationResult(valid=False, error=f"Node not found: {node_id}")
 
-        if not isinstance(node, Heading):
-            return ValidationResult(valid=False, error=f"Node {node_id} is not a heading")
-
         # Delete is always valid for any heading
-        return ValidationResult(valid=True)
+        return _VALID
+
+    @staticmethod
+    def apply_batch(
+        document: Document[Node], operations: list[tuple[str, dict[str, Any]]]
+    ) -> OperationResult:
+        """
+        Apply several operations in sequence and return one combined result.
+
+        Each operation is given as (name, kwargs), e.g. ("promote", {"node_id": "h2-0"}),
+        and its node IDs refer to the document produced by the operations before it.
+        Intermediate documents are never rendered (their tree builders only index
+        nodes and sections), and the result text and modified ranges are computed
+        once, reusing the rendering of the original document's unchanged nodes.
+
+        Args:
+            document: The document to operate on
+            operations: The operations to apply, in order
+
+        Returns:
+            Operation result for the whole batch; the first failing operation fails it
+        """
+        current = document
+        changes = 0
+        compute_modified_ranges: Callable[[], list[ModifiedRange]] = list
+
+        for name, kwargs in operations:
+            edit_fn = _BATCH_EDITS.get(name)
+            if edit_fn is None:
+                return OperationResult(success=False, error=f"Unknown operation: {name}")
+
+            edit = edit_fn(current, **kwargs)
+            if isinstance(edit, OperationResult):
+                return edit
+
+            new_document, ranges_fn = edit
+            if new_document is not current:
+                changes += 1
+                compute_modified_ranges = ranges_fn
+                current = new_document
+
+        if current is document:
+            return OperationResult(
+                success=True, document=_doc_text(document), error=None, unchanged=True
+            )
+
+        # A single effective edit keeps its own granular ranges; otherwise diff once
+        modified_ranges = (
+            compute_modified_ranges()
+            if changes == 1
+            else DiffComputer.compute_ranges(
+                original_doc=document, modified_doc=current, affected_node_ids=[]
+            )
+        )
+
+        return OperationResult(
+            success=True,
+            document=_doc_text(current, derived_from=document),
+            modified_ranges=modified_ranges,
+        )
+
+
+# Edits available to StructureOperations.apply_batch, by operation name
+_BATCH_EDITS: dict[str, Callable[..., OperationResult | _Edit]] = {
+    "promote": StructureOperations._promote_edit,
+    "demote": StructureOperations._demote_edit,
+    "move_up": StructureOperations._move_up_edit,
+    "move_down": StructureOperations._move_down_edit,
+    "nest": StructureOperations._nest_edit,
+    "unnest": StructureOperations._unnest_edit,
+    "delete": StructureOperations._delete_edit,
+}
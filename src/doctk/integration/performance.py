@@ -6,23 +6,28 @@ requirements.
 """
 
 import copy
+import threading
 import time
 from collections.abc import Generator
 from contextlib import contextmanager
 from dataclasses import dataclass, field
+from operator import itemgetter
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Metric:
-    """A single performance metric."""
+    """A single performance metric.
+
+    Slotted because monitors keep many of these; it drops the per-instance __dict__.
+    """
 
     timestamp: float
     duration: float
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class OperationStats:
     """Statistics for a specific operation."""
 
@@ -31,6 +36,7 @@ class OperationStats:
     total_duration: float = 0.0
     min_duration: float = float("inf")
     max_duration: float = float("-inf")
+    # Most recent metrics, oldest first; PerformanceMonitor trims them to its limit
     metrics: list[Metric] = field(default_factory=list)
 
     @property
@@ -43,10 +49,14 @@ class OperationStats:
     def add_metric(self, metric: Metric) -> None:
         """Add a metric and update statistics."""
         self.metrics.append(metric)
+        self.add_duration(metric.duration)
+
+    def add_duration(self, duration: float) -> None:
+        """Update statistics for a call without retaining a metric."""
         self.total_calls += 1
-        self.total_duration += metric.duration
-        self.min_duration = min(self.min_duration, metric.duration)
-        self.max_duration = max(self.max_duration, metric.duration)
+        self.total_duration += duration
+        self.min_duration = min(self.min_duration, duration)
+        self.max_duration = max(self.max_duration, duration)
 
 
 class PerformanceMonitor:
@@ -78,10 +88,16 @@ class PerformanceMonitor:
             slow_operation_threshold: Threshold in seconds for slow operations (default: 0.5s)
             max_metrics_per_operation: Maximum number of metrics to retain per operation
                 (default: 1000). Prevents unbounded memory growth in long-running processes.
+                Use 0 to keep only the running statistics.
         """
         self.stats: dict[str, OperationStats] = {}
         self.slow_operation_threshold = slow_operation_threshold
         self.max_metrics_per_operation = max_metrics_per_operation
+        # One lock per operation name, so threads recording different operations
+        # never contend. _create_lock only guards adding new names; locks are kept
+        # across clear() so a name's lock never changes once created.
+        self._locks: dict[str, threading.Lock] = {}
+        self._create_lock = threading.Lock()
 
     def record_operation(
         self, operation: str, duration: float, metadata: dict[str, Any] | None = None
@@ -93,15 +109,45 @@ class PerformanceMonitor:
             duration: Duration in seconds
             metadata: Optional metadata about the operation
         """
-        self.stats.setdefault(operation, OperationStats(operation_name=operation))
+        # A plain dict read is atomic, so operations seen before take no shared lock
+        stats = self.stats.get(operation)
+        if stats is None:
+            stats = self._create_stats(operation)
+
+        limit = self.max_metrics_per_operation
+        if limit > 0:
+            metric = Metric(timestamp=time.time(), duration=duration, metadata=metadata or {})
+            with self._locks[operation]:
+                stats.add_metric(metric)
+                # Enforce the retention limit (FIFO eviction). The limit is read
+                # on every call, so lowering it also trims operations recorded
+                # earlier the next time they are recorded.
+                excess = len(stats.metrics) - limit
+                if excess > 0:
+                    del stats.metrics[:excess]
+        else:
+            # Nothing is retained, so skip reading the wall clock and building a Metric
+            with self._locks[operation]:
+                stats.add_duration(duration)
+                # Drop metrics retained before retention was disabled
+                stats.metrics.clear()
+
+    def _create_stats(self, operation: str) -> OperationStats:
+        """Create the statistics (and lock) for an operation on first use.
 
-        metric = Metric(timestamp=time.time(), duration=duration, metadata=metadata or {})
-        self.stats[operation].add_metric(metric)
+        Args:
+            operation: Name of the operation
 
-        # Enforce metric retention limit to prevent unbounded memory growth
-        if len(self.stats[operation].metrics) > self.max_metrics_per_operation:
-            # Remove oldest metric (FIFO eviction)
-            self.stats[operation].metrics.pop(0)
+        Returns:
+            The operation's statistics, possibly created by a concurrent caller
+        """
+        with self._create_lock:
+            stats = self.stats.get(operation)
+            if stats is None:
+                stats = OperationStats(operation_name=operation)
+                self._locks.setdefault(operation, threading.Lock())
+                self.stats[operation] = stats
+            return stats
 
     @contextmanager
     def measure(
@@ -119,11 +165,12 @@ class PerformanceMonitor:
             ...     # Perform operation
             ...     pass
         """
-        start_time = time.perf_counter()
+        # Integer nanoseconds subtract exactly; convert to seconds once at the end
+        start_ns = time.perf_counter_ns()
         try:
             yield
         finally:
-            duration = time.perf_counter() - start_time
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
             self.record_operation(operation, duration, metadata)
 
     def get_stats(self, operation: str) -> OperationStats | None:
@@ -149,13 +196,52 @@ class PerformanceMonitor:
         stats = self.get_stats(operation)
         return stats.average_duration if stats else 0.0
 
+    def _snapshot(self) -> list[tuple[str, OperationStats]]:
+        """Take the current (name, stats) pairs under the creation lock.
+
+        record_operation adds new operations under the same lock, so iterating
+        the snapshot cannot fail with "dictionary changed size during iteration".
+
+        Returns:
+            List of (operation_name, stats) pairs
+        """
+        with self._create_lock:
+            return list(self.stats.items())
+
     def get_all_stats(self) -> dict[str, OperationStats]:
         """Get statistics for all operations.
 
         Returns:
             Deep copy of dictionary mapping operation names to their statistics
         """
-        return copy.deepcopy(self.stats)
+        # Copy each operation under its own lock so concurrent recording cannot
+        # change its metrics mid-copy
+        all_stats = {}
+        for name, stats in self._snapshot():
+            with self._locks[name]:
+                all_stats[name] = copy.deepcopy(stats)
+        return all_stats
+
+    def _find_slow_operations(
+        self, items: list[tuple[str, OperationStats]]
+    ) -> list[tuple[str, float, OperationStats]]:
+        """Find the slow operations in a snapshot.
+
+        Args:
+            items: (operation_name, stats) pairs from _snapshot
+
+        Returns:
+            List of (operation_name, average_duration, stats) for slow operations,
+            sorted by duration (slowest first)
+        """
+        threshold = self.slow_operation_threshold
+        slow_ops = []
+        for name, stats in items:
+            average = stats.average_duration
+            if average > threshold:
+                slow_ops.append((name, average, stats))
+        slow_ops.sort(key=itemgetter(1), reverse=True)
+        return slow_ops
 
     def get_slow_operations(self) -> list[tuple[str, float]]:
         """Identify operations exceeding the slow threshold.
@@ -164,12 +250,9 @@ class PerformanceMonitor:
             List of tuples (operation_name, average_duration) for slow operations,
             sorted by duration (slowest first)
         """
-        slow_ops = [
-            (name, stats.average_duration)
-            for name, stats in self.stats.items()
-            if stats.average_duration > self.slow_operation_threshold
+        return [
+            (name, average) for name, average, _ in self._find_slow_operations(self._snapshot())
         ]
-        return sorted(slow_ops, key=lambda x: x[1], reverse=True)
 
     def report_slow_operations(self) -> str:
         """Generate a report of slow operations.
@@ -177,14 +260,16 @@ class PerformanceMonitor:
         Returns:
             Human-readable report string
         """
-        slow_ops = self.get_slow_operations()
+        slow_ops = self._find_slow_operations(self._snapshot())
         if not slow_ops:
             return "No slow operations detected."
+        return self._format_slow_operations(slow_ops)
 
+    def _format_slow_operations(self, slow_ops: list[tuple[str, float, OperationStats]]) -> str:
+        """Format the slow-operations report for a non-empty _find_slow_operations result."""
         threshold_ms = int(self.slow_operation_threshold * 1000)
         lines = [f"Slow operations detected (threshold: {threshold_ms}ms):"]
-        for operation, avg_duration in slow_ops:
-            stats = self.stats[operation]
+        for operation, avg_duration, stats in slow_ops:
             lines.append(
                 f"  - {operation}: avg={avg_duration * 1000:.0f}ms, "
                 f"min={stats.min_duration * 1000:.0f}ms, "
@@ -199,11 +284,12 @@ class PerformanceMonitor:
         Returns:
             Human-readable summary string
         """
-        if not self.stats:
+        items = self._snapshot()
+        if not items:
             return "No performance metrics recorded."
 
         lines = ["Performance Summary:"]
-        for name, stats in sorted(self.stats.items()):
+        for name, stats in sorted(items, key=itemgetter(0)):
             lines.append(
                 f"  {name}: avg={stats.average_duration * 1000:.2f}ms, "
                 f"min={stats.min_duration * 1000:.2f}ms, "
@@ -211,16 +297,19 @@ class PerformanceMonitor:
                 f"calls={stats.total_calls}"
             )
 
-        slow_ops = self.get_slow_operations()
+        # Format the slow operations found in the same snapshot rather than
+        # scanning again
+        slow_ops = self._find_slow_operations(items)
         if slow_ops:
             lines.append("")
-            lines.append(self.report_slow_operations())
+            lines.append(self._format_slow_operations(slow_ops))
 
         return "\n".join(lines)
 
     def clear(self) -> None:
         """Clear all recorded metrics."""
-        self.stats.clear()
+        with self._create_lock:
+            self.stats.clear()
 
     def get_total_operations(self) -> int:
         """Get total number of operations recorded.
@@ -228,7 +317,7 @@ class PerformanceMonitor:
         Returns:
             Total count of all operation calls
         """
-        return sum(stats.total_calls for stats in self.stats.values())
+        return sum(stats.total_calls for _, stats in self._snapshot())
 
     def get_total_time(self) -> float:
         """Get total time spent in all operations.
@@ -236,4 +325,4 @@ class PerformanceMonitor:
         Returns:
             Total duration in seconds
         """
-        return sum(stats.total_duration for stats in self.stats.values())
+        return sum(stats.total_duration for _, stats in self._snapshot())
@@ -10,9 +10,14 @@ if TYPE_CHECKING:
     from doctk.core import Document, Node
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModifiedRange:
-    """Represents a range of text that was modified by an operation."""
+    """Represents a range of text that was modified by an operation.
+
+    Ranges produced by StructureOperations cover whole lines and are half-open:
+    they start at column 0 of start_line and end at column 0 of end_line, which
+    may be one past the last line. new_text includes its line endings.
+    """
 
     start_line: int
     start_column: int
@@ -21,15 +26,19 @@ class ModifiedRange:
     new_text: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
-    """Result of validating an operation."""
+    """Result of validating an operation.
+
+    Frozen so a single instance can be shared; validators return the same
+    successful result on every call.
+    """
 
     valid: bool
     error: str | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OperationResult:
     """Result of executing a document operation."""
 
@@ -37,6 +46,7 @@ class OperationResult:
     document: str | None = None  # Full document for fallback
     modified_ranges: list[ModifiedRange] | None = None  # Granular edits
     error: str | None = None
+    unchanged: bool = False  # Succeeded without changing the document
 
 
 class DocumentOperation(Protocol):
@@ -116,30 +126,7 @@ class DocumentInterface(ABC):
         pass
 
 
-@dataclass
-class ParameterInfo:
-    """Information about an operation parameter."""
-
-    name: str
-    type: str
-    required: bool
-    description: str
-    default: Any | None = None
-
-
-@dataclass
-class OperationMetadata:
-    """Metadata about a doctk operation."""
-
-    name: str
-    description: str
-    parameters: list[ParameterInfo] = field(default_factory=list)
-    return_type: str = "Document"
-    examples: list[str] = field(default_factory=list)
-    category: str = "general"
-
-
-@dataclass
+@dataclass(slots=True)
 class TreeNode:
     """
     Complete tree node with ID generated by backend.
@@ -154,3 +141,29 @@ class TreeNode:
     line: int
     column: int
     children: list[TreeNode] = field(default_factory=list)
+
+
+# Operation metadata types are defined once, in doctk.lsp.registry. The names
+# are resolved lazily (PEP 562) for code that imports them from here, so this
+# module does not load the LSP package at import time.
+_MOVED_TO_REGISTRY = frozenset({"OperationMetadata", "ParameterInfo"})
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve operation metadata types moved to doctk.lsp.registry on first access."""
+    if name not in _MOVED_TO_REGISTRY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import warnings
+
+    from doctk.lsp import registry
+
+    warnings.warn(
+        f"Importing {name} from doctk.integration.protocols is deprecated; "
+        "import it from doctk.lsp.registry",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    value = getattr(registry, name)
+    globals()[name] = value  # Cache so later accesses skip __getattr__
+    return value
@@ -8,7 +8,7 @@ machine-readable documentation.
 from __future__ import annotations
 
 import logging
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from typing import Any
 
 from doctk.lsp.registry import OperationMetadata, OperationRegistry
@@ -79,18 +79,9 @@ class AIAgentSupport:
         for op_name, op_metadata in self.registry.operations.items():
             catalog[op_name] = {
                 "description": op_metadata.description,
-                "parameters": [
-                    {
-                        "name": p.name,
-                        "type": p.type,
-                        "required": p.required,
-                        "description": p.description,
-                        "default": p.default,
-                    }
-                    for p in op_metadata.parameters
-                ],
+                "parameters": [p.to_dict() for p in op_metadata.parameters],
                 "return_type": op_metadata.return_type,
-                "examples": op_metadata.examples,
+                "examples": list(op_metadata.examples),
                 "category": op_metadata.category,
             }
 
@@ -133,7 +124,7 @@ class AIAgentSupport:
             operation=operation,
             summary=metadata.description,
             description=self._get_detailed_description(metadata),
-            parameters=[asdict(p) for p in metadata.parameters],
+            parameters=[p.to_dict() for p in metadata.parameters],
             returns={"type": metadata.return_type, "description": "Modified document"},
             examples=examples,
             related_operations=related_operations[:5],  # Limit to 5
@@ -8,8 +8,11 @@ from __future__ import annotations
 
 import logging
 import re
+import string
+import sys
 import time
 from dataclasses import dataclass
+from typing import Final
 
 from lsprotocol.types import (
     Hover,
@@ -18,10 +21,19 @@ from lsprotocol.types import (
     Position,
 )
 
+from doctk.integration.memory import LRUCache
 from doctk.lsp.registry import OperationMetadata, OperationRegistry, ParameterInfo
 
 logger = logging.getLogger(__name__)
 
+# Characters that can appear in a DSL identifier ([a-zA-Z_][a-zA-Z0-9_]*)
+_IDENT_CHARS = frozenset(string.ascii_letters + string.digits + "_")
+_EQUALS_SUFFIX_RE = re.compile(r"\s*=")
+_IDENT_RE = re.compile(r"[a-zA-Z_][a-zA-Z0-9_]*")
+
+# Sentinel distinguishing a cache miss from a cached None hover
+_CACHE_MISS: Final[object] = object()
+
 
 @dataclass
 class HoverAnalysis:
@@ -36,30 +48,33 @@ class HoverAnalysis:
     parameter_name: str | None = None  # If hovering over parameter
 
 
-@dataclass
-class CachedHover:
-    """Cached hover result with timestamp."""
-
-    hover: Hover | None
-    timestamp: float
-
-
 class HoverProvider:
     """Provides hover documentation for doctk DSL operations and parameters."""
 
-    def __init__(self, registry: OperationRegistry, cache_ttl: float = 5.0):
+    def __init__(
+        self, registry: OperationRegistry, cache_ttl: float = 5.0, max_cache_size: int = 1000
+    ):
         """
         Initialize hover provider.
 
+        Expired entries are removed lazily when they are looked up, and the
+        cache is bounded by LRU eviction, so no periodic sweep is needed.
+
         Args:
             registry: Operation registry for available operations
             cache_ttl: Time-to-live for cached hover results in seconds (default: 5.0)
+            max_cache_size: Maximum number of cached hover results (default: 1000)
         """
         self.registry = registry
-        self.cache: dict[str, CachedHover] = {}
+        # Entries are (hover, timestamp) tuples; hover may be a cached None
+        self.cache = LRUCache[tuple[Hover | None, float]](maxsize=max_cache_size)
         self.cache_ttl = cache_ttl
-        self._cleanup_counter = 0
-        self._cleanup_interval = 100  # Cleanup every 100 operations
+        # Formatted markdown only depends on registry metadata, so it is memoized
+        # independently of the TTL-bound hover cache
+        self._op_md_cache: dict[str, str] = {}
+        self._param_md_cache: dict[tuple[str, str], str] = {}
+        # Snapshot of registered operation names for hot-path membership tests
+        self._op_names = frozenset(registry.get_operation_names())
 
     def provide_hover(self, document: str, position: Position) -> Hover | None:
         """
@@ -75,34 +90,29 @@ class HoverProvider:
         # Analyze position to identify what's under cursor
         analysis = self._analyze_position(document, position)
 
+        # Nothing to show without an identifiable word; not worth caching
+        if not analysis.word:
+            return None
+
+        # Read the clock once; cache timestamps only need monotonic deltas
+        now = time.monotonic()
+
         # Check cache using a sentinel to distinguish cache hit from cached None
         cache_key = self._compute_cache_key(analysis)
-        cache_miss = object()  # Unique sentinel value
-        cached = self._get_cached_hover(cache_key, default=cache_miss)
-        if cached is not cache_miss:
+        cached = self._get_cached_hover(cache_key, now)
+        if cached is not _CACHE_MISS:
             logger.debug(f"Cache hit for hover at {position}")
             return cached
 
-        # Return None if no identifiable word (but cache the result)
-        if not analysis.word:
-            self._cache_hover(cache_key, None)
-            return None
-
         # Generate hover based on what's under cursor
         hover = None
-        if analysis.is_operation and analysis.word:
+        if analysis.is_operation:
             hover = self._create_operation_hover(analysis.word)
         elif analysis.is_parameter and analysis.parameter_name and analysis.operation_name:
             hover = self._create_parameter_hover(analysis.operation_name, analysis.parameter_name)
 
         # Cache the result (even if None)
-        self._cache_hover(cache_key, hover)
-
-        # Periodic automatic cache cleanup to prevent unbounded growth
-        self._cleanup_counter += 1
-        if self._cleanup_counter >= self._cleanup_interval:
-            self.cleanup_expired_cache()
-            self._cleanup_counter = 0
+        self._cache_hover(cache_key, hover, now)
 
         return hover
 
@@ -131,23 +141,28 @@ class HoverProvider:
 
         line_text = lines[position.line]
 
-        # Find the word under cursor
-        # Word boundaries: whitespace, |, (, ), =
-        word_pattern = r"[a-zA-Z_][a-zA-Z0-9_]*"
-
-        # Find all words in the line
-        matches = list(re.finditer(word_pattern, line_text))
-
-        # Find which word the cursor is on
-        current_word = ""
-        current_word_match = None
-        for match in matches:
-            if match.start() <= position.character <= match.end():
-                current_word = match.group()
-                current_word_match = match
-                break
-
-        if not current_word:
+        # Find the word under cursor by scanning outward from the cursor.
+        # The cursor counts as on a word if it sits inside it or just after it.
+        cursor = position.character
+        line_length = len(line_text)
+        if cursor < line_length and line_text[cursor] in _IDENT_CHARS:
+            word_start = cursor
+        elif 0 < cursor <= line_length and line_text[cursor - 1] in _IDENT_CHARS:
+            word_start = cursor - 1
+        else:
+            word_start = -1  # Whitespace or punctuation: nothing to hover
+
+        word_end = word_start + 1
+        if word_start >= 0:
+            while word_start > 0 and line_text[word_start - 1] in _IDENT_CHARS:
+                word_start -= 1
+            while word_end < line_length and line_text[word_end] in _IDENT_CHARS:
+                word_end += 1
+            # Identifiers cannot start with a digit
+            while word_start < word_end and line_text[word_start] in string.digits:
+                word_start += 1
+
+        if word_start < 0 or word_start == word_end or cursor < word_start:
             return HoverAnalysis(
                 line=position.line,
                 character=position.character,
@@ -156,6 +171,10 @@ class HoverProvider:
                 is_parameter=False,
             )
 
+        # Interned so the registry and documentation cache lookups made with
+        # this word hit the interned registry keys by identity
+        current_word = sys.intern(line_text[word_start:word_end])
+
         # Determine if it's an operation or parameter
         # Get text before the word
         text_before = line_text[: position.character]
@@ -174,12 +193,7 @@ class HoverProvider:
         else:
             # Check if current_word is followed by = (parameter name pattern)
             # Search only from the end of the current word to avoid matching duplicates
-            word_followed_by_equals = False
-            if current_word_match:
-                text_after_word = line_text[current_word_match.end() :]
-                word_followed_by_equals = bool(re.match(r"^\s*=", text_after_word))
-
-            if word_followed_by_equals:
+            if _EQUALS_SUFFIX_RE.match(line_text, word_end):
                 # This is a parameter name
                 is_parameter = True
                 parameter_name = current_word
@@ -190,7 +204,7 @@ class HoverProvider:
                     lines, position.line, text_before
                 )
             # Check if it's an operation
-            elif self.registry.operation_exists(current_word):
+            elif current_word in self._op_names:
                 is_operation = True
 
         return HoverAnalysis(
@@ -236,14 +250,10 @@ class HoverProvider:
                     # No pipe yet - prepend entire line
                     text_to_search = prev_line + "\n" + text_to_search
 
-        # Find all identifiers in the text after pipe
-        # Match all words (identifiers) in the text
-        all_identifiers: list[str] = re.findall(r"[a-zA-Z_][a-zA-Z0-9_]*", text_to_search)
-
         # Validate identifiers right-to-left to find the last valid operation
         # This handles cases like "junk where level=2" -> finds "where" not "junk"
-        for identifier in reversed(all_identifiers):
-            if self.registry.operation_exists(identifier):
+        for identifier in reversed(_IDENT_RE.findall(text_to_search)):
+            if identifier in self._op_names:
                 return identifier
 
         return None
@@ -264,7 +274,10 @@ class HoverProvider:
             return None
 
         # Format hover content
-        content = self._format_operation_documentation(metadata)
+        content = self._op_md_cache.get(operation_name)
+        if content is None:
+            content = self._format_operation_documentation(metadata)
+            self._op_md_cache[operation_name] = content
 
         return Hover(contents=MarkupContent(kind=MarkupKind.Markdown, value=content))
 
@@ -279,6 +292,10 @@ class HoverProvider:
         Returns:
             Hover with formatted parameter documentation or None if not found
         """
+        content = self._param_md_cache.get((operation_name, parameter_name))
+        if content is not None:
+            return Hover(contents=MarkupContent(kind=MarkupKind.Markdown, value=content))
+
         # Get operation metadata
         metadata = self.registry.get_operation(operation_name)
         if not metadata:
@@ -296,6 +313,7 @@ class HoverProvider:
 
         # Format parameter documentation
         content = self._format_parameter_documentation(param_info, operation_name)
+        self._param_md_cache[(operation_name, parameter_name)] = content
 
         return Hover(contents=MarkupContent(kind=MarkupKind.Markdown, value=content))
 
@@ -407,13 +425,16 @@ class HoverProvider:
         else:
             return f"unknown:{analysis.word}"
 
-    def _get_cached_hover(self, cache_key: str, default: object = None) -> Hover | None | object:
+    def _get_cached_hover(
+        self, cache_key: str, now: float, default: object = _CACHE_MISS
+    ) -> Hover | None | object:
         """
         Get cached hover if not expired.
 
         Args:
             cache_key: Cache key
-            default: Value to return if not found or expired (default: None)
+            now: Current time from time.monotonic()
+            default: Value to return if not found or expired (default: _CACHE_MISS)
 
         Returns:
             Cached hover, default value if expired/not found
@@ -422,41 +443,48 @@ class HoverProvider:
         if cached is None:
             return default
 
-        age = time.time() - cached.timestamp
+        hover, timestamp = cached
 
         # Check if expired
-        if age > self.cache_ttl:
-            del self.cache[cache_key]
+        if now - timestamp > self.cache_ttl:
+            self.cache.remove(cache_key)
             return default
 
-        return cached.hover
+        return hover
 
-    def _cache_hover(self, cache_key: str, hover: Hover | None) -> None:
+    def _cache_hover(self, cache_key: str, hover: Hover | None, now: float) -> None:
         """
         Cache hover result.
 
         Args:
             cache_key: Cache key
             hover: Hover to cache (can be None)
+            now: Current time from time.monotonic()
         """
-        self.cache[cache_key] = CachedHover(
-            hover=hover,
-            timestamp=time.time(),
-        )
+        self.cache.put(cache_key, (hover, now))
 
     def clear_cache(self) -> None:
-        """Clear all cached hover results."""
+        """
+        Clear all cached hover results and formatted documentation.
+
+        Also re-reads the operation names from the registry, so this should be
+        called after the registry's operations change.
+        """
         self.cache.clear()
+        self._op_md_cache.clear()
+        self._param_md_cache.clear()
+        self._op_names = frozenset(self.registry.get_operation_names())
 
     def cleanup_expired_cache(self) -> None:
         """
         Remove all expired entries from cache.
 
-        This should be called periodically to prevent unbounded memory growth.
-        Iterates over a copy of cache items in a single pass for efficiency.
+        Expired entries are also dropped lazily when looked up, so this is only
+        needed to reclaim entries that are never requested again. Reading an
+        entry moves it to the recent end without refreshing its timestamp, so
+        expired entries can sit anywhere in the cache and every entry is checked.
         """
-        current_time = time.time()
-        # Iterate over copy to avoid modification during iteration
-        for key, cached in list(self.cache.items()):
-            if current_time - cached.timestamp > self.cache_ttl:
-                del self.cache[key]
+        current_time = time.monotonic()
+        for key, (_, timestamp) in self.cache.items():
+            if current_time - timestamp > self.cache_ttl:
+                self.cache.remove(key)
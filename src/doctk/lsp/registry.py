@@ -9,13 +9,14 @@ from __future__ import annotations
 
 import inspect
 import logging
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParameterInfo:
     """Information about an operation parameter."""
 
@@ -25,16 +26,38 @@ class ParameterInfo:
     description: str
     default: Any = None
 
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert parameter to dictionary.
+
+        Written out field by field rather than via dataclasses.asdict, which
+        walks the fields reflectively and deep-copies the default.
+
+        Returns:
+            Dictionary representation of the parameter
+        """
+        return {
+            "name": self.name,
+            "type": self.type,
+            "required": self.required,
+            "description": self.description,
+            "default": self.default,
+        }
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class OperationMetadata:
-    """Metadata for a doctk operation."""
+    """Metadata for a doctk operation.
+
+    Immutable, so the parameter and example tuples can be shared with
+    _OPERATION_METADATA and handed to every LSP feature without copying.
+    """
 
     name: str
     description: str
-    parameters: list[ParameterInfo] = field(default_factory=list)
+    parameters: tuple[ParameterInfo, ...] = ()
     return_type: str = "Document"
-    examples: list[str] = field(default_factory=list)
+    examples: tuple[str, ...] = ()
     category: str = "general"
 
 
@@ -44,133 +67,133 @@ _OPERATION_METADATA: dict[str, dict[str, Any]] = {
     "select": {
         "description": "Select nodes matching a predicate",
         "category": "selection",
-        "parameters": [
+        "parameters": (
             ParameterInfo(
                 name="predicate",
                 type="Callable[[Node], bool]",
                 required=True,
                 description="Function that returns True for nodes to select",
-            )
-        ],
-        "examples": [
+            ),
+        ),
+        "examples": (
             "doc | select heading",
             "doc | select paragraph",
-        ],
+        ),
     },
     "where": {
         "description": "Filter nodes by attribute conditions",
         "category": "selection",
-        "parameters": [
+        "parameters": (
             ParameterInfo(
                 name="conditions",
                 type="dict",
                 required=False,
                 description="Key-value pairs to match (e.g., level=2, text='foo')",
-            )
-        ],
-        "examples": [
+            ),
+        ),
+        "examples": (
             "doc | where level=2",
             "doc | where text='Introduction'",
-        ],
+        ),
     },
     "promote": {
         "description": "Promote heading levels (h3 -> h2)",
         "category": "structure",
-        "parameters": [],
-        "examples": ["doc | select heading | promote()"],
+        "parameters": (),
+        "examples": ("doc | select heading | promote()",),
     },
     "demote": {
         "description": "Demote heading levels (h2 -> h3)",
         "category": "structure",
-        "parameters": [],
-        "examples": ["doc | select heading | demote()"],
+        "parameters": (),
+        "examples": ("doc | select heading | demote()",),
     },
     "lift": {
         "description": "Lift sections up (alias for promote)",
         "category": "structure",
-        "parameters": [],
-        "examples": ["doc | select heading | lift()"],
+        "parameters": (),
+        "examples": ("doc | select heading | lift()",),
     },
     "lower": {
         "description": "Lower sections down (alias for demote)",
         "category": "structure",
-        "parameters": [],
-        "examples": ["doc | select heading | lower()"],
+        "parameters": (),
+        "examples": ("doc | select heading | lower()",),
     },
     "nest": {
         "description": "Nest sections under a target section",
         "category": "structure",
-        "parameters": [
+        "parameters": (
             ParameterInfo(
                 name="under",
                 type="str | None",
                 required=False,
                 description="Target section identifier (default: previous section)",
                 default=None,
-            )
-        ],
-        "examples": ["doc | select heading | nest()"],
+            ),
+        ),
+        "examples": ("doc | select heading | nest()",),
     },
     "unnest": {
         "description": "Remove nesting (alias for promote)",
         "category": "structure",
-        "parameters": [],
-        "examples": ["doc | select heading | unnest()"],
+        "parameters": (),
+        "examples": ("doc | select heading | unnest()",),
     },
     "heading": {
         "description": "Select all heading nodes",
         "category": "selection",
-        "parameters": [],
-        "examples": ["doc | heading"],
+        "parameters": (),
+        "examples": ("doc | heading",),
     },
     "paragraph": {
         "description": "Select all paragraph nodes",
         "category": "selection",
-        "parameters": [],
-        "examples": ["doc | paragraph"],
+        "parameters": (),
+        "examples": ("doc | paragraph",),
     },
     "compose": {
         "description": "Compose operations right-to-left",
         "category": "composition",
-        "parameters": [
+        "parameters": (
             ParameterInfo(
                 name="operations",
                 type="*Callable",
                 required=True,
                 description="Operations to compose",
-            )
-        ],
-        "examples": ["compose(promote, select(heading))"],
+            ),
+        ),
+        "examples": ("compose(promote, select(heading))",),
     },
     "first": {
         "description": "Take first element",
         "category": "selection",
-        "parameters": [],
-        "examples": ["doc | select heading | first()"],
+        "parameters": (),
+        "examples": ("doc | select heading | first()",),
     },
     "last": {
         "description": "Take last element",
         "category": "selection",
-        "parameters": [],
-        "examples": ["doc | select heading | last()"],
+        "parameters": (),
+        "examples": ("doc | select heading | last()",),
     },
     "nth": {
         "description": "Take nth element (0-indexed)",
         "category": "selection",
-        "parameters": [
+        "parameters": (
             ParameterInfo(
                 name="n",
                 type="int",
                 required=True,
                 description="Index of element to take",
-            )
-        ],
-        "examples": ["doc | select heading | nth(2)"],
+            ),
+        ),
+        "examples": ("doc | select heading | nth(2)",),
     },
     "slice_nodes": {
         "description": "Take slice of nodes",
         "category": "selection",
-        "parameters": [
+        "parameters": (
             ParameterInfo(
                 name="start",
                 type="int",
@@ -184,96 +207,96 @@ _OPERATION_METADATA: dict[str, dict[str, Any]] = {
                 description="End index (optional)",
                 default=None,
             ),
-        ],
-        "examples": ["doc | select heading | slice_nodes(0, 5)"],
+        ),
+        "examples": ("doc | select heading | slice_nodes(0, 5)",),
     },
     "is_heading": {
         "description": "Check if node is a heading",
         "category": "predicates",
-        "parameters": [],
-        "examples": ["doc | select(is_heading)"],
+        "parameters": (),
+        "examples": ("doc | select(is_heading)",),
     },
     "is_paragraph": {
         "description": "Check if node is a paragraph",
         "category": "predicates",
-        "parameters": [],
-        "examples": ["doc | select(is_paragraph)"],
+        "parameters": (),
+        "examples": ("doc | select(is_paragraph)",),
     },
     "is_list": {
         "description": "Check if node is a list",
         "category": "predicates",
-        "parameters": [],
-        "examples": ["doc | select(is_list)"],
+        "parameters": (),
+        "examples": ("doc | select(is_list)",),
     },
     "is_code_block": {
         "description": "Check if node is a code block",
         "category": "predicates",
-        "parameters": [],
-        "examples": ["doc | select(is_code_block)"],
+        "parameters": (),
+        "examples": ("doc | select(is_code_block)",),
     },
     "matches": {
         "description": "Create predicate that matches text content against pattern",
         "category": "predicates",
-        "parameters": [
+        "parameters": (
             ParameterInfo(
                 name="pattern",
                 type="str",
                 required=True,
                 description="Pattern to match",
-            )
-        ],
-        "examples": ["doc | select(matches('TODO'))"],
+            ),
+        ),
+        "examples": ("doc | select(matches('TODO'))",),
     },
     "contains": {
         "description": "Alias for matches (more readable)",
         "category": "predicates",
-        "parameters": [
+        "parameters": (
             ParameterInfo(
                 name="substring",
                 type="str",
                 required=True,
                 description="Substring to search for",
-            )
-        ],
-        "examples": ["doc | select(contains('important'))"],
+            ),
+        ),
+        "examples": ("doc | select(contains('important'))",),
     },
     "to_ordered": {
         "description": "Convert lists to ordered",
         "category": "structure",
-        "parameters": [],
-        "examples": ["doc | select(is_list) | to_ordered()"],
+        "parameters": (),
+        "examples": ("doc | select(is_list) | to_ordered()",),
     },
     "to_unordered": {
         "description": "Convert lists to unordered",
         "category": "structure",
-        "parameters": [],
-        "examples": ["doc | select(is_list) | to_unordered()"],
+        "parameters": (),
+        "examples": ("doc | select(is_list) | to_unordered()",),
     },
     "count": {
         "description": "Count nodes in document",
         "category": "utility",
-        "parameters": [],
-        "examples": ["doc | select heading | count()"],
+        "parameters": (),
+        "examples": ("doc | select heading | count()",),
         "return_type": "int",
     },
     "extract": {
         "description": "Extract nodes as list",
         "category": "utility",
-        "parameters": [],
-        "examples": ["doc | select heading | extract()"],
+        "parameters": (),
+        "examples": ("doc | select heading | extract()",),
         "return_type": "list",
     },
     "code_block": {
         "description": "Select all code block nodes",
         "category": "selection",
-        "parameters": [],
-        "examples": ["doc | code_block"],
+        "parameters": (),
+        "examples": ("doc | code_block",),
     },
     "list_node": {
         "description": "Select all list nodes",
         "category": "selection",
-        "parameters": [],
-        "examples": ["doc | list_node"],
+        "parameters": (),
+        "examples": ("doc | list_node",),
     },
 }
 
@@ -284,6 +307,10 @@ class OperationRegistry:
     def __init__(self) -> None:
         """Initialize the operation registry."""
         self.operations: dict[str, OperationMetadata] = {}
+        # Operations grouped by category, maintained by _register
+        self._by_category: dict[str, list[OperationMetadata]] = {}
+        # (casefolded name, casefolded description, metadata) for search_operations
+        self._search_corpus: list[tuple[str, str, OperationMetadata]] = []
         self._load_operations_from_doctk()
 
     def _load_operations_from_doctk(self) -> None:
@@ -291,10 +318,13 @@ class OperationRegistry:
         try:
             import doctk.operations as ops_module
 
-            # Dynamically discover all callable operations in the module
-            for name, obj in inspect.getmembers(ops_module, callable):
-                # Skip private members and imports
-                if name.startswith("_"):
+            # Dynamically discover all callable operations in the module. The
+            # module namespace is read directly rather than via inspect.getmembers,
+            # which resolves and sorts every attribute; operations register in
+            # definition order.
+            for name, obj in vars(ops_module).items():
+                # Skip private members and non-callables
+                if name.startswith("_") or not callable(obj):
                     continue
 
                 # Skip type objects and classes (they're not operations)
@@ -302,39 +332,53 @@ class OperationRegistry:
                     continue
 
                 # Skip imports from other modules (check if defined in this module)
-                if hasattr(obj, "__module__") and obj.__module__ != "doctk.operations":
+                if getattr(obj, "__module__", "doctk.operations") != "doctk.operations":
                     continue
 
-                # Get basic metadata from the function
-                description = self._extract_description(obj)
-                category = "general"
-                parameters: list[ParameterInfo] = []
-                examples: list[str] = []
-                return_type = "Document"
-
-                # Enrich with static metadata if available
-                if name in _OPERATION_METADATA:
-                    metadata = _OPERATION_METADATA[name]
-                    description = metadata.get("description", description)
-                    category = metadata.get("category", category)
-                    parameters = metadata.get("parameters", parameters)
-                    examples = metadata.get("examples", examples)
-                    return_type = metadata.get("return_type", return_type)
-
-                # Register the operation
-                self.operations[name] = OperationMetadata(
-                    name=name,
-                    description=description,
-                    parameters=parameters,
-                    return_type=return_type,
-                    examples=examples,
-                    category=category,
+                # Static metadata if available, otherwise defaults
+                metadata = _OPERATION_METADATA.get(name, {})
+                category = metadata.get("category", "general")
+                parameters: tuple[ParameterInfo, ...] = metadata.get("parameters", ())
+                examples: tuple[str, ...] = metadata.get("examples", ())
+                return_type = metadata.get("return_type", "Document")
+
+                # Fall back to the function's docstring only when the static
+                # table has no description, which is rare
+                description = metadata.get("description")
+                if description is None:
+                    description = self._extract_description(obj)
+
+                # Register the operation (interned so lookups with interned
+                # names compare by identity)
+                name = sys.intern(name)
+                self._register(
+                    OperationMetadata(
+                        name=name,
+                        description=description,
+                        parameters=parameters,
+                        return_type=return_type,
+                        examples=examples,
+                        category=category,
+                    )
                 )
 
         except ImportError:
             # doctk.operations not available - registry will be empty
             logger.warning("Could not import 'doctk.operations'. Operation registry will be empty.")
 
+    def _register(self, metadata: OperationMetadata) -> None:
+        """
+        Add an operation and index it for category lookups and search.
+
+        Args:
+            metadata: Metadata of the operation to register
+        """
+        self.operations[metadata.name] = metadata
+        self._by_category.setdefault(metadata.category, []).append(metadata)
+        self._search_corpus.append(
+            (metadata.name.casefold(), metadata.description.casefold(), metadata)
+        )
+
     def _extract_description(self, obj: Any) -> str:
         """
         Extract description from a function's docstring.
@@ -383,7 +427,8 @@ class OperationRegistry:
         Returns:
             List of operations in the category
         """
-        return [op for op in self.operations.values() if op.category == category]
+        # Copy of the precomputed group, so callers cannot alter the index
+        return list(self._by_category.get(category, ()))
 
     def search_operations(self, query: str) -> list[OperationMetadata]:
         """
@@ -400,12 +445,14 @@ class OperationRegistry:
             >>> results = registry.search_operations("head")
             >>> # Returns operations with "head" in name or description
         """
-        query_lower = query.lower()
-        results = []
-        for op in self.operations.values():
-            if query_lower in op.name.lower() or query_lower in op.description.lower():
-                results.append(op)
-        return results
+        # Names and descriptions were casefolded once at registration; casefold
+        # rather than lower so caseless matching also holds for non-ASCII text
+        query_folded = query.casefold()
+        return [
+            op
+            for name, description, op in self._search_corpus
+            if query_folded in name or query_folded in description
+        ]
 
     def get_operation_names(self) -> list[str]:
         """
@@ -89,6 +89,10 @@ class DoctkLanguageServer(LanguageServer):  # type: ignore[misc]
         self.completion_provider = CompletionProvider(self.registry)
         self.hover_provider = HoverProvider(self.registry)
         self.ai_support = AIAgentSupport(self.registry)
+        # Signature help is requested on every keystroke inside a call, and its
+        # content only depends on registry metadata, so it is built once per
+        # operation
+        self._signature_cache: dict[str, SignatureInformation] = {}
 
         # Register handlers
         self._register_handlers()
@@ -513,6 +517,49 @@ class DoctkLanguageServer(LanguageServer):  # type: ignore[misc]
 
         return diagnostics
 
+    def _signature_information(self, operation_name: str) -> SignatureInformation | None:
+        """
+        Get the signature information for an operation, building it on first use.
+
+        Args:
+            operation_name: Name of the operation
+
+        Returns:
+            Signature information or None if the operation is not registered
+        """
+        signature = self._signature_cache.get(operation_name)
+        if signature is not None:
+            return signature
+
+        # Get operation metadata
+        operation = self.registry.get_operation(operation_name)
+        if not operation:
+            return None
+
+        # Build signature information
+        params_str = ", ".join(
+            f"{p.name}: {p.type}" + (f" = {p.default}" if p.default is not None else "")
+            for p in operation.parameters
+        )
+
+        signature_label = f"{operation_name}({params_str})"
+
+        # Create parameter information
+        parameters = [
+            ParameterInformation(label=p.name, documentation=f"{p.description} (type: {p.type})")
+            for p in operation.parameters
+        ]
+
+        signature = SignatureInformation(
+            label=signature_label,
+            documentation=operation.description,
+            parameters=parameters if parameters else None,
+        )
+        # Only registered operations are cached, so arbitrary words under the
+        # cursor cannot grow the cache
+        self._signature_cache[operation_name] = signature
+        return signature
+
     def provide_signature_help(self, text: str, position: Position) -> SignatureHelp | None:
         """
         Provide signature help for operation at cursor position.
@@ -564,33 +611,10 @@ class DoctkLanguageServer(LanguageServer):  # type: ignore[misc]
                     return None
                 operation_name = match.group(1)
 
-            # Get operation metadata
-            operation = self.registry.get_operation(operation_name)
-            if not operation:
+            signature = self._signature_information(operation_name)
+            if signature is None:
                 return None
 
-            # Build signature information
-            params_str = ", ".join(
-                f"{p.name}: {p.type}" + (f" = {p.default}" if p.default is not None else "")
-                for p in operation.parameters
-            )
-
-            signature_label = f"{operation_name}({params_str})"
-
-            # Create parameter information
-            parameters = [
-                ParameterInformation(
-                    label=p.name, documentation=f"{p.description} (type: {p.type})"
-                )
-                for p in operation.parameters
-            ]
-
-            signature = SignatureInformation(
-                label=signature_label,
-                documentation=operation.description,
-                parameters=parameters if parameters else None,
-            )
-
             return SignatureHelp(signatures=[signature], active_signature=0, active_parameter=0)
 
         except Exception as e:
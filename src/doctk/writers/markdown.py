@@ -38,6 +38,12 @@ class MarkdownWriter(NodeVisitor):
             node.accept(self)
         return "\n".join(self.output)
 
+    def write_node(self, node: Node) -> str:
+        """Convert a single node to Markdown (same as writing a one-node document)."""
+        self.output = []
+        node.accept(self)
+        return "\n".join(self.output)
+
     def visit_heading(self, node: Heading) -> None:
         """Write heading."""
         prefix = "#" * node.level
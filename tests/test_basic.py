@@ -181,3 +181,12 @@ More content.
     doc2 = Document.from_string(output)
 
     assert len(doc) == len(doc2)
+
+
+def test_write_node_matches_single_node_document():
+    """Test that writing one node equals writing a one-node document."""
+    from doctk.writers.markdown import MarkdownWriter
+
+    writer = MarkdownWriter()
+    for node in Document.from_string("# Title\n\nText.\n\n- a\n- b\n").nodes:
+        assert writer.write_node(node) == Document([node]).to_string()
@@ -137,6 +137,15 @@ class TestExecutor:
         assert len(subsection_nodes) == 1
         assert subsection_nodes[0].level == 2
 
+    def test_execute_noop_operation_keeps_document(self, sample_document):
+        """Test that a no-op operation returns the input document without re-parsing."""
+        ast = Parser(Lexer("doc | promote h1-0").tokenize()).parse()
+
+        executor = Executor(sample_document)
+        result = executor.execute(ast)
+
+        assert result is sample_document
+
     def test_execute_assignment(self, sample_document):
         """Test executing an assignment."""
         # Parse: let x = doc | promote h2-0
@@ -8,6 +8,7 @@ import pytest
 
 from doctk.core import Document, Heading
 from doctk.dsl.repl import REPL
+from doctk.integration.operations import DocumentTreeBuilder
 
 
 @pytest.fixture
@@ -56,6 +57,15 @@ class TestREPLBasics:
         assert repl_instance.tree_builder is not None
         assert len(repl_instance.document.nodes) == 4
 
+    def test_load_document_shares_tree_builder_with_operations(
+        self, repl_instance, temp_markdown_file
+    ):
+        """Test operations on the loaded document reuse the REPL's tree builder."""
+        repl_instance.load_document(temp_markdown_file)
+
+        builder = DocumentTreeBuilder.for_document(repl_instance.document)
+        assert builder is repl_instance.tree_builder
+
     def test_load_document_nonexistent_file(self, repl_instance, capsys):
         """Test loading a nonexistent file."""
         with patch("doctk.dsl.repl.console") as mock_console:
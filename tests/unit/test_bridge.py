@@ -1,5 +1,8 @@
 """Tests for the ExtensionBridge JSON-RPC interface."""
 
+import io
+import json
+
 from doctk.integration.bridge import ExtensionBridge
 
 
@@ -29,6 +32,31 @@ class TestExtensionBridge:
         assert "# Title" in response["result"]["document"]
         assert "# Section" in response["result"]["document"]  # h2 -> h1
 
+    def test_handle_noop_promote_reports_unchanged(self):
+        """Test a no-op operation is flagged so the extension can skip applying an edit."""
+        doc_text = "# Title\n\n## Section\n"
+
+        noop = self.bridge.handle_request(
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "promote",
+                "params": {"document": doc_text, "node_id": "h1-0"},
+            }
+        )
+        changed = self.bridge.handle_request(
+            {
+                "jsonrpc": "2.0",
+                "id": 2,
+                "method": "promote",
+                "params": {"document": doc_text, "node_id": "h2-0"},
+            }
+        )
+
+        assert noop["result"]["success"] is True
+        assert noop["result"]["unchanged"] is True
+        assert changed["result"]["unchanged"] is False
+
     def test_handle_demote_request(self):
         """Test handling a demote operation request."""
         doc_text = "# Title\n"
@@ -226,6 +254,28 @@ class TestExtensionBridge:
         assert response["result"]["success"] is False
         assert "not found" in response["result"]["error"].lower()
 
+    def test_run_writes_one_compact_line_per_request(self, monkeypatch, capsys):
+        """Test run emits each response as one compact JSON line."""
+        requests = [
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "promote",
+                "params": {"document": "## Title\n", "node_id": "h2-0"},
+            },
+        ]
+        stdin = io.StringIO("".join(json.dumps(r) + "\n" for r in requests) + "not json\n")
+        monkeypatch.setattr("sys.stdin", stdin)
+
+        self.bridge.run()
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0] == "BRIDGE_READY"
+        assert json.loads(lines[1])["result"]["success"] is True
+        assert json.loads(lines[2])["error"]["code"] == -32700
+        assert '": ' not in lines[1]
+        assert len(lines) == 3
+
 
 class TestExtensionBridgeIntegration:
     """Integration tests for ExtensionBridge with complex scenarios."""
@@ -352,6 +402,34 @@ class TestExtensionBridgeIntegration:
         # Should stay at h6
         assert "###### Deepest" in demote_response["result"]["document"]
 
+    def test_validation_and_operation_share_parsed_document(self):
+        """Test requests on unchanged text reuse one parse; new text is reparsed."""
+        doc_text = "# Title\n\n## Section\n"
+
+        first = self.bridge._parse_document(doc_text)
+        assert self.bridge._parse_document(doc_text) is first
+
+        validate_request = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "validate_promote",
+            "params": {"document": doc_text, "node_id": "h2-0"},
+        }
+        assert self.bridge.handle_request(validate_request)["result"]["valid"] is True
+        assert self.bridge._parse_document(doc_text) is first
+
+        promote_request = {
+            "jsonrpc": "2.0",
+            "id": 2,
+            "method": "promote",
+            "params": {"document": doc_text, "node_id": "h2-0"},
+        }
+        result = self.bridge.handle_request(promote_request)["result"]
+        assert "# Section" in result["document"]
+        # The operation did not change the Document it was given
+        assert first.nodes[1].level == 2
+        assert self.bridge._parse_document(result["document"]) is not first
+
     def test_error_recovery(self):
         """Test that bridge continues working after errors."""
         doc_text = "# Title\n"
@@ -4,6 +4,10 @@ These tests verify that the LSP integration layer properly uses the doctk
 core API and that all operations are consistent with doctk abstractions.
 """
 
+import warnings
+
+import pytest
+
 from doctk.core import Document, Heading, Paragraph
 from doctk.lsp import (
     CompatibilityChecker,
@@ -417,6 +421,29 @@ class TestAPIStability:
         for export in required_exports:
             assert hasattr(lsp, export), f"Missing required export: {export}"
 
+    def test_lsp_reexports_are_integration_objects(self):
+        """Test that integration items re-exported from doctk.lsp are the same objects."""
+        from doctk import integration, lsp
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            manager_cls = lsp.DocumentStateManager
+
+        assert manager_cls is integration.DocumentStateManager
+
+    def test_protocols_metadata_types_resolve_to_registry(self):
+        """Test that metadata types imported from protocols are the registry's."""
+        from doctk.integration import protocols
+        from doctk.lsp import registry
+
+        protocols.__dict__.pop("ParameterInfo", None)
+        with pytest.warns(DeprecationWarning, match="doctk.lsp.registry"):
+            parameter_cls = protocols.ParameterInfo
+
+        assert parameter_cls is registry.ParameterInfo
+        with pytest.raises(AttributeError):
+            protocols.NotAProtocol  # noqa: B018
+
     def test_operation_signatures_stable(self):
         """Test that operation signatures are stable."""
         # Key operations should maintain their signatures
@@ -205,3 +205,70 @@ class TestDocumentIndexing:
         assert doc.find_node(item1b.id) == item1b
         assert doc.find_node(item2a.id) == item2a
         assert doc.find_node(item2b.id) == item2b
+
+    def test_set_updates_index_incrementally(self):
+        """Test that set() indexes the new subtree and drops the replaced one."""
+        old_item = ListItem(content=[Paragraph(content="Old")])
+        old_item.id = NodeId.from_node(old_item)
+        old_list = List(ordered=False, items=[old_item])
+        old_list.id = NodeId.from_node(old_list)
+
+        new_item = ListItem(content=[Paragraph(content="New")])
+        new_item.id = NodeId.from_node(new_item)
+        new_list = List(ordered=False, items=[new_item])
+        new_list.id = NodeId.from_node(new_list)
+
+        heading = Heading(level=1, text="Title")
+        heading.id = NodeId.from_node(heading)
+
+        doc = Document([heading, old_list])
+        updated = doc.set(1, new_list)
+
+        assert updated.nodes == [heading, new_list]
+        assert updated._id_index == Document(updated.nodes)._id_index
+        assert updated.find_node(old_item.id) is None
+        assert updated.find_node(new_item.id) is new_item
+        # The original document is unchanged
+        assert doc.nodes == [heading, old_list]
+        assert doc.find_node(old_item.id) is old_item
+
+    def test_set_accepts_negative_index(self):
+        """Test that set() replaces the node at a negative index like list assignment."""
+        first = Heading(level=1, text="First")
+        last = Heading(level=2, text="Last")
+        doc = Document([first, last])
+
+        updated = doc.set(-1, last.promote())
+
+        assert updated.nodes == [first, Heading(level=1, text="Last")]
+        assert updated._id_index == Document(updated.nodes)._id_index
+
+    def test_splice_reorders_and_removes_nodes(self):
+        """Test that splice() keeps the index consistent with a full rebuild."""
+        nodes = []
+        for text in ("A", "B", "C"):
+            heading = Heading(level=2, text=text)
+            heading.id = NodeId.from_node(heading)
+            nodes.append(heading)
+        doc = Document(nodes)
+
+        swapped = doc.splice(0, 2, [nodes[1], nodes[0]])
+        removed = doc.splice(1, 3, [])
+
+        assert swapped.nodes == [nodes[1], nodes[0], nodes[2]]
+        assert swapped._id_index == Document(swapped.nodes)._id_index
+        assert removed.nodes == [nodes[0]]
+        assert removed._id_index == Document(removed.nodes)._id_index
+
+    def test_splice_inserts_without_changing_original(self):
+        """Test that an empty span inserts items and leaves the source document intact."""
+        first = Heading(level=1, text="First")
+        last = Heading(level=1, text="Last")
+        middle = Heading(level=2, text="Middle")
+        doc = Document([first, last])
+
+        inserted = doc.splice(1, 1, [middle])
+
+        assert inserted.nodes == [first, middle, last]
+        assert inserted.nodes is not doc.nodes
+        assert doc.nodes == [first, last]
@@ -87,6 +87,7 @@ def mock_registry() -> OperationRegistry:
 
     registry.get_operation = get_operation
     registry.operation_exists = operation_exists
+    registry.get_operation_names = lambda: ["select", "where", "promote"]
 
     return registry
 
@@ -105,8 +106,9 @@ class TestHoverProviderInitialization:
         provider = HoverProvider(mock_registry)
 
         assert provider.registry is mock_registry
-        assert provider.cache == {}
+        assert len(provider.cache) == 0
         assert provider.cache_ttl == 5.0
+        assert provider.cache.maxsize == 1000
 
     def test_init_with_custom_ttl(self, mock_registry: OperationRegistry) -> None:
         """Test initialization with custom cache TTL."""
@@ -163,6 +165,20 @@ class TestPositionAnalysis:
         assert analysis.word == ""
         assert analysis.is_operation is False
 
+    def test_analyze_word_boundaries(self, hover_provider: HoverProvider) -> None:
+        """Test word detection at the end of a word and after leading digits."""
+        # Cursor just past the end of the line still hovers the last word
+        analysis = hover_provider._analyze_position("doc | select", Position(line=0, character=12))
+        assert analysis.word == "select"
+
+        # Identifiers cannot start with a digit
+        document = "doc | 2select"
+        assert hover_provider._analyze_position(document, Position(line=0, character=6)).word == ""
+        assert (
+            hover_provider._analyze_position(document, Position(line=0, character=9)).word
+            == "select"
+        )
+
     def test_analyze_parameter_value(self, hover_provider: HoverProvider) -> None:
         """Test analyzing cursor on parameter value (not name)."""
         document = "doc | where level=2"
@@ -279,6 +295,16 @@ class TestParameterHover:
         # Should indicate which operation this parameter belongs to
         assert "where" in content
 
+    def test_parameter_operation_skips_trailing_junk(self, hover_provider: HoverProvider) -> None:
+        """Test that the operation is the last known identifier before the parameter."""
+        document = "doc | select where 2x junk_1 level=2"
+        position = Position(line=0, character=31)  # On "level"
+
+        analysis = hover_provider._analyze_position(document, position)
+
+        assert analysis.parameter_name == "level"
+        assert analysis.operation_name == "where"
+
     def test_hover_parameter_shows_required_status(self, hover_provider: HoverProvider) -> None:
         """Test parameter hover shows if parameter is required or optional."""
         document = "doc | where level=2"
@@ -383,10 +409,71 @@ class TestHoverCaching:
 
         assert len(provider.cache) == 0
 
+    def test_cleanup_expired_cache_finds_recently_read_expired_entries(
+        self, mock_registry: OperationRegistry
+    ) -> None:
+        """Test that expired entries moved to the recent end by reads are still removed."""
+        provider = HoverProvider(mock_registry, cache_ttl=60.0)
+
+        now = time.monotonic()
+        for i in range(5):
+            provider._cache_hover(f"op:stale{i}", None, now - 120.0)
+        for i in range(30):
+            provider._cache_hover(f"op:fresh{i}", None, now)
+        # Reads move the stale entries behind the fresh ones without refreshing them
+        for i in range(5):
+            provider.cache.get(f"op:stale{i}")
+
+        provider.cleanup_expired_cache()
+
+        assert len(provider.cache) == 30
+        assert all(key.startswith("op:fresh") for key, _ in provider.cache.items())
+
+    def test_cache_is_bounded(self, mock_registry: OperationRegistry) -> None:
+        """Test that the cache evicts least recently used entries when full."""
+        provider = HoverProvider(mock_registry, max_cache_size=2)
+
+        provider.provide_hover("doc | select", Position(line=0, character=8))
+        provider.provide_hover("doc | where", Position(line=0, character=8))
+        provider.provide_hover("doc | promote", Position(line=0, character=8))
+
+        assert len(provider.cache) == 2
+        assert "op:select" not in provider.cache
+        assert "op:promote" in provider.cache
+
+    def test_formatted_documentation_is_memoized(self, hover_provider: HoverProvider) -> None:
+        """Test that markdown is reused after the hover cache entry is gone."""
+        position = Position(line=0, character=8)
+
+        hover1 = hover_provider.provide_hover("doc | select", position)
+        hover_provider.cache.clear()
+        hover2 = hover_provider.provide_hover("doc | select", position)
+
+        assert hover1 is not None
+        assert hover2 is not None
+        assert hover1 is not hover2
+        assert hover1.contents.value is hover2.contents.value
+
+        hover_provider.clear_cache()
+        assert hover_provider._op_md_cache == {}
+
+    def test_clear_cache_refreshes_operation_names(self, mock_registry: OperationRegistry) -> None:
+        """Test that clear_cache picks up operations added to the registry."""
+        provider = HoverProvider(mock_registry)
+        document = "doc | custom"
+        position = Position(line=0, character=8)
+
+        assert provider._analyze_position(document, position).is_operation is False
+
+        mock_registry.get_operation_names = lambda: ["select", "where", "promote", "custom"]
+        provider.clear_cache()
+
+        assert provider._analyze_position(document, position).is_operation is True
+
     def test_cache_none_results(self, hover_provider: HoverProvider) -> None:
         """Test that None results are also cached."""
-        document = "   "  # Empty/whitespace document
-        position = Position(line=0, character=0)
+        document = "doc | unknown_op"
+        position = Position(line=0, character=8)
 
         # First request returns None
         hover1 = hover_provider.provide_hover(document, position)
@@ -399,6 +486,14 @@ class TestHoverCaching:
         hover2 = hover_provider.provide_hover(document, position)
         assert hover2 is None
 
+    def test_no_word_hovers_are_not_cached(self, hover_provider: HoverProvider) -> None:
+        """Test that hovers over whitespace return None without touching the cache."""
+        document = "   "  # Empty/whitespace document
+        position = Position(line=0, character=0)
+
+        assert hover_provider.provide_hover(document, position) is None
+        assert len(hover_provider.cache) == 0
+
 
 class TestHoverFormatting:
     """Test hover content formatting."""
@@ -111,6 +111,21 @@ class TestSignatureHelp:
         # Either is acceptable
         assert result is None or isinstance(result.signatures, list)
 
+    def test_signature_help_built_once_per_operation(self, server: DoctkLanguageServer) -> None:
+        """Test repeated signature help reuses the signature built for an operation."""
+        first = server.provide_signature_help("doc | nest(", Position(line=0, character=11))
+        calls = []
+        original = server.registry.get_operation
+        server.registry.get_operation = lambda name: calls.append(name) or original(name)
+
+        second = server.provide_signature_help("doc | nest(u", Position(line=0, character=12))
+        server.provide_signature_help("doc | bogus(", Position(line=0, character=12))
+
+        assert first is not None and second is not None
+        assert second.signatures[0] is first.signatures[0]
+        assert calls == ["bogus"]
+        assert "bogus" not in server._signature_cache
+
 
 class TestDocumentSymbols:
     """Test document symbols extraction."""
@@ -1,8 +1,40 @@
 """Tests for integration layer structure operations."""
 
-from doctk.core import Document, Heading, Paragraph
+import gc
+from dataclasses import FrozenInstanceError, replace
+
+import pytest
+
+from doctk.core import Document, Heading, ListItem, Node, Paragraph
+from doctk.integration import operations
 from doctk.integration.operations import DocumentTreeBuilder, StructureOperations
 from doctk.integration.protocols import TreeNode
+from doctk.writers.markdown import MarkdownWriter
+
+
+def _apply_with_vscode_clamping(text: str, ranges) -> str:
+    """Apply ranges the way the extension does, via vscode.Position and WorkspaceEdit.
+
+    VS Code clamps a column to the line's length excluding its line ending, and a
+    line past the last one to the end of the document.
+    """
+    lines = text.split("\n")
+
+    def offset(line: int, column: int) -> int:
+        if line >= len(lines):
+            return len(text)
+        return sum(len(before) + 1 for before in lines[:line]) + min(column, len(lines[line]))
+
+    edits = sorted(
+        (
+            (offset(r.start_line, r.start_column), offset(r.end_line, r.end_column), r.new_text)
+            for r in ranges
+        ),
+        reverse=True,
+    )
+    for start, end, new_text in edits:
+        text = text[:start] + new_text + text[end:]
+    return text
 
 
 class TestDocumentTreeBuilder:
@@ -63,6 +95,29 @@ class TestDocumentTreeBuilder:
         index = builder.get_node_index("h2-0")
         assert index == 1
 
+    def test_resolve(self):
+        """Test resolving a node ID to its node and index in one call."""
+        doc = Document(
+            nodes=[
+                Heading(level=1, text="Title"),
+                Paragraph(content="Text"),
+                Heading(level=2, text="Section"),
+            ]
+        )
+        builder = DocumentTreeBuilder(doc)
+
+        assert builder.resolve("h2-0") == (doc.nodes[2], 2)
+        assert builder.resolve("h2-0")[0] is doc.nodes[2]
+        assert builder.resolve("h3-0") is None
+
+    def test_heading_ids_are_shared_between_builders(self):
+        """Test that builders reuse ID strings, which depend only on level and ordinal."""
+        first = DocumentTreeBuilder(Document(nodes=[Heading(level=2, text="A")]))
+        second = DocumentTreeBuilder(Document(nodes=[Heading(level=2, text="B")]))
+
+        assert first.id_by_index[0] == "h2-0"
+        assert first.id_by_index[0] is second.id_by_index[0]
+
     def test_build_tree_with_ids_single_heading(self):
         """Test building tree with a single heading."""
         doc = Document(nodes=[Heading(level=1, text="Title")])
@@ -131,6 +186,27 @@ class TestDocumentTreeBuilder:
         assert chapter2.label == "Chapter 2"
         assert len(chapter2.children) == 0
 
+    def test_build_tree_with_ids_reuses_node_map_ids(self):
+        """Test tree IDs and lines come from the node map, skipping non-headings."""
+        doc = Document(
+            nodes=[
+                Paragraph(content="Intro"),
+                Heading(level=1, text="Chapter"),
+                Paragraph(content="Body"),
+                Heading(level=2, text="Section"),
+            ]
+        )
+        builder = DocumentTreeBuilder(doc)
+
+        tree = builder.build_tree_with_ids()
+
+        chapter = tree.children[0]
+        section = chapter.children[0]
+        assert chapter.id is builder.id_by_index[1]
+        assert section.id is builder.id_by_index[3]
+        assert chapter.line == builder.get_node_line_position(1)
+        assert section.line == builder.get_node_line_position(3)
+
     def test_build_tree_with_ids_deep_nesting(self):
         """Test building tree with deep nesting (h1 -> h2 -> h3 -> h4)."""
         doc = Document(
@@ -409,6 +485,224 @@ class TestDocumentTreeBuilder:
 
         check_column(tree)
 
+    def test_line_table_built_on_first_use(self, mocker):
+        """Test that node lookups alone never render the document."""
+        doc = Document(nodes=[Heading(level=1, text="Title"), Paragraph(content="Text")])
+        spy = mocker.spy(MarkdownWriter, "write_node")
+
+        builder = DocumentTreeBuilder(doc)
+        builder.resolve("h1-0")
+        builder.get_section_range("h1-0")
+        assert spy.call_count == 0
+
+        assert builder.line_range(doc.nodes[1]) == (2, 2)
+        assert spy.call_count == 2
+
+    def test_identity_index_built_on_first_node_lookup(self):
+        """Test that only node-object lookups build the id(node) index."""
+        paragraph = Paragraph(content="Text")
+        doc = Document(nodes=[Heading(level=1, text="Title"), paragraph, paragraph])
+
+        builder = DocumentTreeBuilder(doc)
+        builder.resolve("h1-0")
+        assert builder._index_by_identity is None
+
+        assert builder.get_node_id(doc.nodes[0]) == "h1-0"
+        assert builder.get_node_id(paragraph) is None
+        # A node object that appears twice maps to its first position
+        assert builder._index_by_identity[id(paragraph)] == 1
+
+    def test_get_node_index_distinguishes_equal_nodes(self):
+        """Test that identical headings resolve to their own positions."""
+        doc = Document(
+            nodes=[
+                Heading(level=2, text="Same"),
+                Paragraph(content="Text"),
+                Heading(level=2, text="Same"),
+            ]
+        )
+        builder = DocumentTreeBuilder(doc)
+
+        assert builder.get_node_index("h2-0") == 0
+        assert builder.get_node_index("h2-1") == 2
+
+    def test_line_positions_follow_rendered_nodes(self):
+        """Test that an empty node does not pull later nodes' positions forward."""
+        doc = Document(
+            nodes=[
+                Paragraph(content=""),
+                Heading(level=1, text="Title"),
+                Paragraph(content="Text"),
+            ]
+        )
+        builder = DocumentTreeBuilder(doc)
+        lines = doc.to_string().split("\n")
+
+        assert lines[builder.get_node_line_position(1)] == "# Title"
+        assert lines[builder.get_node_line_position(2)] == "Text"
+
+    def test_get_section_range_for_every_heading(self):
+        """Test section ranges across mixed heading levels."""
+        doc = Document(
+            nodes=[
+                Heading(level=1, text="Title"),
+                Heading(level=2, text="A"),
+                Paragraph(content="A text"),
+                Heading(level=3, text="A.1"),
+                Paragraph(content="A.1 text"),
+                Heading(level=2, text="B"),
+                Heading(level=4, text="B.1"),
+                Heading(level=3, text="B.2"),
+                Heading(level=1, text="Appendix"),
+            ]
+        )
+        builder = DocumentTreeBuilder(doc)
+
+        assert builder.get_section_range("h1-0") == (0, 7)
+        assert builder.get_section_range("h2-0") == (1, 4)
+        assert builder.get_section_range("h3-0") == (3, 4)
+        assert builder.get_section_range("h2-1") == (5, 7)
+        assert builder.get_section_range("h4-0") == (6, 6)
+        assert builder.get_section_range("h3-1") == (7, 7)
+        assert builder.get_section_range("h1-1") == (8, 8)
+        assert builder.get_section_range("h9-0") is None
+        # Ranges are memoized per ID
+        assert builder.get_section_range("h2-0") is builder.get_section_range("h2-0")
+
+    def test_find_previous_and_next_heading(self):
+        """Test bisected sibling heading search."""
+        doc = Document(
+            nodes=[
+                Heading(level=1, text="Title"),
+                Heading(level=2, text="A"),
+                Paragraph(content="Text"),
+                Heading(level=3, text="A.1"),
+                Heading(level=2, text="B"),
+            ]
+        )
+        builder = DocumentTreeBuilder(doc)
+
+        assert builder.find_previous_heading(4, 2) == 1
+        assert builder.find_previous_heading(4, 3) == 3
+        assert builder.find_previous_heading(1, 1) == 0
+        assert builder.find_previous_heading(0, 6) is None
+        assert builder.find_next_heading(2, 2) == 4
+        assert builder.find_next_heading(2, 3) == 3
+        assert builder.find_next_heading(1, 1) is None
+
+    def test_find_previous_peer_matches_previous_heading_search(self):
+        """Test the precomputed peer table agrees with the bisected search."""
+        levels = [1, 2, 3, 3, 2, 4, 3, 1, 3, 2, 2, 5, 1]
+        nodes: list[Node] = []
+        for i, level in enumerate(levels):
+            nodes.append(Heading(level=level, text=f"H{i}"))
+            nodes.append(Paragraph(content=f"Body {i}"))
+        builder = DocumentTreeBuilder(Document(nodes))
+
+        for node_id, index in builder.index_map.items():
+            level = builder.find_node(node_id).level
+            expected = builder.find_previous_heading(index, level)
+            assert builder.find_previous_peer(node_id) == expected
+
+        assert builder.find_previous_peer("h9-0") is None
+
+    def test_get_node_id(self):
+        """Test reverse lookup of node IDs from nodes."""
+        doc = Document(
+            nodes=[
+                Heading(level=1, text="Title"),
+                Paragraph(content="Text"),
+                Heading(level=2, text="Section"),
+            ]
+        )
+        builder = DocumentTreeBuilder(doc)
+
+        assert builder.get_node_id(doc.nodes[0]) == "h1-0"
+        assert builder.get_node_id(doc.nodes[2]) == "h2-0"
+        assert builder.get_node_id(doc.nodes[1]) is None
+
+    def test_index_maps(self):
+        """Test node_id <-> index maps, including a node object used twice."""
+        shared = Heading(level=2, text="Shared")
+        doc = Document(
+            nodes=[Heading(level=1, text="Title"), shared, Paragraph(content="x"), shared]
+        )
+        builder = DocumentTreeBuilder(doc)
+
+        assert builder.index_map == {"h1-0": 0, "h2-0": 1, "h2-1": 3}
+        assert builder.id_by_index == {0: "h1-0", 1: "h2-0", 3: "h2-1"}
+        assert builder.get_node_index("h2-1") == 3
+
+    def test_line_range(self):
+        """Test line ranges of nodes, including ones not in the document."""
+        doc = Document(
+            nodes=[
+                Heading(level=1, text="Title"),
+                Paragraph(content="Line one\nLine two"),
+                Heading(level=2, text="Section"),
+            ]
+        )
+        builder = DocumentTreeBuilder(doc)
+
+        assert builder.line_range(doc.nodes[0]) == (0, 0)
+        assert builder.line_range(doc.nodes[1]) == (2, 3)
+        assert builder.line_range(doc.nodes[2]) == (5, 5)
+        assert builder.line_range(Heading(level=1, text="Title")) is None
+
+    def test_build_tree_with_ids_is_memoized(self):
+        """Test that the tree is built once per builder."""
+        doc = Document(nodes=[Heading(level=1, text="Title"), Heading(level=2, text="Section")])
+        builder = DocumentTreeBuilder(doc)
+
+        tree = builder.build_tree_with_ids()
+
+        assert builder.build_tree_with_ids() is tree
+        assert not hasattr(tree, "__dict__")
+
+    def test_base_builder_metrics_are_reused(self, mocker):
+        """Test that a derived document only renders nodes it does not share."""
+        nodes = [
+            Heading(level=1, text="Title"),
+            Paragraph(content="Intro\nspanning lines"),
+            Heading(level=2, text="Section"),
+        ]
+        doc = Document(nodes=nodes)
+        base = DocumentTreeBuilder(doc)
+        base.get_node_line_position(0)
+        derived_doc = doc.splice(1, 3, [nodes[2], Paragraph(content="New"), nodes[1]])
+
+        spy = mocker.spy(MarkdownWriter, "write_node")
+        derived = DocumentTreeBuilder(derived_doc, base=base)
+        fresh = DocumentTreeBuilder(derived_doc)
+        fresh.get_node_line_position(0)
+
+        assert derived._line_position_cache == fresh._line_position_cache
+        assert derived._line_count_cache == fresh._line_count_cache
+        # Only the new paragraph is rendered for the derived builder
+        assert spy.call_count == 1 + len(derived_doc.nodes)
+
+    def test_for_document_reuses_builder(self):
+        """Test that for_document memoizes one builder per document instance."""
+        doc = Document(nodes=[Heading(level=1, text="Title")])
+        other = Document(nodes=[Heading(level=1, text="Title")])
+
+        builder = DocumentTreeBuilder.for_document(doc)
+
+        assert DocumentTreeBuilder.for_document(doc) is builder
+        assert builder.document is doc
+        assert DocumentTreeBuilder.for_document(other) is not builder
+
+    def test_operations_share_cached_builder(self):
+        """Test that structure operations reuse the document's memoized builder."""
+        doc = Document(nodes=[Heading(level=1, text="Title"), Heading(level=2, text="Section")])
+        builder = DocumentTreeBuilder.for_document(doc)
+
+        assert StructureOperations.validate_promote(doc, "h2-0").valid
+        result = StructureOperations.promote(doc, "h2-0")
+
+        assert result.success
+        assert DocumentTreeBuilder.for_document(doc) is builder
+
 
 class TestPromote:
     """Tests for promote operation."""
@@ -490,6 +784,17 @@ class TestPromote:
         assert validation.valid is True
         assert validation.error is None
 
+    def test_successful_validations_share_one_immutable_result(self):
+        """Test validators reuse a frozen success result instead of allocating one."""
+        doc = Document(nodes=[Heading(level=1, text="A"), Heading(level=2, text="B")])
+
+        first = StructureOperations.validate_promote(doc, "h2-0")
+        second = StructureOperations.validate_move_up(doc, "h1-0")
+
+        assert first is second
+        with pytest.raises(FrozenInstanceError):
+            first.valid = False
+
 
 class TestDemote:
     """Tests for demote operation."""
@@ -712,6 +1017,42 @@ class TestNest:
         # Child should be capped at level 6
         assert new_doc.nodes[1].level == 6
 
+    def test_nest_under_own_descendant(self):
+        """Test nesting under a heading inside the moved section keeps legacy placement."""
+        doc = Document(
+            nodes=[
+                Heading(level=2, text="Section"),
+                Heading(level=3, text="Child"),
+                Heading(level=3, text="Sibling"),
+                Heading(level=1, text="Next"),
+            ]
+        )
+
+        result = StructureOperations.nest(doc, "h2-0", "h3-0")
+
+        expected = Document(
+            nodes=[
+                Heading(level=4, text="Section"),
+                Heading(level=5, text="Child"),
+                Heading(level=5, text="Sibling"),
+                Heading(level=1, text="Next"),
+            ]
+        )
+        assert result.success is True
+        assert result.document == expected.to_string()
+
+    def test_with_level_matches_dataclass_replace(self):
+        """Test that the nest level helper is a shallow replace of the level only."""
+        heading = Heading(
+            level=2, text="Title", children=[Paragraph(content="x")], metadata={"k": 1}
+        )
+
+        adjusted = operations._with_level(heading, 4)
+
+        assert adjusted == replace(heading, level=4)
+        assert adjusted.children is heading.children
+        assert adjusted.metadata is heading.metadata
+
     def test_nest_invalid_parent_id(self):
         """Test nest with invalid parent ID."""
         doc = Document(
@@ -922,8 +1263,61 @@ class TestGranularEdits:
         # Should start at line 0, column 0 for first node
         assert modified_range.start_line == 0
         assert modified_range.start_column == 0
-        # Should end at same line (single heading)
-        assert modified_range.end_line == 0
+        # Half-open: ends at the start of the line after the heading
+        assert modified_range.end_line == 1
+        assert modified_range.end_column == 0
+
+    def test_ranges_apply_under_vscode_position_clamping(self):
+        """Test that ranges give the result when applied with VS Code's position rules."""
+        doc = Document(
+            nodes=[
+                Heading(level=1, text="Title"),
+                Heading(level=2, text="First"),
+                Paragraph(content="Body"),
+                Heading(level=2, text="Second"),
+                Heading(level=3, text="Deep"),
+                Paragraph(content="End"),
+            ]
+        )
+
+        for operation, args in (
+            (StructureOperations.promote, ("h2-0",)),
+            (StructureOperations.demote, ("h2-1",)),
+            (StructureOperations.unnest, ("h3-0",)),
+            (StructureOperations.move_up, ("h2-1",)),
+            (StructureOperations.move_down, ("h2-0",)),
+            (StructureOperations.nest, ("h2-1", "h2-0")),
+            (StructureOperations.delete, ("h3-0",)),
+        ):
+            result = operation(doc, *args)
+
+            assert result.success is True
+            applied = _apply_with_vscode_clamping(doc.to_string(), result.modified_ranges)
+            assert applied == result.document, (operation.__name__, args)
+
+    def test_heading_level_fast_path_matches_full_diff(self):
+        """Test that promote/demote ranges equal those of the general diff."""
+        from doctk.integration.operations import DiffComputer
+
+        doc = Document(
+            nodes=[
+                Heading(level=1, text="Title"),
+                Paragraph(content="Intro\nspanning lines"),
+                Heading(level=2, text="Section"),
+                Paragraph(content="Body"),
+            ]
+        )
+
+        for operation, node_id in (
+            (StructureOperations.promote, "h2-0"),
+            (StructureOperations.demote, "h2-0"),
+            (StructureOperations.demote, "h1-0"),
+        ):
+            result = operation(doc, node_id)
+            new_doc = Document.from_string(result.document)
+            expected = DiffComputer.compute_ranges(doc, new_doc, [node_id])
+
+            assert result.modified_ranges == expected
 
     def test_demote_returns_modified_ranges(self):
         """Test that demote operation returns modified ranges."""
@@ -986,6 +1380,128 @@ class TestGranularEdits:
         # Verify it's a heading (should have ##)
         assert "##" in heading_range.new_text
 
+    def test_move_ranges_reproduce_result_document(self):
+        """Test that applying move_up/move_down ranges yields the result text."""
+        doc = Document(
+            nodes=[
+                Heading(level=1, text="Title"),
+                Heading(level=2, text="Section 1"),
+                Paragraph(content="Content 1"),
+                Heading(level=2, text="Section 2"),
+                Paragraph(content="Content 2"),
+                Heading(level=2, text="Section 3"),
+            ]
+        )
+
+        for operation, node_id in (
+            (StructureOperations.move_up, "h2-1"),
+            (StructureOperations.move_up, "h2-2"),
+            (StructureOperations.move_down, "h2-0"),
+            (StructureOperations.move_down, "h2-1"),
+        ):
+            result = operation(doc, node_id)
+
+            assert result.success is True
+            assert len(result.modified_ranges) == 1
+            edit = result.modified_ranges[0]
+            lines = doc.to_string().splitlines(keepends=True)
+            applied = (
+                "".join(lines[: edit.start_line]) + edit.new_text + "".join(lines[edit.end_line :])
+            )
+            assert applied == result.document
+
+    def test_span_ranges_reproduce_result_document(self):
+        """Test that nest/unnest/delete ranges yield the result text, at any position."""
+        doc = Document(
+            nodes=[
+                Paragraph(content=""),
+                Heading(level=1, text="Title"),
+                Heading(level=3, text="Deep"),
+                Paragraph(content="Two\nlines"),
+                Heading(level=2, text="Section"),
+                Heading(level=2, text="Last"),
+                Paragraph(content="End"),
+            ]
+        )
+
+        for operation, args in (
+            (StructureOperations.nest, ("h2-0", "h1-0")),
+            (StructureOperations.nest, ("h1-0", "h2-1")),
+            (StructureOperations.unnest, ("h3-0",)),
+            (StructureOperations.delete, ("h3-0",)),
+            (StructureOperations.delete, ("h2-1",)),
+            (StructureOperations.delete, ("h1-0",)),
+        ):
+            result = operation(doc, *args)
+
+            assert result.success is True
+            assert len(result.modified_ranges) == 1
+            edit = result.modified_ranges[0]
+            assert edit.start_column == 0
+            lines = doc.to_string().splitlines(keepends=True)
+            applied = (
+                "".join(lines[: edit.start_line])
+                + edit.new_text
+                + "".join(lines[edit.end_line :])[edit.end_column :]
+            )
+            assert applied == result.document, (operation.__name__, args)
+
+    def test_find_matching_node_by_type_and_content(self):
+        """Test fallback matching of non-heading, non-paragraph nodes."""
+        from doctk.core import CodeBlock
+        from doctk.integration.operations import DiffComputer
+
+        original = CodeBlock(code="print(1)", language="python")
+        modified_nodes = [
+            Paragraph(content="print(1)"),
+            CodeBlock(code="print(2)", language="python"),
+            CodeBlock(code="print(1)", language="python"),
+        ]
+        match_index = DiffComputer._build_match_index(modified_nodes)
+
+        assert DiffComputer._find_matching_node(original, match_index) is modified_nodes[2]
+        assert DiffComputer._find_matching_node(CodeBlock(code="x"), match_index) is None
+
+    def test_compute_ranges_unchanged_text(self, mocker):
+        """Test that identical documents produce no ranges without matching nodes."""
+        from doctk.integration.operations import DiffComputer
+
+        original = Document(nodes=[Heading(level=1, text="Title")])
+        modified = Document(nodes=[Heading(level=1, text="Title")])
+        spy = mocker.spy(DiffComputer, "_find_matching_node")
+
+        assert DiffComputer.compute_ranges(original, modified, ["h1-0"]) == []
+        assert spy.call_count == 0
+
+    def test_compute_ranges_falls_back_to_line_diff(self):
+        """Test that unmatched changes are reported as line-diff ranges."""
+        from doctk.integration.operations import DiffComputer
+
+        original = Document(
+            nodes=[
+                Heading(level=1, text="Title"),
+                Paragraph(content="Old text"),
+                Paragraph(content="Unchanged"),
+            ]
+        )
+        modified = Document(
+            nodes=[
+                Heading(level=1, text="Renamed"),
+                Paragraph(content="New text"),
+                Paragraph(content="Unchanged"),
+            ]
+        )
+        lines = original.to_string().splitlines(keepends=True)
+
+        for affected in ([], ["h1-0"]):
+            ranges = DiffComputer.compute_ranges(original, modified, affected)
+
+            assert [(r.start_line, r.end_line) for r in ranges] == [(0, 1), (2, 3)]
+            applied = list(lines)
+            for edit in reversed(ranges):
+                applied[edit.start_line : edit.end_line] = [edit.new_text]
+            assert "".join(applied) == modified.to_string()
+
     def test_move_down_returns_modified_ranges(self):
         """Test that move_down operation returns modified ranges."""
         doc = Document(
@@ -1140,6 +1656,7 @@ class TestGranularEdits:
         # Even though it's identity, should still work
         # The implementation might return empty ranges or the same content
         assert result.document is not None
+        assert result.unchanged is True
 
     def test_modified_range_line_numbers_are_zero_indexed(self):
         """Test that modified range line numbers are zero-indexed."""
@@ -1271,3 +1788,215 @@ class TestGranularEdits:
 
         assert result.valid is False
         assert "not found" in result.error.lower()
+
+
+class TestDocumentTextCache:
+    """Tests for the per-document serialization cache."""
+
+    def test_text_is_serialized_once(self, mocker):
+        """Test that repeated lookups reuse the first serialization."""
+        doc = Document(nodes=[Heading(level=1, text="Title"), Paragraph(content="Text")])
+        spy = mocker.spy(doc, "to_string")
+
+        text = operations._doc_text(doc)
+        lines = operations._doc_lines(doc)
+
+        assert operations._doc_text(doc) is text
+        assert operations._doc_lines(doc) is lines
+        assert "".join(lines) == text
+        assert spy.call_count == 1
+
+    def test_derived_document_renders_only_new_nodes(self, mocker):
+        """Test that a derived document reuses the node text of its source's builder."""
+        doc = Document(
+            nodes=[
+                Heading(level=1, text="Title"),
+                Paragraph(content="Text"),
+                Heading(level=2, text="Section"),
+            ]
+        )
+        DocumentTreeBuilder.for_document(doc)
+        operations._doc_text(doc)
+        new_doc = doc.set(2, doc.nodes[2].promote())
+        spy = mocker.spy(MarkdownWriter, "write_node")
+
+        text = operations._doc_text(new_doc, derived_from=doc)
+
+        assert text == new_doc.to_string()
+        assert spy.call_count == 1
+
+    def test_render_document_with_top_level_list_item_matches_to_string(self):
+        """Test render_document falls back to one pass when a top-level ListItem appears."""
+        doc = Document(
+            nodes=[
+                Heading(level=1, text="Title"),
+                ListItem(content=[Paragraph(content="Loose item")]),
+                Paragraph(content="Text"),
+            ]
+        )
+        builder = DocumentTreeBuilder.for_document(doc)
+
+        assert builder.render_document(doc) == doc.to_string()
+
+    def test_entries_are_dropped_with_document(self):
+        """Test that cached text does not keep its document alive."""
+        doc = Document(nodes=[Heading(level=1, text="Cache eviction probe")])
+        operations._doc_lines(doc)
+        assert doc in operations._text_cache
+
+        del doc
+        gc.collect()
+
+        assert all(
+            d.nodes[:1] != [Heading(level=1, text="Cache eviction probe")]
+            for d in operations._text_cache.keys()
+        )
+
+
+class TestApplyBatch:
+    """Tests for StructureOperations.apply_batch."""
+
+    def test_batch_matches_sequential_operations(self):
+        """Test that a batch produces the same text as applying each operation in turn."""
+        doc = Document(
+            nodes=[
+                Heading(level=1, text="Title"),
+                Heading(level=2, text="Section 1"),
+                Paragraph(content="Content 1"),
+                Heading(level=2, text="Section 2"),
+                Heading(level=3, text="Sub"),
+            ]
+        )
+
+        result = StructureOperations.apply_batch(
+            doc,
+            [
+                ("demote", {"node_id": "h2-0"}),
+                ("move_down", {"node_id": "h3-0"}),
+                ("promote", {"node_id": "h3-0"}),
+                ("delete", {"node_id": "h3-0"}),
+            ],
+        )
+
+        # IDs follow the intermediate documents: "h3-0" is Section 1, then Sub once
+        # Section 1 moves below it, then Section 1 again once Sub is promoted
+        expected = Document(
+            nodes=[
+                Heading(level=1, text="Title"),
+                Heading(level=2, text="Section 2"),
+                Heading(level=2, text="Sub"),
+            ]
+        )
+        assert result.success is True
+        assert result.document == expected.to_string()
+        assert result.modified_ranges
+        assert doc.nodes[1] == Heading(level=2, text="Section 1")
+
+    def test_batch_renders_only_original_and_new_nodes(self, mocker):
+        """Test that intermediate documents of a batch are never rendered."""
+        doc = Document(
+            nodes=[
+                Heading(level=1, text="Title"),
+                Heading(level=3, text="A"),
+                Heading(level=3, text="B"),
+            ]
+        )
+        spy = mocker.spy(MarkdownWriter, "write_node")
+
+        result = StructureOperations.apply_batch(
+            doc, [("promote", {"node_id": "h3-0"}), ("promote", {"node_id": "h3-0"})]
+        )
+
+        assert result.success is True
+        # Three original nodes plus the two promoted headings
+        assert spy.call_count == 5
+
+    def test_repeated_node_id_is_resolved_per_step(self):
+        """Test that repeating an ID addresses whatever heading holds it at that step."""
+        doc = Document(
+            nodes=[
+                Heading(level=1, text="Title"),
+                Heading(level=3, text="A"),
+                Heading(level=3, text="B"),
+            ]
+        )
+
+        result = StructureOperations.apply_batch(
+            doc, [("promote", {"node_id": "h3-0"}), ("promote", {"node_id": "h3-0"})]
+        )
+
+        # The second "h3-0" is B, so the two promotes must not be fused into one
+        expected = Document(
+            nodes=[
+                Heading(level=1, text="Title"),
+                Heading(level=2, text="A"),
+                Heading(level=2, text="B"),
+            ]
+        )
+        assert result.document == expected.to_string()
+
+    def test_single_operation_batch_matches_operation(self):
+        """Test that a one-operation batch returns the operation's own result."""
+        doc = Document(nodes=[Heading(level=1, text="Title"), Heading(level=2, text="Section")])
+
+        batch = StructureOperations.apply_batch(doc, [("promote", {"node_id": "h2-0"})])
+
+        assert batch == StructureOperations.promote(doc, "h2-0")
+
+    def test_noop_batch_returns_original_text(self):
+        """Test that a batch of no-ops returns the document without ranges."""
+        doc = Document(nodes=[Heading(level=1, text="Title")])
+
+        result = StructureOperations.apply_batch(
+            doc, [("promote", {"node_id": "h1-0"}), ("move_up", {"node_id": "h1-0"})]
+        )
+
+        assert result.success is True
+        assert result.document == doc.to_string()
+        assert result.modified_ranges is None
+        assert result.unchanged is True
+
+    def test_batch_stops_at_first_failure(self):
+        """Test that unknown operations and failing operations fail the batch."""
+        doc = Document(nodes=[Heading(level=1, text="Title")])
+
+        unknown = StructureOperations.apply_batch(doc, [("rename", {"node_id": "h1-0"})])
+        failed = StructureOperations.apply_batch(
+            doc, [("demote", {"node_id": "h1-0"}), ("delete", {"node_id": "h9-0"})]
+        )
+
+        assert unknown.success is False
+        assert "Unknown operation" in unknown.error
+        assert failed.success is False
+        assert "not found" in failed.error.lower()
+
+
+class TestFindHeading:
+    """Tests for the validators' builder-free heading lookup."""
+
+    def test_matches_tree_builder_ids(self):
+        """Test that every builder ID (and only those) resolves to the same heading."""
+        doc = Document(
+            nodes=[
+                Heading(level=1, text="Title"),
+                Paragraph(content="Intro"),
+                Heading(level=2, text="A"),
+                Heading(level=3, text="A.1"),
+                Heading(level=2, text="B"),
+                Heading(level=1, text="End"),
+            ]
+        )
+        builder = DocumentTreeBuilder(doc)
+
+        for node_id, node in builder.node_map.items():
+            assert operations._find_heading(Document(doc.nodes), node_id) is node
+        for node_id in ("h2-2", "h2-01", "h0-0", "p-0", "h-1", "h2", "", "h²-0"):
+            assert operations._find_heading(Document(doc.nodes), node_id) is None
+
+    def test_validation_does_not_build_tree(self):
+        """Test that validators do not build and memoize a tree builder."""
+        doc = Document(nodes=[Heading(level=1, text="Title"), Heading(level=2, text="Section")])
+
+        assert StructureOperations.validate_promote(doc, "h2-0").valid is True
+        assert StructureOperations.validate_nest(doc, "h2-0", "h1-0").valid is True
+        assert operations._TREE_BUILDER_ATTR not in doc.__dict__
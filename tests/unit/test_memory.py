@@ -2,6 +2,7 @@
 
 from doctk.core import Document, Heading, Paragraph
 from doctk.integration.memory import DocumentState, DocumentStateManager, LRUCache
+from doctk.integration.operations import DocumentTreeBuilder
 
 
 class TestLRUCache:
@@ -86,6 +87,18 @@ class TestLRUCache:
         assert "key1" in cache
         assert "key2" not in cache
 
+    def test_cache_items_snapshot_keeps_order(self):
+        """Test that items() lists entries oldest first without changing recency."""
+        cache = LRUCache[str](maxsize=10)
+        cache.put("key1", "value1")
+        cache.put("key2", "value2")
+
+        items = cache.items()
+        cache.remove("key1")
+
+        assert items == [("key1", "value1"), ("key2", "value2")]
+        assert cache.items() == [("key2", "value2")]
+
     def test_cache_popitem(self):
         """Test removing and returning items from cache."""
         cache = LRUCache[str](maxsize=10)
@@ -200,6 +213,118 @@ class TestDocumentStateManager:
         memory_mb = manager.get_memory_usage_mb()
         assert memory_mb >= 0
 
+    def test_memory_estimate_tracks_insertions_and_removals(self):
+        """Test that the estimated memory usage is maintained incrementally."""
+        manager = DocumentStateManager(max_cache_size=2, enable_memory_monitoring=False)
+        manager._process = None  # Use the tracked-size estimate
+
+        manager.put_document("file:///a.md", Document([Heading(level=1, text="A")]))
+        assert manager._estimate_memory_usage() > 0
+
+        # Replacing a document does not double count it
+        manager.put_document("file:///a.md", Document([Heading(level=1, text="A")]))
+        assert manager._total_bytes == manager._entry_sizes["file:///a.md"]
+
+        # Size-based eviction subtracts the evicted entry
+        manager.put_document("file:///b.md", Document([Heading(level=1, text="B")]))
+        manager.put_document("file:///c.md", Document([Heading(level=1, text="C")]))
+        assert set(manager._entry_sizes) == {"file:///b.md", "file:///c.md"}
+        assert manager._total_bytes == sum(manager._entry_sizes.values())
+
+        manager.remove_document("file:///b.md")
+        assert set(manager._entry_sizes) == {"file:///c.md"}
+
+        manager.clear()
+        assert manager._estimate_memory_usage() == 0
+
+    def test_memory_eviction_stops_once_under_limit(self):
+        """Test that memory-based eviction only removes as much as needed."""
+        manager = DocumentStateManager(max_cache_size=100, enable_memory_monitoring=False)
+        manager._process = None  # Use the tracked-size estimate
+        for i in range(40):
+            doc = Document([Paragraph(content=f"Content {i}" * 50)])
+            manager.put_document(f"file:///doc{i}.md", doc)
+
+        manager.max_memory_mb = manager._estimate_memory_usage() / 2
+        manager.enable_memory_monitoring = True
+        manager._enforce_memory_limit()
+
+        assert manager._estimate_memory_usage() <= manager.max_memory_mb
+        assert 15 <= manager.get_cache_size() < 40
+        assert manager.get_document("file:///doc39.md") is not None
+
+    def test_oversized_document_does_not_purge_cache(self):
+        """Test that a document near the memory limit is admitted without evictions."""
+        manager = DocumentStateManager(max_cache_size=10, max_memory_mb=1)
+        manager._process = None  # Use the tracked-size estimate
+        for i in range(5):
+            manager.put_document(f"file:///doc{i}.md", Document([Heading(level=1, text="A")]))
+
+        huge = Document([Paragraph(content="x" * (2 * 1024 * 1024))])
+        manager.put_document("file:///huge.md", huge)
+
+        assert manager.get_cache_size() == 6
+        assert manager.get_document("file:///huge.md") is not None
+        assert manager.get_statistics()["memory_evictions"] == 0
+
+    def test_memory_eviction_batches_scale_with_overshoot(self):
+        """Test that a large overshoot evicts in large batches between measurements."""
+
+        class FakeProcess:
+            """Process whose RSS stays at twice the limit."""
+
+            def __init__(self):
+                self.reads = 0
+
+            def memory_info(self):
+                self.reads += 1
+                return type("MemInfo", (), {"rss": 200 * 1024 * 1024})()
+
+        manager = DocumentStateManager(max_cache_size=100, max_memory_mb=100)
+        manager.enable_memory_monitoring = False
+        for i in range(40):
+            manager.put_document(f"file:///doc{i}.md", Document([Heading(level=1, text="A")]))
+
+        manager._process = FakeProcess()
+        manager.enable_memory_monitoring = True
+        manager._enforce_memory_limit()
+
+        # 2x overshoot -> 25% of the cache (10 documents) per measurement
+        assert manager.get_cache_size() == 0
+        assert manager._process.reads == 5
+
+    def test_put_under_rss_limit_does_not_size_documents(self):
+        """Test that documents are not walked for their size while RSS is under the limit."""
+
+        class FakeProcess:
+            """Process whose RSS stays well under the limit."""
+
+            def memory_info(self):
+                return type("MemInfo", (), {"rss": 10 * 1024 * 1024})()
+
+        manager = DocumentStateManager(max_cache_size=2, max_memory_mb=100)
+        manager._process = FakeProcess()
+        sized = []
+        manager._estimate_state_size = lambda uri, state: sized.append(uri) or 1
+
+        for i in range(3):
+            manager.put_document(f"file:///doc{i}.md", Document([Heading(level=1, text="A")]))
+
+        assert sized == []
+        assert manager._entry_sizes == {}
+        assert manager._total_bytes == 0
+
+    def test_size_estimate_excludes_memoized_tree_builder(self):
+        """Test that the tree builder memoized on a document is not counted in its size."""
+        manager = DocumentStateManager(enable_memory_monitoring=False)
+        doc = Document.from_string("# Title\n\n## Section\n\nText\n")
+        state = DocumentState(uri="file:///a.md", document=doc, metadata={})
+        before = manager._estimate_state_size("file:///a.md", state)
+
+        DocumentTreeBuilder.for_document(doc)
+
+        assert manager._estimate_state_size("file:///a.md", state) == before
+
     def test_statistics(self):
         """Test getting cache statistics."""
         manager = DocumentStateManager(max_cache_size=10, max_memory_mb=500)
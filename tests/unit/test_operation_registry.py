@@ -1,5 +1,10 @@
 """Tests for operation registry."""
 
+import inspect
+from dataclasses import FrozenInstanceError, asdict
+
+import pytest
+
 from doctk.lsp.registry import OperationMetadata, OperationRegistry, ParameterInfo
 
 
@@ -35,6 +40,14 @@ class TestParameterInfo:
         assert param.required is False
         assert param.default is None
 
+    def test_to_dict_matches_asdict(self):
+        """Test to_dict produces the same mapping as dataclasses.asdict."""
+        param = ParameterInfo(
+            name="depth", type="int", required=False, description="Depth", default=2
+        )
+
+        assert param.to_dict() == asdict(param)
+
 
 class TestOperationMetadata:
     """Test OperationMetadata dataclass."""
@@ -50,9 +63,9 @@ class TestOperationMetadata:
         assert metadata.name == "select"
         assert metadata.description == "Select nodes matching predicate"
         assert metadata.category == "selection"
-        assert metadata.parameters == []
+        assert metadata.parameters == ()
         assert metadata.return_type == "Document"
-        assert metadata.examples == []
+        assert metadata.examples == ()
 
     def test_operation_metadata_with_parameters(self):
         """Test operation metadata with parameters."""
@@ -91,6 +104,45 @@ class TestOperationRegistry:
         assert "promote" in registry.operations
         assert "demote" in registry.operations
 
+    def test_registry_discovers_same_operations_as_getmembers(self):
+        """Test discovery matches inspect.getmembers, in definition order."""
+        import doctk.operations as ops_module
+
+        expected = {
+            name
+            for name, obj in inspect.getmembers(ops_module, callable)
+            if not name.startswith("_")
+            and not inspect.isclass(obj)
+            and obj.__module__ == "doctk.operations"
+        }
+        registry = OperationRegistry()
+
+        assert set(registry.operations) == expected
+        assert list(registry.operations) == [n for n in vars(ops_module) if n in expected]
+
+    def test_docstring_parsed_only_without_static_description(self, monkeypatch):
+        """Test docstrings are parsed only for operations lacking a static description."""
+        from doctk.lsp import registry as registry_module
+
+        calls = []
+        original = OperationRegistry._extract_description
+
+        def spy(self, obj):
+            calls.append(obj.__name__)
+            return original(self, obj)
+
+        monkeypatch.setattr(OperationRegistry, "_extract_description", spy)
+        OperationRegistry()
+        assert calls == []
+
+        static = dict(registry_module._OPERATION_METADATA)
+        static["promote"] = {k: v for k, v in static["promote"].items() if k != "description"}
+        monkeypatch.setattr(registry_module, "_OPERATION_METADATA", static)
+        registry = OperationRegistry()
+
+        assert calls == ["promote"]
+        assert registry.get_operation("promote").category == "structure"
+
     def test_get_operation_found(self):
         """Test getting an operation that exists."""
         registry = OperationRegistry()
@@ -168,6 +220,22 @@ class TestOperationRegistry:
 
         assert ops == []
 
+    def test_get_operations_by_category_matches_full_scan(self):
+        """Test the category index agrees with filtering all operations."""
+        registry = OperationRegistry()
+
+        for category in {op.category for op in registry.get_all_operations()}:
+            expected = [op for op in registry.get_all_operations() if op.category == category]
+            assert registry.get_operations_by_category(category) == expected
+
+    def test_get_operations_by_category_returns_copy(self):
+        """Test mutating a returned category list does not change the registry."""
+        registry = OperationRegistry()
+
+        registry.get_operations_by_category("structure").clear()
+
+        assert len(registry.get_operations_by_category("structure")) > 0
+
     def test_get_operation_names(self):
         """Test getting all operation names."""
         registry = OperationRegistry()
@@ -340,3 +408,35 @@ class TestRegistryIntegration:
 
         results = registry.search_operations("nonexistent_operation_xyz")
         assert len(results) == 0, "Should return empty list for no matches"
+
+    def test_search_operations_matches_unindexed_search(self):
+        """Test the precomputed lowercase corpus gives the same results as lowering per query."""
+        registry = OperationRegistry()
+
+        for query in ("head", "LEVEL", "Select", "node", "zzz", ""):
+            expected = [
+                op
+                for op in registry.get_all_operations()
+                if query.lower() in op.name.lower() or query.lower() in op.description.lower()
+            ]
+            assert registry.search_operations(query) == expected
+
+    def test_search_operations_is_caseless_for_non_ascii(self):
+        """Test search folds case beyond ASCII, e.g. German sharp s."""
+        registry = OperationRegistry()
+        registry._register(OperationMetadata(name="strasse", description="Rename STRASSE headings"))
+
+        assert [op.name for op in registry.search_operations("straße")] == ["strasse"]
+
+    def test_metadata_is_immutable_and_shared(self):
+        """Test registry metadata cannot be mutated and shares the static tuples."""
+        registry = OperationRegistry()
+        select = registry.get_operation("select")
+
+        assert isinstance(select.parameters, tuple)
+        assert isinstance(select.examples, tuple)
+        with pytest.raises(FrozenInstanceError):
+            select.category = "other"
+        assert registry.get_operation("select").parameters is (
+            OperationRegistry().get_operation("select").parameters
+        )
@@ -1,6 +1,8 @@
 """Tests for performance monitoring functionality."""
 
+import threading
 import time
+from unittest.mock import patch
 
 import pytest
 
@@ -23,6 +25,13 @@ class TestMetric:
         metric = Metric(timestamp=1234567890.0, duration=0.5, metadata=metadata)
         assert metric.metadata == metadata
 
+    def test_metric_has_no_instance_dict(self):
+        """Test Metric is slotted so retained metrics carry no per-instance __dict__."""
+        metric = Metric(timestamp=1234567890.0, duration=0.5)
+        assert not hasattr(metric, "__dict__")
+        with pytest.raises(AttributeError):
+            metric.extra = 1
+
 
 class TestOperationStats:
     """Tests for OperationStats dataclass."""
@@ -73,6 +82,17 @@ class TestOperationStats:
         assert stats.max_duration == 0.5
         assert stats.average_duration == pytest.approx(0.3)
 
+    def test_add_duration_updates_stats_without_metric(self):
+        """Test add_duration updates the running statistics only."""
+        stats = OperationStats(operation_name="promote")
+        stats.add_duration(0.2)
+        stats.add_duration(0.4)
+
+        assert stats.total_calls == 2
+        assert stats.min_duration == 0.2
+        assert stats.max_duration == 0.4
+        assert len(stats.metrics) == 0
+
 
 class TestPerformanceMonitor:
     """Tests for PerformanceMonitor class."""
@@ -307,6 +327,19 @@ class TestPerformanceMonitor:
         assert "Performance Summary:" in summary
         assert "Slow operations detected" in summary
 
+    def test_get_summary_scans_for_slow_operations_once(self):
+        """Test that the summary reuses its slow-operation scan for the report."""
+        monitor = PerformanceMonitor(slow_operation_threshold=0.1)
+        monitor.record_operation("promote", 0.5)
+
+        with patch.object(
+            monitor, "_find_slow_operations", wraps=monitor._find_slow_operations
+        ) as find_slow:
+            summary = monitor.get_summary()
+
+        assert find_slow.call_count == 1
+        assert summary.endswith(monitor.report_slow_operations())
+
     def test_clear_metrics(self):
         """Test clearing all metrics."""
         monitor = PerformanceMonitor()
@@ -419,6 +452,50 @@ class TestPerformanceMonitor:
         assert stats.metrics[0].duration == pytest.approx(0.5)  # 6th metric
         assert stats.metrics[-1].duration == pytest.approx(0.9)  # 10th metric
 
+    def test_metrics_are_a_list(self):
+        """Test that retained metrics stay list-compatible, e.g. for slicing."""
+        monitor = PerformanceMonitor(max_metrics_per_operation=20)
+        for i in range(15):
+            monitor.record_operation("test_op", 0.01 * i)
+
+        recent = monitor.get_stats("test_op").metrics[-10:]
+
+        assert [m.duration for m in recent] == pytest.approx([0.01 * i for i in range(5, 15)])
+
+    def test_metric_retention_limit_change_applies_to_recorded_operations(self):
+        """Test that changing the limit after the first record takes effect."""
+        monitor = PerformanceMonitor(max_metrics_per_operation=2)
+        for i in range(3):
+            monitor.record_operation("test_op", 0.1 * i)
+
+        monitor.max_metrics_per_operation = 4
+        for i in range(3, 6):
+            monitor.record_operation("test_op", 0.1 * i)
+        stats = monitor.get_stats("test_op")
+        assert [m.duration for m in stats.metrics] == pytest.approx([0.2, 0.3, 0.4, 0.5])
+
+        monitor.max_metrics_per_operation = 1
+        monitor.record_operation("test_op", 0.6)
+        assert [m.duration for m in stats.metrics] == pytest.approx([0.6])
+
+        monitor.max_metrics_per_operation = 0
+        monitor.record_operation("test_op", 0.7)
+        assert stats.metrics == []
+        assert stats.total_calls == 8
+
+    def test_metric_retention_disabled(self):
+        """Test that a limit of 0 keeps running statistics but no metric records."""
+        monitor = PerformanceMonitor(max_metrics_per_operation=0)
+
+        monitor.record_operation("test_op", 0.1)
+        monitor.record_operation("test_op", 0.3)
+
+        stats = monitor.get_stats("test_op")
+        assert stats is not None
+        assert len(stats.metrics) == 0
+        assert stats.total_calls == 2
+        assert stats.average_duration == pytest.approx(0.2)
+
     def test_metric_retention_default_limit(self):
         """Test that default retention limit is 1000."""
         monitor = PerformanceMonitor()
@@ -444,6 +521,61 @@ class TestPerformanceMonitor:
         # But only 3 metrics retained
         assert len(stats.metrics) == 3
 
+    def test_concurrent_recording_counts_every_call(self):
+        """Test that threads recording the same and different operations lose no calls."""
+        monitor = PerformanceMonitor(max_metrics_per_operation=10)
+        calls_per_thread = 2000
+
+        def record(operation: str) -> None:
+            for _ in range(calls_per_thread):
+                monitor.record_operation(operation, 0.001)
+
+        threads = [
+            threading.Thread(target=record, args=(name,))
+            for name in ("promote", "promote", "demote", "demote")
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert monitor.get_stats("promote").total_calls == 2 * calls_per_thread
+        assert monitor.get_stats("demote").total_calls == 2 * calls_per_thread
+        assert len(monitor.get_all_stats()["promote"].metrics) == 10
+
+    def test_readers_tolerate_concurrent_new_operations(self):
+        """Test that summaries stay consistent while new operation names are recorded."""
+        monitor = PerformanceMonitor(slow_operation_threshold=0.0)
+        stop = threading.Event()
+        errors: list[BaseException] = []
+
+        def record_new_names() -> None:
+            index = 0
+            while not stop.is_set():
+                monitor.record_operation(f"op-{index}", 0.001)
+                index += 1
+
+        def read() -> None:
+            try:
+                for _ in range(200):
+                    monitor.get_summary()
+                    monitor.report_slow_operations()
+                    monitor.get_total_operations()
+                    monitor.get_total_time()
+                    monitor.clear()
+            except BaseException as error:  # noqa: BLE001
+                errors.append(error)
+
+        writer = threading.Thread(target=record_new_names)
+        reader = threading.Thread(target=read)
+        writer.start()
+        reader.start()
+        reader.join()
+        stop.set()
+        writer.join()
+
+        assert errors == []
+
     def test_get_all_stats_returns_deep_copy(self):
         """Test that get_all_stats returns deep copy to prevent external mutation."""
         monitor = PerformanceMonitor()